@@ -6,6 +6,7 @@ import threading
 import time
 from typing import Callable, Protocol
 
+from ..latency import LatencyHistogram
 from ..nrf905_profile import Nrf905Profile
 
 
@@ -28,6 +29,10 @@ class SpiPort(Protocol):
 
 
 class DigitalLines(Protocol):
+    """GPIO lines; backends with ``edge_events`` also provide ``last_edge_ns(name) -> int | None``."""
+
+    edge_events: bool
+
     def set(self, name: str, active: bool) -> None: ...
 
     def get(self, name: str) -> bool: ...
@@ -84,9 +89,15 @@ class Nrf905Device:
         self.monotonic = monotonic
         self._lock = threading.RLock()
         self._started = False
+        self._edge_floor_ns = 0
+        self._armed: bytes | None = None
+        # Written only under self._lock; read without it by metrics scrapes.
+        self.spi_exchanges = LatencyHistogram()
+        self.transmit_elapsed = LatencyHistogram()
 
     def start(self) -> dict[str, object]:
         with self._lock:
+            self._armed = None
             self._standby(powered=False)
             expected = configuration_bytes(self.profile)
             self._exchange(bytes([_W_CONFIG]) + expected)
@@ -121,10 +132,24 @@ class Nrf905Device:
         return self.lines.wait("data_ready", timeout_s)
 
     def receive(self) -> bytes | None:
+        received = self.receive_stamped()
+        return None if received is None else received[0]
+
+    def receive_stamped(self) -> tuple[bytes, int | None] | None:
+        """Read one frame plus the kernel timestamp of the data_ready edge that announced it.
+
+        The timestamp is ``None`` when the backend saw no edge newer than the
+        previous frame or transmit completion.
+        """
         with self._lock:
             self._require_started()
             if not self.lines.get("data_ready"):
                 return None
+            edge_ns = self._data_ready_edge_ns()
+            if edge_ns is None or edge_ns <= self._edge_floor_ns:
+                edge_ns = None
+            else:
+                self._edge_floor_ns = edge_ns
             self.lines.set("trx_ce", False)
             frame = self._exchange(bytes([_R_RX_FIFO]) + bytes(_FRAME_OCTETS))[1:]
             if len(frame) != _FRAME_OCTETS:
@@ -132,9 +157,55 @@ class Nrf905Device:
                     "NRF905_RECEIVE_LENGTH", f"Expected {_FRAME_OCTETS} received bytes, got {len(frame)}."
                 )
             self._receive_mode()
-            return frame
+            return frame, edge_ns
 
     def transmit(self, frame: bytes, timeout_s: float = 0.050) -> dict[str, object]:
+        self._check_transmit(frame)
+        with self._lock:
+            self._require_started()
+            self.lines.set("trx_ce", False)
+            self.lines.set("tx_en", True)
+            self._load_transmit(frame)
+            # Writing the TX payload replaces whatever frame was armed.
+            self._armed = None
+            return self._pulse_transmit(frame, timeout_s)
+
+    @property
+    def armed_frame(self) -> bytes | None:
+        return self._armed
+
+    def arm(self, frame: bytes) -> dict[str, object]:
+        """Load a frame into the TX payload register and return to receive mode.
+
+        The register keeps the frame while the radio receives, so a later
+        ``fire`` only has to switch to TX and pulse TRX_CE.
+        """
+        self._check_transmit(frame)
+        with self._lock:
+            self._require_started()
+            self.lines.set("trx_ce", False)
+            self._load_transmit(frame)
+            self._armed = frame
+            self._receive_mode()
+            return {"frame_hex": frame.hex()}
+
+    def fire(self, timeout_s: float = 0.050) -> dict[str, object]:
+        """Transmit the armed frame once; the frame must be armed again to resend."""
+        with self._lock:
+            self._require_started()
+            frame = self._armed
+            if frame is None:
+                raise Nrf905Error("NRF905_NOT_ARMED", "Arm a frame before firing the nRF905.")
+            self._armed = None
+            self.lines.set("trx_ce", False)
+            self.lines.set("tx_en", True)
+            return self._pulse_transmit(frame, timeout_s)
+
+    def disarm(self) -> None:
+        with self._lock:
+            self._armed = None
+
+    def _check_transmit(self, frame: bytes) -> None:
         if len(frame) != _FRAME_OCTETS:
             raise Nrf905Error(
                 "NRF905_TRANSMIT_LENGTH", f"nRF905 validation requires exactly {_FRAME_OCTETS} bytes."
@@ -144,32 +215,75 @@ class Nrf905Device:
                 "NRF905_TRANSMIT_DISABLED",
                 "This profile is receive-only. Set radio.transmit_enabled only after reviewing the bench frequency.",
             )
-        with self._lock:
-            self._require_started()
-            self.lines.set("trx_ce", False)
-            self.lines.set("tx_en", True)
-            self._exchange(bytes([_W_TX_ADDRESS]) + self.profile.radio.address)
-            self._exchange(bytes([_W_TX_FIFO]) + frame)
-            started = self.monotonic()
-            self.lines.set("trx_ce", True)
-            self.sleep(0.000010)
-            self.lines.set("trx_ce", False)
-            while not self.lines.get("data_ready"):
-                if self.monotonic() - started >= timeout_s:
-                    self.lines.set("tx_en", False)
-                    self._receive_mode()
-                    raise Nrf905Error(
-                        "NRF905_TRANSMIT_TIMEOUT",
-                        f"The nRF905 did not report transmit completion within {timeout_s * 1000:.0f} ms.",
-                    )
+
+    def _load_transmit(self, frame: bytes) -> None:
+        self._exchange(bytes([_W_TX_ADDRESS]) + self.profile.radio.address)
+        self._exchange(bytes([_W_TX_FIFO]) + frame)
+
+    def _pulse_transmit(self, frame: bytes, timeout_s: float) -> dict[str, object]:
+        """Pulse TRX_CE with TX_EN already high and wait for completion.
+
+        ``pulsed_ns`` is the ``monotonic_ns`` time of the rising CE edge that
+        starts the transmission.
+        """
+        started = self.monotonic()
+        pulsed_ns = time.monotonic_ns()
+        self.lines.set("trx_ce", True)
+        self.sleep(0.000010)
+        self.lines.set("trx_ce", False)
+        completed_ns = self._wait_transmit_complete(started, timeout_s)
+        elapsed_ms = (self.monotonic() - started) * 1000.0
+        edge_ns = self._data_ready_edge_ns()
+        source = "polling"
+        if edge_ns is not None and edge_ns > pulsed_ns:
+            completed_ns = edge_ns
+            source = "data_ready_edge"
+        completion_ns = completed_ns - pulsed_ns
+        self.transmit_elapsed.record(completion_ns)
+        # The transmit-complete edge must never be mistaken for a received frame's.
+        self._edge_floor_ns = max(self._edge_floor_ns, edge_ns or 0)
+        self.lines.set("tx_en", False)
+        self._receive_mode()
+        return {
+            "elapsed_ms": round(elapsed_ms, 3),
+            "completion_us": round(completion_ns / 1000, 1),
+            "completion_source": source,
+            "pulsed_ns": pulsed_ns,
+            "completed_ns": completed_ns,
+            "frame_hex": frame.hex(),
+        }
+
+    def _data_ready_edge_ns(self) -> int | None:
+        """Return the kernel time of the newest data_ready edge, or ``None`` without edge events."""
+        if not self.lines.edge_events:
+            return None
+        return getattr(self.lines, "last_edge_ns")("data_ready")
+
+    def _wait_transmit_complete(self, started: float, timeout_s: float) -> int:
+        """Return the ``monotonic_ns`` time data_ready was seen high after a CE pulse.
+
+        Edge-capable backends block on the data_ready event in short slices, so
+        an edge consumed by the receive thread's waiter costs one slice at
+        most. Other backends poll every 100 µs.
+        """
+        while not self.lines.get("data_ready"):
+            remaining = timeout_s - (self.monotonic() - started)
+            if remaining <= 0:
+                self.lines.set("tx_en", False)
+                self._receive_mode()
+                raise Nrf905Error(
+                    "NRF905_TRANSMIT_TIMEOUT",
+                    f"The nRF905 did not report transmit completion within {timeout_s * 1000:.0f} ms.",
+                )
+            if self.lines.edge_events:
+                self.lines.wait("data_ready", min(remaining, 0.005))
+            else:
                 self.sleep(0.000100)
-            elapsed_ms = (self.monotonic() - started) * 1000.0
-            self.lines.set("tx_en", False)
-            self._receive_mode()
-            return {"elapsed_ms": round(elapsed_ms, 3), "frame_hex": frame.hex()}
+        return time.monotonic_ns()
 
     def close(self) -> None:
         with self._lock:
+            self._armed = None
             try:
                 self._standby(powered=False)
             finally:
@@ -188,7 +302,9 @@ class Nrf905Device:
         self.lines.set("trx_ce", True)
 
     def _exchange(self, outgoing: bytes) -> bytes:
+        started_ns = time.monotonic_ns()
         incoming = self.spi.exchange(outgoing)
+        self.spi_exchanges.record(time.monotonic_ns() - started_ns)
         if len(incoming) != len(outgoing):
             raise Nrf905Error(
                 "NRF905_SPI_LENGTH",
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from datetime import timedelta
 from pathlib import Path
+import threading
 from typing import Any
 
 from .nrf905 import Nrf905Error
@@ -45,6 +46,7 @@ class LinuxSpiPort:
 
 
 class LinuxDigitalLines:
+    edge_events = True
     _outputs = ("pwr_up", "trx_ce", "tx_en")
     _inputs = ("carrier_detect", "address_match", "data_ready")
 
@@ -57,13 +59,15 @@ class LinuxDigitalLines:
             )
         try:
             import gpiod
-            from gpiod.line import Bias, Direction, Edge, Value
+            from gpiod.line import Bias, Clock, Direction, Edge, Value
         except ImportError as exc:
             raise Nrf905Error(
                 "NRF905_GPIO_DEPENDENCY",
                 "The official gpiod Python package is missing. Run ./scripts/setup-rpi.",
             ) from exc
         self._value = Value
+        self._edge_lock = threading.Lock()
+        self._edge_ns: int | None = None
         self._offsets = profile.gpio.named_lines()
         output_offsets = tuple(self._offsets[name] for name in self._outputs)
         sampled_input_offsets = tuple(
@@ -87,6 +91,7 @@ class LinuxDigitalLines:
                         direction=Direction.INPUT,
                         bias=Bias.DISABLED,
                         edge_detection=Edge.RISING,
+                        event_clock=Clock.MONOTONIC,
                     ),
                 },
             )
@@ -113,11 +118,27 @@ class LinuxDigitalLines:
             )
         if self.get(name):
             return True
-        ready = self._request.wait_edge_events(timeout=timedelta(seconds=max(0.0, timeout_s)))
-        if ready:
-            self._request.read_edge_events()
+        if self._request.wait_edge_events(timeout=timedelta(seconds=max(0.0, timeout_s))):
+            self._read_edges()
         return self.get(name)
 
+    def last_edge_ns(self, name: str) -> int | None:
+        """Return the CLOCK_MONOTONIC time of the newest data_ready rising edge."""
+        if name != "data_ready":
+            raise Nrf905Error(
+                "NRF905_GPIO_WAIT",
+                "Only the nRF905 data_ready signal records edge events.",
+            )
+        self._read_edges()
+        return self._edge_ns
+
+    def _read_edges(self) -> None:
+        # Recheck under the lock so a concurrent reader never blocks in read_edge_events.
+        with self._edge_lock:
+            if self._request.wait_edge_events(timeout=timedelta(0)):
+                for event in self._request.read_edge_events():
+                    self._edge_ns = event.timestamp_ns
+
     def close(self) -> None:
         self._request.release()
 
@@ -0,0 +1,248 @@
+"""Command-line micro-benchmarks for the workbench's hot paths; no hardware needed."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import replace
+import json
+import resource
+import threading
+import time
+from typing import Any
+from uuid import uuid4
+
+from .model import WorkbenchModel
+from .service import WorkbenchService
+
+
+def _print(value: dict[str, Any]) -> None:
+    print(json.dumps(value, indent=2, sort_keys=True))
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 2)
+
+    return {"p50_us": at(0.50), "p95_us": at(0.95), "p99_us": at(0.99), "max_us": round(ordered[-1], 2)}
+
+
+def _observation(index: int) -> dict[str, Any]:
+    return {
+        "id": uuid4().hex[:12],
+        "observed_at": "2026-10-18T00:00:00+00:00",
+        "origin": "benchmark",
+        "title": f"Benchmark frame {index}",
+        "summary": "Synthetic received frame",
+        "received_frame_hex": "00" * 32,
+        "family": {"key": "benchmark", "label": "Benchmark"},
+        "capture": {"transport": "nrf905", "direction": "received", "sequence": index},
+        "inspection_error": None,
+    }
+
+
+def notify_latency(subscriber_counts: list[int], frames: int) -> dict[str, Any]:
+    """Time ``WorkbenchModel.publish`` while browsers-like subscribers are attached.
+
+    Each subscriber does what an event stream does: schedule a wakeup on an
+    asyncio loop running in another thread.
+    """
+    loop = asyncio.new_event_loop()
+    runner = threading.Thread(target=loop.run_forever, name="BenchmarkLoop", daemon=True)
+    runner.start()
+    results = []
+    try:
+        for count in subscriber_counts:
+            model = WorkbenchModel()
+            wakeups = [asyncio.Event() for _ in range(count)]
+            unsubscribers = [
+                model.subscribe(lambda _, event=event: loop.call_soon_threadsafe(event.set))
+                for event in wakeups
+            ]
+            samples = []
+            for index in range(frames):
+                entry = _observation(index)
+                started = time.perf_counter()
+                model.publish(entry)
+                samples.append((time.perf_counter() - started) * 1_000_000)
+            for unsubscribe in unsubscribers:
+                unsubscribe()
+            results.append({"subscribers": count, "frames": frames, **_percentiles(samples)})
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        runner.join(timeout=5.0)
+        loop.close()
+    baseline = results[0]["p50_us"] or 1.0
+    return {
+        "benchmark": "model publish with revision subscribers",
+        "results": results,
+        "p50_growth": round(results[-1]["p50_us"] / baseline, 2),
+    }
+
+
+def read_contention(reader_counts: list[int], frames: int, retention: int) -> dict[str, Any]:
+    """Time ``WorkbenchModel.publish`` while reader threads poll the model continuously.
+
+    Each reader does what a browser refresh does: fetch the snapshot, the
+    journal, and the changes since the revision it last saw.
+    """
+    results = []
+    for count in reader_counts:
+        model = WorkbenchModel(retention=retention)
+        for index in range(retention):
+            model.publish(_observation(index))
+        stop = threading.Event()
+        reads = [0] * count
+
+        def read(slot: int) -> None:
+            revision = model.revision
+            while not stop.is_set():
+                snapshot = model.snapshot()
+                model.journal()
+                model.changes_since(revision)
+                revision = snapshot["revision"]
+                reads[slot] += 1
+
+        threads = [
+            threading.Thread(target=read, args=(slot,), name=f"BenchmarkReader{slot}", daemon=True)
+            for slot in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        samples = []
+        started_at = time.perf_counter()
+        for index in range(frames):
+            entry = _observation(retention + index)
+            started = time.perf_counter()
+            model.publish(entry)
+            samples.append((time.perf_counter() - started) * 1_000_000)
+        elapsed = time.perf_counter() - started_at
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=5.0)
+        results.append({
+            "readers": count,
+            "frames": frames,
+            "reads_per_second": round(sum(reads) / elapsed) if elapsed else 0,
+            **_percentiles(samples),
+        })
+    baseline = results[0]["p50_us"] or 1.0
+    return {
+        "benchmark": "model publish with concurrent snapshot readers",
+        "retention": retention,
+        "results": results,
+        "p50_growth": round(results[-1]["p50_us"] / baseline, 2),
+    }
+
+
+def unthrottled_replay(identifier: str, loops: int, subscribers: int) -> dict[str, Any]:
+    """Push a recording through ``WorkbenchService._consume`` back to back, ``loops`` times.
+
+    Each loop renumbers the frames so sequences keep increasing. Subscribers
+    wake an asyncio loop in another thread, as event streams do. Needs the
+    sibling Protocol Contract to decode.
+    """
+    service = WorkbenchService()
+    recording = service.recordings.get(identifier)
+    count = len(recording.frames)
+    loop = asyncio.new_event_loop()
+    runner = threading.Thread(target=loop.run_forever, name="BenchmarkLoop", daemon=True)
+    runner.start()
+    wakeups = [asyncio.Event() for _ in range(subscribers)]
+    unsubscribers = [
+        service.model.subscribe(lambda _, event=event: loop.call_soon_threadsafe(event.set))
+        for event in wakeups
+    ]
+    peak_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        started = time.perf_counter()
+        for index in range(loops):
+            frames = tuple(replace(item, sequence=index * count + item.sequence) for item in recording.frames)
+            service.replay_carrier.load(recording.identifier, recording.title, recording.duration_ms, frames)
+            for item in service.replay_carrier.release_all():
+                service._consume(item)
+        elapsed = time.perf_counter() - started
+    finally:
+        for unsubscribe in unsubscribers:
+            unsubscribe()
+        loop.call_soon_threadsafe(loop.stop)
+        runner.join(timeout=5.0)
+        loop.close()
+        service.close()
+    peak_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    frames_released = loops * count
+    return {
+        "benchmark": "unthrottled recording replay through the workbench service",
+        "recording": identifier,
+        "loops": loops,
+        "frames": frames_released,
+        "subscribers": subscribers,
+        "elapsed_s": round(elapsed, 3),
+        "frames_per_second": round(frames_released / elapsed) if elapsed else 0,
+        "stages": {stage: histogram.summary() for stage, histogram in service.replay_latency.items()},
+        "decode_cache": service.wire.status()["decode_cache"],
+        # ru_maxrss is in KiB on Linux.
+        "peak_rss_mib": round(peak_after / 1024, 1),
+        "peak_rss_growth_mib": round((peak_after - peak_before) / 1024, 1),
+    }
+
+
+def run(arguments: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure Packet Predator's in-process hot paths without a radio or browser."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    notify = subparsers.add_parser(
+        "notify", help="Publish latency as the number of model subscribers grows"
+    )
+    notify.add_argument(
+        "--subscribers",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100],
+        help="Subscriber counts to compare (default: 1 10 100)",
+    )
+    notify.add_argument("--frames", type=int, default=5000, help="Frames published per run (default: 5000)")
+    contention = subparsers.add_parser(
+        "contention", help="Publish latency while reader threads poll snapshots and journals"
+    )
+    contention.add_argument(
+        "--readers",
+        type=int,
+        nargs="+",
+        default=[0, 4],
+        help="Reader thread counts to compare (default: 0 4)",
+    )
+    contention.add_argument("--frames", type=int, default=5000, help="Frames published per run (default: 5000)")
+    contention.add_argument(
+        "--retention", type=int, default=1000, help="Decoded observations retained (default: 1000)"
+    )
+    unthrottled = subparsers.add_parser(
+        "replay", help="Release a recording as fast as possible through the full service path"
+    )
+    unthrottled.add_argument(
+        "--recording", default="task-session-success", help="Recording to replay (default: task-session-success)"
+    )
+    unthrottled.add_argument("--loops", type=int, default=1000, help="Times to replay the recording (default: 1000)")
+    unthrottled.add_argument(
+        "--subscribers", type=int, default=0, help="Model subscribers attached during the run (default: 0)"
+    )
+    options = parser.parse_args(arguments)
+
+    if options.command == "notify":
+        _print(notify_latency(options.subscribers, options.frames))
+    elif options.command == "contention":
+        _print(read_contention(options.readers, options.frames, options.retention))
+    elif options.command == "replay":
+        _print(unthrottled_replay(options.recording, options.loops, options.subscribers))
+    return 0
+
+
+def main() -> int:
+    return run()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,166 @@
+"""One asyncio fan-out of encoded model events for every browser event stream."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import json
+from typing import Any, Callable
+
+from .service import WorkbenchService
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """One SSE event shared by every stream; ``body`` is ``None`` for a resync."""
+
+    revision: int
+    data: bytes
+    body: str | None
+
+
+def model_event(revision: int, body: str) -> StreamEvent:
+    return StreamEvent(
+        revision,
+        f"id: {revision}\nevent: model\ndata: {body}\n\n".encode("utf-8"),
+        body,
+    )
+
+
+def resync_event(revision: int) -> StreamEvent:
+    body = json.dumps({"revision": revision}, separators=(",", ":"))
+    return StreamEvent(
+        revision,
+        f"id: {revision}\nevent: resync\ndata: {body}\n\n".encode("utf-8"),
+        None,
+    )
+
+
+def coalesce(events: list[StreamEvent]) -> list[bytes]:
+    """Merge consecutive model events into one ``batch`` event with a revision range.
+
+    A resync discards the model events queued before it, because the client
+    will refetch the snapshot anyway.
+    """
+    for index in range(len(events) - 1, -1, -1):
+        if events[index].body is None:
+            return [events[index].data, *coalesce(events[index + 1:])]
+    if len(events) < 2:
+        return [event.data for event in events]
+    first, last = events[0].revision, events[-1].revision
+    changes = ",".join(event.body or "" for event in events)
+    body = f'{{"first_revision":{first},"revision":{last},"changes":[{changes}]}}'
+    return [f"id: {last}\nevent: batch\ndata: {body}\n\n".encode("utf-8")]
+
+
+class EventClient:
+    """One stream's bounded queue of shared events."""
+
+    def __init__(self, revision: int, queue_size: int) -> None:
+        self.revision = revision
+        self.queue: asyncio.Queue[StreamEvent] = asyncio.Queue(maxsize=queue_size)
+        self.resync_count = 0
+
+    def offer(self, event: StreamEvent) -> None:
+        if event.revision <= self.revision:
+            return
+        self.revision = event.revision
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.resync(event.revision)
+
+    def resync(self, revision: int) -> None:
+        """Replace everything still queued with one instruction to refetch the snapshot."""
+        self.drain()
+        self.revision = revision
+        self.resync_count += 1
+        self.queue.put_nowait(resync_event(revision))
+
+    def drain(self) -> list[StreamEvent]:
+        events = []
+        while not self.queue.empty():
+            events.append(self.queue.get_nowait())
+        return events
+
+
+class ModelBroadcaster:
+    """Pull each model change once, encode it once, and fan it out to every client.
+
+    The broadcaster holds a single model subscription while any client is
+    attached. A client whose queue is full is sent ``resync`` instead of
+    holding back the others.
+    """
+
+    def __init__(self, service: WorkbenchService, queue_size: int = 64) -> None:
+        self.service = service
+        self._queue_size = queue_size
+        self._clients: set[EventClient] = set()
+        self._changed = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._unsubscribe: Callable[[], None] | None = None
+        self._revision = 0
+        self.lagged_count = 0
+
+    def attach(self, after: int) -> EventClient:
+        """Add a client and queue every change it missed since ``after``."""
+        if self._task is None:
+            self._start()
+        client = EventClient(after, self._queue_size)
+        result = self.service.model_events(after)
+        if result["resync"]:
+            client.resync(result["revision"])
+        else:
+            for revision, body in result["changes"]:
+                client.offer(model_event(revision, body))
+        self._clients.add(client)
+        return client
+
+    def detach(self, client: EventClient) -> None:
+        self._clients.discard(client)
+        if not self._clients:
+            self.close()
+
+    def close(self) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "clients": len(self._clients),
+            "queue_depths": sorted(client.queue.qsize() for client in self._clients),
+            "queue_capacity": self._queue_size,
+            "slow_client_resyncs": self.lagged_count,
+            "revision": self._revision,
+        }
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._changed.clear()
+        self._unsubscribe = self.service.subscribe_to_model(
+            lambda _: loop.call_soon_threadsafe(self._changed.set)
+        )
+        self._revision = self.service.model_revision()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._changed.wait()
+            self._changed.clear()
+            result = self.service.model_events(self._revision)
+            if result["resync"]:
+                self._revision = result["revision"]
+                for client in tuple(self._clients):
+                    client.resync(self._revision)
+                continue
+            for revision, body in result["changes"]:
+                self._revision = revision
+                event = model_event(revision, body)
+                for client in tuple(self._clients):
+                    before = client.resync_count
+                    client.offer(event)
+                    self.lagged_count += client.resync_count - before
@@ -0,0 +1,436 @@
+"""Compact columnar retention for long captures, decoded again only on demand."""
+
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timezone
+import time
+from typing import Any, Callable, Mapping, TypeVar
+
+
+_T = TypeVar("_T")
+
+
+_SLOT_OCTETS = 32
+_ID_OCTETS = 6
+_UNKNOWN = 0
+_DIRECTIONS = (None, "received", "sent")
+_MODES = ("logical", "fixed")
+_HAS_ROUTE = 0x10
+_INVALID = 0x20
+
+
+class _Interned:
+    """Bounded table of values still used by retained records.
+
+    Each index counts the records holding it and is reused once the last of
+    them is overwritten, so only values that are live at once compete for
+    the limit. Values past the limit share index zero.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._values: list[Any] = [None]
+        self._uses = [0]
+        self._indexes: dict[Any, int] = {}
+        self._free: list[int] = []
+        self._limit = limit
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def index(self, value: Any) -> int:
+        if value is None:
+            return _UNKNOWN
+        known = self._indexes.get(value)
+        if known is None:
+            if self._free:
+                known = self._free.pop()
+                self._values[known] = value
+            elif len(self._values) > self._limit:
+                return _UNKNOWN
+            else:
+                known = len(self._values)
+                self._values.append(value)
+                self._uses.append(0)
+            self._indexes[value] = known
+        self._uses[known] += 1
+        return known
+
+    def release(self, index: int) -> None:
+        if index == _UNKNOWN:
+            return
+        self._uses[index] -= 1
+        if not self._uses[index]:
+            del self._indexes[self._values[index]]
+            self._free.append(index)
+
+    def value(self, index: int) -> Any:
+        return self._values[index]
+
+
+class CaptureStore:
+    """Retain observations as fixed-size records sized from a memory budget.
+
+    Frames live in a ``bytearray`` ring of 32-byte slots and the values a
+    journal filters on live in parallel ``array`` columns. Observation ids
+    are found through an open-addressed ``array`` of slots keyed by the
+    packed id, so a lookup costs a few probes at any retention. Full
+    inspection output is rebuilt through ``decoder`` when a record is read.
+    Callers serialize appends; ``WorkbenchModel`` does so under its own lock.
+    Reads take no lock: a write counter, odd while an append is rewriting a
+    slot, tells a reader that overlapped a write to read again.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int,
+        decoder: Callable[[bytes, str], dict[str, Any]] | None = None,
+        companion_bytes: int = 0,
+    ) -> None:
+        # ``companion_bytes`` is what the caller keeps per record beside the
+        # store, such as journal indexes; it is charged to the same budget.
+        charged = self.record_bytes() + companion_bytes
+        capacity = budget_bytes // charged
+        if capacity < 1:
+            raise ValueError(f"A capture store budget must hold at least one {charged}-byte record.")
+        self.capacity = capacity
+        self.budget_bytes = budget_bytes
+        self.companion_bytes = companion_bytes
+        self._decoder = decoder
+        self._frames = bytearray(capacity * _SLOT_OCTETS)
+        self._ids = bytearray(capacity * _ID_OCTETS)
+        self._lengths = array("B", bytes(capacity))
+        self._timestamps = array("q", bytes(capacity * 8))
+        self._flags = array("B", bytes(capacity))
+        self._types = array("B", bytes(capacity))
+        self._sources = array("B", bytes(capacity))
+        self._destinations = array("B", bytes(capacity))
+        self._families = array("B", bytes(capacity))
+        self._transports = array("B", bytes(capacity))
+        self._origins = array("H", bytes(capacity * 2))
+        self._errors = array("H", bytes(capacity * 2))
+        # Slot + 1 per occupied entry, 0 when empty; at most two thirds full.
+        self._id_table = array("I", bytes(4 * self._id_table_size(capacity)))
+        self._family_values = _Interned(254)
+        self._transport_values = _Interned(254)
+        self._origin_values = _Interned(4095)
+        self._error_values = _Interned(4095)
+        self._named: dict[int, str] = {}
+        self._named_sequences: dict[str, int] = {}
+        self._first = 0
+        self._count = 0
+        self._writes = 0
+        self._skipped = 0
+        self._wall_anchor_ns = time.time_ns()
+        self._monotonic_anchor_ns = time.monotonic_ns()
+
+    @staticmethod
+    def record_bytes() -> int:
+        """Return the fixed number of bytes retained per observation."""
+        return (
+            _SLOT_OCTETS
+            + _ID_OCTETS
+            + sum(array(code).itemsize for code in ("B", "q", "B", "B", "B", "B", "B", "B", "H", "H"))
+            + 3 * array("I").itemsize // 2
+        )
+
+    @staticmethod
+    def _id_table_size(capacity: int) -> int:
+        return capacity + capacity // 2 + 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def first_sequence(self) -> int:
+        return self._first
+
+    @property
+    def next_sequence(self) -> int:
+        return self._first + self._count
+
+    def span(self) -> tuple[int, int]:
+        """Return the first retained and the next journal sequence as one consistent pair."""
+        return self._read(lambda: (self._first, self._first + self._count))
+
+    def append(self, entry: Mapping[str, Any], timestamp_ns: int) -> None:
+        """Record one published observation; its journal sequence must be the next one."""
+        sequence = entry["journal_sequence"]
+        if self._count and sequence != self.next_sequence:
+            raise ValueError(
+                f"Capture store expected journal sequence {self.next_sequence}, got {sequence}."
+            )
+        self._writes += 1
+        try:
+            self._write(entry, sequence, timestamp_ns)
+        finally:
+            self._writes += 1
+
+    def _write(self, entry: Mapping[str, Any], sequence: int, timestamp_ns: int) -> None:
+        if self._count == 0:
+            self._first = sequence
+        if self._count == self.capacity:
+            self._forget(self._first)
+            self._first += 1
+        else:
+            self._count += 1
+
+        slot = sequence % self.capacity
+        frame = bytes.fromhex(entry.get("received_frame_hex") or "")
+        if len(frame) > _SLOT_OCTETS:
+            # The adapter never produces longer frames; keep the record, not the bytes.
+            self._skipped += 1
+            frame = b""
+        start = slot * _SLOT_OCTETS
+        self._frames[start:start + len(frame)] = frame
+        self._lengths[slot] = len(frame)
+        self._timestamps[slot] = timestamp_ns
+
+        identifier = entry["id"]
+        id_start = slot * _ID_OCTETS
+        try:
+            packed = bytes.fromhex(identifier) if len(identifier) == 2 * _ID_OCTETS else None
+        except ValueError:
+            packed = None
+        if packed is None or packed.hex() != identifier:
+            self._ids[id_start:id_start + _ID_OCTETS] = bytes(_ID_OCTETS)
+            self._named[sequence] = identifier
+            self._named_sequences[identifier] = sequence
+        else:
+            self._ids[id_start:id_start + _ID_OCTETS] = packed
+            self._index_id(slot)
+
+        capture = entry.get("capture") or {}
+        direction = capture.get("direction")
+        flags = _DIRECTIONS.index(direction) if direction in _DIRECTIONS else _UNKNOWN
+        if capture.get("transport") == "nrf905" or entry.get("padding_bytes"):
+            flags |= _MODES.index("fixed") << 2
+        envelope = entry.get("envelope")
+        route = entry.get("route")
+        if envelope is not None and route is not None:
+            flags |= _HAS_ROUTE
+            self._types[slot] = envelope["message_type"]
+            self._sources[slot] = route["source"]
+            self._destinations[slot] = route["destination"]
+        error = entry.get("inspection_error")
+        if error:
+            flags |= _INVALID
+        self._flags[slot] = flags
+        family = entry.get("family") or {}
+        self._families[slot] = self._family_values.index(
+            (family.get("key"), family.get("label")) if family else None
+        )
+        self._transports[slot] = self._transport_values.index(capture.get("transport"))
+        self._origins[slot] = self._origin_values.index(entry.get("origin"))
+        self._errors[slot] = self._error_values.index(
+            (entry.get("title"), error.get("code"), error.get("message")) if error else None
+        )
+
+    def sequence_of(self, identifier: str) -> int | None:
+        """Find a retained record by observation id through the packed-id table."""
+        return self._read(lambda: self._find(identifier))
+
+    def _find(self, identifier: str) -> int | None:
+        named = self._named_sequences.get(identifier)
+        if named is not None:
+            return named
+        if len(identifier) != 2 * _ID_OCTETS:
+            return None
+        try:
+            packed = bytes.fromhex(identifier)
+        except ValueError:
+            return None
+        position = self._id_position(packed)
+        held = self._id_table[position]
+        return None if held == 0 else self._sequence_at_slot(held - 1)
+
+    def attributes(self, sequence: int) -> tuple[Any, ...] | None:
+        """Return the filterable values of a retained record without copying its frame.
+
+        The tuple is (family key, message type, source, destination, direction,
+        transport, invalid), matching ``WorkbenchModel`` journal filters, or
+        ``None`` once the record has been evicted.
+        """
+        return self._read(lambda: self._attributes(sequence))
+
+    def _attributes(self, sequence: int) -> tuple[Any, ...] | None:
+        if not self._first <= sequence < self.next_sequence:
+            return None
+        slot = sequence % self.capacity
+        flags = self._flags[slot]
+        routed = bool(flags & _HAS_ROUTE)
+        family = self._family_values.value(self._families[slot])
+        return (
+            None if family is None else family[0],
+            self._types[slot] if routed else None,
+            self._sources[slot] if routed else None,
+            self._destinations[slot] if routed else None,
+            _DIRECTIONS[flags & 0x03],
+            self._transport_values.value(self._transports[slot]),
+            bool(flags & _INVALID),
+        )
+
+    def observation(self, sequence: int) -> dict[str, Any] | None:
+        """Rebuild the full observation for a retained journal sequence."""
+        record = self.record(sequence)
+        return None if record is None else self.expand(record)
+
+    def record(self, sequence: int) -> dict[str, Any] | None:
+        """Copy one record's columns so it can be expanded outside the caller's lock."""
+        return self._read(lambda: self._record(sequence))
+
+    def _record(self, sequence: int) -> dict[str, Any] | None:
+        if not self._first <= sequence < self.next_sequence:
+            return None
+        slot = sequence % self.capacity
+        start = slot * _SLOT_OCTETS
+        flags = self._flags[slot]
+        routed = bool(flags & _HAS_ROUTE)
+        return {
+            "id": self._identifier_at(slot, sequence),
+            "journal_sequence": sequence,
+            "timestamp_ns": self._timestamps[slot],
+            "frame": bytes(self._frames[start:start + self._lengths[slot]]),
+            "direction": _DIRECTIONS[flags & 0x03],
+            "mode": _MODES[(flags >> 2) & 0x03],
+            "message_type": self._types[slot] if routed else None,
+            "source": self._sources[slot] if routed else None,
+            "destination": self._destinations[slot] if routed else None,
+            "transport": self._transport_values.value(self._transports[slot]),
+            "origin": self._origin_values.value(self._origins[slot]),
+            "family": self._family_values.value(self._families[slot]),
+            "error": self._error_values.value(self._errors[slot]),
+        }
+
+    def expand(self, record: Mapping[str, Any]) -> dict[str, Any]:
+        """Turn a copied record into an observation, decoding the frame when possible."""
+        frame = record["frame"]
+        capture = None
+        if record["transport"] is not None or record["direction"] is not None:
+            capture = {
+                "transport": record["transport"],
+                "direction": record["direction"],
+                "captured_ns": record["timestamp_ns"],
+            }
+        entry: dict[str, Any] = {
+            "id": record["id"],
+            "journal_sequence": record["journal_sequence"],
+            "observed_at": self._observed_at(record["timestamp_ns"]),
+            "origin": record["origin"] or "retained capture",
+            "capture": capture,
+            "retained_as": "compact",
+        }
+        error = record["error"]
+        if error is None and self._decoder is not None and frame:
+            try:
+                entry.update(self._decoder(frame, record["mode"]))
+                return entry
+            except Exception as exc:
+                # The frame decoded when it was published; report a changed authority plainly.
+                error = ("Invalid frame", getattr(exc, "code", "DECODE_FAILED"), str(exc))
+        title, code, message = error or ("Retained frame", None, None)
+        family = record["family"] or ("invalid", "Invalid frame")
+        entry.update({
+            "title": title or "Invalid frame",
+            "summary": message or "Frame bytes retained without a decoder.",
+            "received_frame_hex": frame.hex(),
+            "received_bytes": len(frame),
+            "family": {"key": family[0], "label": family[1]},
+            "inspection_error": {"code": code, "message": message} if code else None,
+        })
+        return entry
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "budget_bytes": self.budget_bytes,
+            "record_bytes": self.record_bytes(),
+            "companion_bytes": self.companion_bytes,
+            "capacity": self.capacity,
+            "retained": self._count,
+            "first_sequence": self._first if self._count else None,
+            "oversize_frames": self._skipped,
+            "interned_values": {
+                "family": len(self._family_values),
+                "transport": len(self._transport_values),
+                "origin": len(self._origin_values),
+                "error": len(self._error_values),
+            },
+        }
+
+    def _read(self, read: Callable[[], _T]) -> _T:
+        while True:
+            writes = self._writes
+            if not writes & 1:
+                result = read()
+                if self._writes == writes:
+                    return result
+            # Let the writer finish its slot before reading again.
+            time.sleep(0)
+
+    def _sequence_at_slot(self, slot: int) -> int | None:
+        if self._count == 0:
+            return None
+        offset = (slot - self._first) % self.capacity
+        return self._first + offset if offset < self._count else None
+
+    def _identifier_at(self, slot: int, sequence: int) -> str:
+        named = self._named.get(sequence)
+        if named is not None:
+            return named
+        start = slot * _ID_OCTETS
+        return bytes(self._ids[start:start + _ID_OCTETS]).hex()
+
+    def _forget(self, sequence: int) -> None:
+        slot = sequence % self.capacity
+        self._family_values.release(self._families[slot])
+        self._transport_values.release(self._transports[slot])
+        self._origin_values.release(self._origins[slot])
+        self._error_values.release(self._errors[slot])
+        named = self._named.pop(sequence, None)
+        if named is None:
+            self._unindex_id(sequence % self.capacity)
+        elif self._named_sequences.get(named) == sequence:
+            del self._named_sequences[named]
+
+    def _packed_id(self, slot: int) -> bytes:
+        start = slot * _ID_OCTETS
+        return bytes(self._ids[start:start + _ID_OCTETS])
+
+    def _id_home(self, packed: bytes) -> int:
+        return int.from_bytes(packed, "little") % len(self._id_table)
+
+    def _id_position(self, packed: bytes) -> int:
+        """Return the table position holding ``packed``, or the empty one where probing stopped."""
+        table = self._id_table
+        position = self._id_home(packed)
+        while table[position] and self._packed_id(table[position] - 1) != packed:
+            position = (position + 1) % len(table)
+        return position
+
+    def _index_id(self, slot: int) -> None:
+        # A repeated id takes over the entry, so lookups find the newest record.
+        self._id_table[self._id_position(self._packed_id(slot))] = slot + 1
+
+    def _unindex_id(self, slot: int) -> None:
+        """Drop ``slot`` before its id bytes are overwritten, shifting later probes back."""
+        table = self._id_table
+        hole = self._id_position(self._packed_id(slot))
+        if table[hole] != slot + 1:
+            return
+        table[hole] = 0
+        position = hole
+        while True:
+            position = (position + 1) % len(table)
+            held = table[position]
+            if not held:
+                return
+            home = self._id_home(self._packed_id(held - 1))
+            # Move an entry back only if the hole lies on its probe path.
+            if (position - home) % len(table) >= (position - hole) % len(table):
+                table[hole] = held
+                table[position] = 0
+                hole = position
+
+    def _observed_at(self, timestamp_ns: int) -> str:
+        wall_ns = self._wall_anchor_ns + timestamp_ns - self._monotonic_anchor_ns
+        return datetime.fromtimestamp(wall_ns / 1_000_000_000, timezone.utc).isoformat()
@@ -0,0 +1,27 @@
+"""Read-only JSON-shaped values shared between workbench layers without copying."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only equivalent of nested dicts, lists, and tuples."""
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def json_default(value: Any) -> Any:
+    """Let ``json.dumps`` encode read-only mappings as ordinary objects."""
+    if type(value) is MappingProxyType:
+        # The common case; skip the slower abstract-base-class check below.
+        return value.copy()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,106 @@
+"""Fixed-bucket latency histograms for the physical receive path."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+import time
+from typing import Any
+
+
+# Upper bucket bounds in nanoseconds: 1-2-5 steps from 1 µs to 10 s.
+_BOUNDS_NS = tuple(
+    step * 10 ** exponent
+    for exponent in range(3, 11)
+    for step in (1, 2, 5)
+    if step * 10 ** exponent <= 10_000_000_000
+)
+RECEIVE_STAGES = ("spi_read", "queue", "inspect", "publish", "sse")
+
+
+class LatencyHistogram:
+    """Count durations into preallocated buckets; recording allocates nothing.
+
+    Each histogram is written by one thread. Percentiles report the upper
+    bound of the bucket holding that rank, so they are accurate to one 1-2-5
+    step. The maximum is kept exactly.
+    """
+
+    bounds_ns = _BOUNDS_NS
+
+    def __init__(self) -> None:
+        self._counts = array("Q", bytes(8 * (len(_BOUNDS_NS) + 1)))
+        self._total_ns = 0
+        self._max_ns = 0
+
+    def record(self, elapsed_ns: int) -> None:
+        if elapsed_ns < 0:
+            elapsed_ns = 0
+        self._counts[bisect_left(_BOUNDS_NS, elapsed_ns)] += 1
+        self._total_ns += elapsed_ns
+        if elapsed_ns > self._max_ns:
+            self._max_ns = elapsed_ns
+
+    @property
+    def total_ns(self) -> int:
+        return self._total_ns
+
+    def counts(self) -> list[int]:
+        """Return per-bucket counts; the last bucket is everything above 10 s."""
+        return self._counts.tolist()
+
+    def summary(self) -> dict[str, Any]:
+        counts = self.counts()
+        total = sum(counts)
+        return {
+            "count": total,
+            "sum_us": round(self._total_ns / 1000, 1),
+            "p50_us": self._percentile(counts, total, 0.50),
+            "p95_us": self._percentile(counts, total, 0.95),
+            "p99_us": self._percentile(counts, total, 0.99),
+            "max_us": round(self._max_ns / 1000, 1) if total else None,
+        }
+
+    def _percentile(self, counts: list[int], total: int, fraction: float) -> float | None:
+        if not total:
+            return None
+        rank = max(1, round(fraction * total))
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                bound = _BOUNDS_NS[index] if index < len(_BOUNDS_NS) else self._max_ns
+                return round(min(bound, self._max_ns) / 1000, 1)
+        return round(self._max_ns / 1000, 1)
+
+
+class ReceiveLatency:
+    """One histogram per receive stage, from the data_ready edge to the SSE write.
+
+    ``spi_read`` runs from the edge to the end of the FIFO read, ``queue``
+    covers the wait in the receive ring, ``inspect`` and ``publish`` time the
+    service's work, and ``sse`` runs from publish to each event stream's write.
+    """
+
+    def __init__(self, revision_slots: int = 256) -> None:
+        self.stages = {name: LatencyHistogram() for name in RECEIVE_STAGES}
+        self._published_revisions = array("q", [-1] * revision_slots)
+        self._published_ns = array("q", bytes(8 * revision_slots))
+
+    def record(self, stage: str, elapsed_ns: int) -> None:
+        self.stages[stage].record(elapsed_ns)
+
+    def published(self, revision: int, at_ns: int) -> None:
+        """Remember when a received frame's model revision was published."""
+        slot = revision % len(self._published_revisions)
+        self._published_ns[slot] = at_ns
+        self._published_revisions[slot] = revision
+
+    def delivered(self, revision: int) -> None:
+        """Record ``sse`` for a revision about to be written to an event stream."""
+        slot = revision % len(self._published_revisions)
+        if self._published_revisions[slot] == revision:
+            self.stages["sse"].record(time.monotonic_ns() - self._published_ns[slot])
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        return {name: histogram.summary() for name, histogram in self.stages.items()}
@@ -0,0 +1,153 @@
+"""Prometheus text exposition of workbench counters, built only when scraped."""
+
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from .latency import LatencyHistogram
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_PREFIX = "packet_predator_"
+_RECEIVER_STATES = ("stopped", "starting", "listening", "transmitting", "faulted")
+
+
+class _Exposition:
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> str:
+        name = _PREFIX + name
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+        return name
+
+    def sample(self, name: str, value: float | int, labels: Mapping[str, Any] | None = None) -> None:
+        if labels:
+            rendered = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+            name = f"{name}{{{rendered}}}"
+        self._lines.append(f"{name} {_number(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        histogram: LatencyHistogram,
+        labels: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Write cumulative second-based buckets for a family already declared."""
+        labels = dict(labels or {})
+        seen = 0
+        counts = histogram.counts()
+        for bound, count in zip(LatencyHistogram.bounds_ns, counts):
+            seen += count
+            self.sample(f"{name}_bucket", seen, {**labels, "le": _number(bound / 1e9)})
+        seen += counts[-1]
+        self.sample(f"{name}_bucket", seen, {**labels, "le": "+Inf"})
+        self.sample(f"{name}_sum", histogram.total_ns / 1e9, labels)
+        self.sample(f"{name}_count", seen, labels)
+
+    def text(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float | int) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def exposition(metrics: Mapping[str, Any], event_streams: Mapping[str, Any] | None) -> str:
+    """Render ``WorkbenchService.metrics()`` and broadcaster stats as exposition text."""
+    out = _Exposition()
+
+    receiver = metrics["receiver"]
+    name = out.family("receiver_state", "gauge", "1 for the receiver's current lifecycle state.")
+    for state in _RECEIVER_STATES:
+        out.sample(name, receiver["state"] == state, {"state": state})
+    name = out.family("receiver_transitions_total", "counter", "Receiver state changes, by new state.")
+    for state, count in sorted(metrics["receiver_transitions"].items()):
+        out.sample(name, count, {"state": state})
+    for key, help_text in (
+        ("received_count", "nRF905 frames received."),
+        ("sent_count", "nRF905 frames sent."),
+        ("invalid_count", "nRF905 frames that failed inspection."),
+    ):
+        name = out.family(f"frames_{key.removesuffix('_count')}_total", "counter", help_text)
+        out.sample(name, receiver[key])
+
+    name = out.family(
+        "inspection_errors_total", "counter", "Journaled observations with an inspection error, by code."
+    )
+    for code, count in sorted(metrics["inspection_errors"].items()):
+        out.sample(name, count, {"code": code})
+    cache = metrics["decode_cache"]
+    for key, kind in (("hits", "counter"), ("misses", "counter"), ("evictions", "counter"), ("entries", "gauge")):
+        suffix = "_total" if kind == "counter" else ""
+        name = out.family(f"decode_cache_{key}{suffix}", kind, f"Decode cache {key}.")
+        out.sample(name, cache[key])
+
+    name = out.family("sse_clients", "gauge", "Open model event streams.")
+    out.sample(name, event_streams["clients"] if event_streams else 0)
+    name = out.family("sse_queue_depth", "gauge", "Queued events per open model event stream.")
+    for index, depth in enumerate(event_streams["queue_depths"] if event_streams else ()):
+        out.sample(name, depth, {"client": index})
+    name = out.family("sse_resyncs_total", "counter", "Event streams sent resync because their queue was full.")
+    out.sample(name, event_streams["slow_client_resyncs"] if event_streams else 0)
+
+    replay = metrics["replay"]
+    name = out.family("replay_cursor", "gauge", "Frames already delivered from the selected recording.")
+    out.sample(name, replay["cursor"])
+    name = out.family("replay_frames", "gauge", "Frames in the selected recording.")
+    out.sample(name, replay["frame_count"])
+    name = out.family("replay_lag_seconds", "gauge", "Wall-clock lateness of the newest delivered replay frame.")
+    out.sample(name, replay["lag_ms"] / 1000)
+    name = out.family(
+        "replay_release_lag_seconds", "histogram", "How much later than scheduled each replay frame was released."
+    )
+    out.histogram(name, metrics["replay_release_lag"])
+    name = out.family("replay_stage_seconds", "histogram", "Replay frame cost per service stage.")
+    for stage, histogram in metrics["replay_stages"].items():
+        out.histogram(name, histogram, {"stage": stage})
+
+    name = out.family("transmit_outcomes_total", "counter", "Transmit requests, by outcome.")
+    for outcome, count in sorted(metrics["transmit_outcomes"].items()):
+        out.sample(name, count, {"outcome": outcome})
+    if metrics["transmit_elapsed"] is not None:
+        name = out.family(
+            "transmit_elapsed_seconds",
+            "histogram",
+            "nRF905 time from TRX_CE pulse to transmit completion.",
+        )
+        out.histogram(name, metrics["transmit_elapsed"])
+    if metrics["fire_to_pulse"] is not None:
+        name = out.family(
+            "fire_to_pulse_seconds",
+            "histogram",
+            "Time from a fire request to the TRX_CE pulse that sends the armed frame.",
+        )
+        out.histogram(name, metrics["fire_to_pulse"])
+    if metrics["spi_exchanges"] is not None:
+        name = out.family("spi_exchange_seconds", "histogram", "Duration of each nRF905 SPI exchange.")
+        out.histogram(name, metrics["spi_exchanges"])
+
+    pipeline = metrics["receive_pipeline"]
+    if pipeline is not None:
+        ring = pipeline["ring"]
+        name = out.family("receive_ring_depth", "gauge", "Frames read from the radio but not yet published.")
+        out.sample(name, ring["depth"])
+        name = out.family(
+            "receive_ring_overflows_total", "counter", "Frames dropped because the receive ring was full."
+        )
+        out.sample(name, ring["overflows"])
+    stages = metrics["receive_latency"]
+    if stages is not None:
+        name = out.family("receive_stage_seconds", "histogram", "Receive latency per pipeline stage.")
+        for stage, histogram in stages.items():
+            out.histogram(name, histogram, {"stage": stage})
+    return out.text()
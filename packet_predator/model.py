@@ -2,27 +2,259 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import deque
-from copy import deepcopy
+from dataclasses import dataclass
+from functools import cached_property
+import json
 import threading
 import time
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
+from .capture_store import CaptureStore
+from .immutable import freeze, json_default
+
+
+_FILTERS = (
+    "family",
+    "message_type",
+    "source",
+    "destination",
+    "direction",
+    "transport",
+    "invalid",
+)
+# Direction and transport take a handful of values on nearly every frame, so an
+# index would not narrow a page; they are checked per record instead.
+_INDEXED = ("family", "message_type", "source", "destination", "invalid")
+# A frame joins at most four indexes (family, message type, source, destination)
+# at 8 bytes each, plus the half again that an index may hold before compacting.
+INDEX_BYTES_PER_RECORD = 4 * 8 * 3 // 2
+
+
+class _SequenceIndex:
+    """Ascending journal sequences sharing one filter value, trimmed from the front."""
+
+    __slots__ = ("_state",)
+
+    def __init__(self) -> None:
+        # (items, head) is replaced as one tuple, so a lock-free reader never
+        # pairs a compacted array with the head of the array it replaced.
+        self._state = (array("q"), 0)
+
+    def __len__(self) -> int:
+        items, head = self._state
+        return len(items) - head
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the backing array, including the trimmed head not yet compacted."""
+        items = self._state[0]
+        return len(items) * items.itemsize
+
+    def append(self, sequence: int) -> None:
+        self._state[0].append(sequence)
+
+    def discard_oldest(self, sequence: int) -> None:
+        items, head = self._state
+        if head < len(items) and items[head] == sequence:
+            head += 1
+            if head >= 1024 and head * 3 >= len(items):
+                # A fresh array, so a reader still walking the old one is not disturbed.
+                self._state = (items[head:], 0)
+            else:
+                self._state = (items, head)
+
+    def between(self, low: int, high: int, ascending: bool) -> Iterator[int]:
+        items, head = self._state
+        if ascending:
+            position = bisect_left(items, low, head)
+            while position < len(items) and items[position] <= high:
+                yield items[position]
+                position += 1
+        else:
+            position = bisect_right(items, high, head) - 1
+            while position >= head and items[position] >= low:
+                yield items[position]
+                position -= 1
+
+
+class _SharedLog:
+    """Append-only list of pairs shared by successive model versions.
+
+    Appending never disturbs the items an earlier version can see. Once the
+    list holds twice the retention, the log starts a new one from its newest
+    items and versions that were already published keep the old list.
+    """
+
+    __slots__ = ("_items", "limit")
+
+    def __init__(self, limit: int) -> None:
+        self._items: list[tuple[Mapping[str, Any], Any]] = []
+        self.limit = limit
+
+    def append(
+        self,
+        item: Mapping[str, Any],
+        companion: Any,
+    ) -> tuple[list[tuple[Mapping[str, Any], Any]], int]:
+        if len(self._items) >= 2 * self.limit:
+            self._items = self._items[len(self._items) - self.limit + 1:]
+        self._items.append((item, companion))
+        return self._items, len(self._items)
+
+
+class _EncodedChange:
+    """The JSON text of one change, encoded by the first stream that pulls it.
+
+    Publishers never encode, so an unsubscribed model pays nothing for JSON.
+    Two streams racing on the first pull encode equal text; either is kept.
+    """
+
+    __slots__ = ("_change", "_text")
+
+    def __init__(self, change: Mapping[str, Any]) -> None:
+        self._change = change
+        self._text: str | None = None
+
+    def text(self) -> str:
+        if self._text is None:
+            self._text = json.dumps(self._change, separators=(",", ":"), default=json_default)
+        return self._text
+
+
+@dataclass(frozen=True)
+class _Version:
+    """One immutable published state; readers use it without taking the model lock.
+
+    Retained observations are the newest ``retained`` ``(observation, summary)``
+    pairs before ``observations_end`` in a list shared with neighbouring
+    versions, so publishing never copies the journal.
+    """
+
+    revision: int
+    receiver: Mapping[str, Any]
+    counters: Mapping[str, Mapping[str, int]]
+    observations: list[tuple[Mapping[str, Any], Mapping[str, Any]]]
+    observations_end: int
+    retained: int
+    changes: list[tuple[Mapping[str, Any], _EncodedChange]]
+    changes_end: int
+    replayable: int
+
+    @property
+    def latest(self) -> Mapping[str, Any] | None:
+        return self.observations[self.observations_end - 1][0] if self.retained else None
+
+    @cached_property
+    def journal(self) -> tuple[Mapping[str, Any], ...]:
+        """Retained summaries newest first, built by the first reader of this version."""
+        window = self.observations[self.observations_end - self.retained:self.observations_end]
+        return tuple(summary for _, summary in reversed(window))
+
+    def stored_at(self, sequence: int) -> tuple[Mapping[str, Any], Mapping[str, Any]] | None:
+        """Return the retained ``(observation, summary)`` pair for a journal sequence."""
+        if not self.retained:
+            return None
+        # Journal sequences are contiguous, so the distance from the newest is the offset.
+        back = self.observations[self.observations_end - 1][0]["journal_sequence"] - sequence
+        if not 0 <= back < self.retained:
+            return None
+        return self.observations[self.observations_end - 1 - back]
+
+
+class _Dispatcher:
+    """Call revision subscribers from one background thread, outside the model lock.
+
+    Publishers only record the newest revision and set an event, so their
+    cost does not depend on how many subscribers are attached. Bursts are
+    collapsed: a subscriber may see only the newest revision of several.
+    """
+
+    def __init__(self) -> None:
+        self.subscribers: set[Callable[[int], None]] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._revision = 0
+        self._thread: threading.Thread | None = None
+
+    def add(self, callback: Callable[[int], None]) -> None:
+        with self._lock:
+            self.subscribers.add(callback)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="PacketPredatorModelDispatch", daemon=True
+                )
+                self._thread.start()
+
+    def discard(self, callback: Callable[[int], None]) -> None:
+        with self._lock:
+            self.subscribers.discard(callback)
+            if not self.subscribers:
+                self._wake.set()
+
+    def notify(self, revision: int) -> None:
+        self._revision = revision
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            with self._lock:
+                self._wake.clear()
+                if not self.subscribers:
+                    self._thread = None
+                    return
+                subscribers = tuple(self.subscribers)
+                revision = self._revision
+            for subscriber in subscribers:
+                try:
+                    subscriber(revision)
+                except Exception:
+                    # A browser notification must never stop delivery to the others.
+                    continue
 
 
 class WorkbenchModel:
-    """Own retained observations, receiver state, and change notifications."""
+    """Own retained observations, receiver state, and change notifications.
+
+    Observations, summaries, and change records are frozen once when they are
+    published and then shared by reference with every reader. An optional
+    ``CaptureStore`` keeps a compact copy of every observation so lookups keep
+    working long after the decoded retention window has moved on. Secondary
+    indexes over every retained journal sequence back filtered paging.
+
+    Every change swaps in a new immutable ``_Version``. ``snapshot``,
+    ``journal``, ``journal_page``, ``inspection``, ``counters``, and the
+    change readers use whichever version is current without taking the lock,
+    so a large read never delays the next publish. Records past the decoded
+    window are read from the capture store, which detects an overlapping
+    write and retries instead of locking.
+    """
 
     def __init__(
         self,
         retention: int = 100,
         change_retention: int = 256,
         clock: Callable[[], float] = time.monotonic,
+        capture_store: CaptureStore | None = None,
     ) -> None:
-        self._entries: deque[dict[str, Any]] = deque(maxlen=retention)
-        self._changes: deque[dict[str, Any]] = deque(maxlen=change_retention)
+        if capture_store is not None and capture_store.capacity < retention:
+            raise ValueError("A capture store must hold at least the decoded retention.")
+        self._entries: deque[Mapping[str, Any]] = deque(maxlen=retention)
+        self._observation_log = _SharedLog(retention)
+        self._observations: list[tuple[Mapping[str, Any], Mapping[str, Any]]] = []
+        self._observations_end = 0
+        self._by_id: dict[str, Mapping[str, Any]] = {}
+        self._indexes: dict[tuple[str, Any], _SequenceIndex] = {}
+        self._change_log = _SharedLog(change_retention)
         self._condition = threading.Condition(threading.RLock())
-        self._subscribers: set[Callable[[int], None]] = set()
+        self._dispatcher = _Dispatcher()
+        self._subscribers = self._dispatcher.subscribers
         self._clock = clock
+        self._capture_store = capture_store
         self._revision = 0
         self._journal_sequence = 0
         self._receiver = {
@@ -32,141 +264,419 @@ class WorkbenchModel:
             "invalid_count": 0,
             "last_error": None,
             "changed_at_ms": 0,
+            "armed": None,
         }
+        self._receiver_view: Mapping[str, Any] | None = None
+        self._receiver_transitions: dict[str, int] = {}
+        self._error_codes: dict[str, int] = {}
+        self._counters_view: Mapping[str, Mapping[str, int]] | None = None
+        self._version = _Version(0, self._receiver_unlocked(), self._counters_unlocked(), [], 0, 0, [], 0, 0)
+
+    def publish(self, entry: dict[str, Any]) -> Mapping[str, Any]:
+        """Retain a read-only observation and notify subscribers."""
+        with self._condition:
+            receiver = self._receiver_unlocked()
+            stored, summary = self._append_unlocked(entry)
+            self._record_change_unlocked(
+                "observation",
+                {
+                    "observation_id": stored["id"],
+                    "summary": summary,
+                },
+                receiver,
+            )
+            return stored
 
-    def publish(self, entry: dict[str, Any]) -> dict[str, Any]:
-        """Retain an immutable observation snapshot and notify subscribers."""
+    def publish_many(self, entries: list[dict[str, Any]]) -> list[Mapping[str, Any]]:
+        """Retain several observations in order under one model revision."""
+        if not entries:
+            return []
         with self._condition:
-            stored = deepcopy(entry)
-            stored["journal_sequence"] = self._journal_sequence
-            self._journal_sequence += 1
-            self._entries.appendleft(stored)
-
-            capture = stored.get("capture") or {}
-            if capture.get("transport") == "nrf905":
-                if capture.get("direction") == "received":
-                    self._receiver["received_count"] += 1
-                elif capture.get("direction") == "sent":
-                    self._receiver["sent_count"] += 1
-                if stored.get("inspection_error"):
-                    self._receiver["invalid_count"] += 1
-
-            self._record_change_unlocked("observation", stored["id"])
-            return deepcopy(stored)
+            receiver = self._receiver_unlocked()
+            stored = []
+            summaries = []
+            for entry in entries:
+                observation, summary = self._append_unlocked(entry)
+                stored.append(observation)
+                summaries.append(summary)
+            self._record_change_unlocked(
+                "observations",
+                {
+                    "observation_ids": tuple(item["id"] for item in stored),
+                    "summaries": tuple(summaries),
+                },
+                receiver,
+            )
+            return stored
 
     def set_receiver_state(
         self,
         state: str,
         error: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Publish a receiver lifecycle change when its visible state changed."""
         with self._condition:
-            normalized_error = deepcopy(error)
+            normalized_error = freeze(error)
             if (
                 self._receiver["state"] == state
                 and self._receiver["last_error"] == normalized_error
             ):
-                return deepcopy(self._receiver)
+                return self._receiver_unlocked()
             self._receiver["state"] = state
             self._receiver["last_error"] = normalized_error
             self._receiver["changed_at_ms"] = round(self._clock() * 1000)
+            self._receiver_transitions[state] = self._receiver_transitions.get(state, 0) + 1
+            self._receiver_view = None
+            self._counters_view = None
             self._record_change_unlocked("receiver")
-            return deepcopy(self._receiver)
+            return self._receiver_unlocked()
 
-    def journal(self) -> dict[str, Any]:
+    def set_armed(self, armed: dict[str, Any] | None) -> Mapping[str, Any]:
+        """Publish the frame waiting in the nRF905 TX register, or ``None``."""
         with self._condition:
-            entries = [self._summary(item) for item in self._entries]
-            return {
-                "entries": entries,
-                "count": len(entries),
-                "retention": f"process-local, newest {self._entries.maxlen}",
-            }
+            if armed is None and self._receiver["armed"] is None:
+                return self._receiver_unlocked()
+            self._receiver["armed"] = (
+                None if armed is None else freeze({**armed, "armed_at_ms": round(self._clock() * 1000)})
+            )
+            self._receiver_view = None
+            self._record_change_unlocked("receiver")
+            return self._receiver_unlocked()
 
-    def inspection(self, identifier: str) -> dict[str, Any] | None:
+    def report_replay_fault(self, error: dict[str, Any], carrier: dict[str, Any]) -> None:
+        """Publish a replay that stopped on an unreadable frame, with the paused carrier status."""
         with self._condition:
-            item = next((item for item in self._entries if item["id"] == identifier), None)
-            return deepcopy(item) if item is not None else None
+            self._record_change_unlocked("replay", {"error": freeze(error), "carrier": freeze(carrier)})
 
-    def snapshot(self) -> dict[str, Any]:
+    @property
+    def retention(self) -> int:
+        """How many decoded observations the journal keeps."""
+        return self._entries.maxlen or 0
+
+    def journal(self) -> dict[str, Any]:
+        return self._journal(self._version)
+
+    def journal_page(
+        self,
+        after: int | None = None,
+        before: int | None = None,
+        limit: int = 100,
+        filters: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Return retained summaries between two journal sequences, newest first.
+
+        Only ``after`` pages forward from the oldest match past that sequence;
+        otherwise paging walks back from ``before`` or the newest observation.
+        Filters whose value is ``None`` or ``False`` are ignored.
+        """
+        wanted = {name: value for name, value in (filters or {}).items() if value not in (None, False)}
+        unknown = sorted(set(wanted) - set(_FILTERS))
+        if unknown:
+            raise ValueError(f"Unsupported journal filters: {', '.join(unknown)}.")
+        checks = [(_FILTERS.index(name), value) for name, value in wanted.items()]
+        version = self._version
+        oldest, newest = self._retained_range(version)
+        low = oldest if after is None else max(oldest, after + 1)
+        high = newest if before is None else min(newest, before - 1)
+        matches: list[int] = []
+        has_more = False
+        for sequence in self._candidates(wanted, low, high, after is not None and before is None):
+            attributes = self._attributes_at(version, sequence)
+            # A compact record evicted while the page was walked simply drops out.
+            if attributes is None or any(attributes[position] != value for position, value in checks):
+                continue
+            if len(matches) == limit:
+                has_more = True
+                break
+            matches.append(sequence)
+        matches.sort(reverse=True)
+        summaries: dict[int, Mapping[str, Any]] = {}
+        for sequence in matches:
+            retained = version.stored_at(sequence)
+            if retained is not None:
+                summaries[sequence] = retained[1]
+                continue
+            expanded = self._expand(self._capture_store.record(sequence) if self._capture_store else None)
+            if expanded is not None:
+                summaries[sequence] = self._summary(expanded)
+        entries = [summaries[sequence] for sequence in matches if sequence in summaries]
+        return {
+            "entries": entries,
+            "count": len(entries),
+            "has_more": has_more,
+            "next_before": matches[-1] if matches else None,
+            "next_after": matches[0] if matches else None,
+            "oldest_sequence": oldest if oldest <= newest else None,
+            "newest_sequence": newest if oldest <= newest else None,
+            "filters": wanted,
+        }
+
+    def inspection(self, identifier: str) -> Mapping[str, Any] | None:
+        stored = self._by_id.get(identifier)
+        store = self._capture_store
+        if stored is not None or store is None:
+            return stored
+        sequence = store.sequence_of(identifier)
+        record = None if sequence is None else store.record(sequence)
+        # The record may have been overwritten between the two reads; it is gone then.
+        if record is None or record["id"] != identifier:
+            return None
+        return self._expand(record)
+
+    def inspection_at(self, journal_sequence: int) -> Mapping[str, Any] | None:
+        """Return a retained observation by its process-local journal sequence."""
+        retained = self._version.stored_at(journal_sequence)
+        if retained is not None or self._capture_store is None:
+            return None if retained is None else retained[0]
+        return self._expand(self._capture_store.record(journal_sequence))
+
+    def counters(self) -> dict[str, dict[str, int]]:
+        """Return receiver transitions by new state and retained inspection errors by code."""
+        return {name: dict(values) for name, values in self._version.counters.items()}
+
+    def capture_status(self) -> dict[str, Any] | None:
+        """Return capture store usage, plus the memory the model's secondary indexes hold."""
         with self._condition:
-            journal = {
-                "entries": [self._summary(item) for item in self._entries],
-                "count": len(self._entries),
-                "retention": f"process-local, newest {self._entries.maxlen}",
-            }
+            if self._capture_store is None:
+                return None
             return {
-                "revision": self._revision,
-                "receiver": deepcopy(self._receiver),
-                "journal": journal,
-                "latest": deepcopy(self._entries[0]) if self._entries else None,
+                **self._capture_store.stats(),
+                "index_count": len(self._indexes),
+                "index_bytes": sum(index.nbytes for index in self._indexes.values()),
             }
 
+    def snapshot(self) -> dict[str, Any]:
+        version = self._version
+        return {
+            "revision": version.revision,
+            "receiver": version.receiver,
+            "journal": self._journal(version),
+            "latest": version.latest,
+        }
+
+    @property
+    def revision(self) -> int:
+        return self._version.revision
+
     def changes_since(self, revision: int) -> dict[str, Any]:
-        with self._condition:
-            return self._changes_since_unlocked(revision)
+        return self._changes_since(self._version, revision)
+
+    def encoded_changes_since(self, revision: int) -> dict[str, Any]:
+        """Return missed changes as ``(revision, json)`` pairs, each encoded once on first pull."""
+        return self._changes_since(self._version, revision, encoded=True)
 
     def subscribe(self, callback: Callable[[int], None]) -> Callable[[], None]:
-        """Register a non-blocking revision notification callback."""
-        with self._condition:
-            self._subscribers.add(callback)
+        """Register a revision callback, run later on the model's dispatch thread."""
+        self._dispatcher.add(callback)
 
         def unsubscribe() -> None:
-            with self._condition:
-                self._subscribers.discard(callback)
+            self._dispatcher.discard(callback)
 
         return unsubscribe
 
     def wait_for_changes(self, revision: int, timeout_s: float) -> dict[str, Any]:
         """Block a web subscriber without holding up a publisher."""
-        with self._condition:
-            if self._revision == revision:
+        if self._version.revision == revision:
+            with self._condition:
                 self._condition.wait_for(
                     lambda: self._revision > revision,
                     timeout=max(0.0, timeout_s),
                 )
-            return self._changes_since_unlocked(revision)
+        return self._changes_since(self._version, revision)
 
-    def _record_change_unlocked(self, kind: str, identifier: str | None = None) -> None:
+    def _append_unlocked(self, entry: dict[str, Any]) -> tuple[Mapping[str, Any], Mapping[str, Any]]:
+        stored = freeze({**entry, "journal_sequence": self._journal_sequence})
+        self._journal_sequence += 1
+        store = self._capture_store
+        if store is not None and len(store) == store.capacity:
+            self._unindex_unlocked(store.first_sequence, store.attributes(store.first_sequence))
+        if len(self._entries) == self._entries.maxlen:
+            evicted = self._entries[-1]
+            if store is None:
+                self._unindex_unlocked(evicted["journal_sequence"], self._attributes(evicted))
+            # Identifiers are random; never let an evicted duplicate drop a newer index entry.
+            if self._by_id.get(evicted["id"]) is evicted:
+                del self._by_id[evicted["id"]]
+        self._entries.appendleft(stored)
+        self._by_id[stored["id"]] = stored
+        summary = self._summary(stored)
+        self._observations, self._observations_end = self._observation_log.append(stored, summary)
+        capture = stored.get("capture") or {}
+        error = stored.get("inspection_error")
+        if error:
+            code = str(error.get("code"))
+            self._error_codes[code] = self._error_codes.get(code, 0) + 1
+            self._counters_view = None
+        if store is not None:
+            captured_ns = capture.get("captured_ns")
+            store.append(
+                stored,
+                captured_ns if isinstance(captured_ns, int) else round(self._clock() * 1_000_000_000),
+            )
+        # With a store, index what the store will report at eviction, so an interned
+        # value that overflowed its table is never indexed and then left behind.
+        sequence = stored["journal_sequence"]
+        self._index_unlocked(sequence, self._attributes(stored) if store is None else store.attributes(sequence))
+
+        if capture.get("transport") == "nrf905":
+            if capture.get("direction") == "received":
+                self._receiver["received_count"] += 1
+            elif capture.get("direction") == "sent":
+                self._receiver["sent_count"] += 1
+            if stored.get("inspection_error"):
+                self._receiver["invalid_count"] += 1
+            self._receiver_view = None
+        return stored, summary
+
+    def _retained_range(self, version: _Version) -> tuple[int, int]:
+        latest = version.latest
+        if latest is None:
+            return 0, -1
+        # The store may already hold a newer record than this version; stop at the version.
+        newest = latest["journal_sequence"]
+        if self._capture_store is not None:
+            first, _ = self._capture_store.span()
+            return first, newest
+        return newest - version.retained + 1, newest
+
+    def _candidates(
+        self,
+        wanted: Mapping[str, Any],
+        low: int,
+        high: int,
+        ascending: bool,
+    ) -> Iterable[int]:
+        if low > high:
+            return ()
+        indexes = [self._indexes.get((name, wanted[name])) for name in _INDEXED if name in wanted]
+        if indexes:
+            if any(index is None for index in indexes):
+                return ()
+            # Walk the most selective index; the remaining filters are checked per record.
+            return min(indexes, key=len).between(low, high, ascending)
+        return range(low, high + 1) if ascending else range(high, low - 1, -1)
+
+    def _attributes_at(self, version: _Version, sequence: int) -> tuple[Any, ...] | None:
+        retained = version.stored_at(sequence)
+        if retained is not None:
+            return self._attributes(retained[0])
+        return None if self._capture_store is None else self._capture_store.attributes(sequence)
+
+    def _index_unlocked(self, sequence: int, attributes: tuple[Any, ...]) -> None:
+        for name in _INDEXED:
+            value = attributes[_FILTERS.index(name)]
+            if value is not None and value is not False:
+                self._indexes.setdefault((name, value), _SequenceIndex()).append(sequence)
+
+    def _unindex_unlocked(self, sequence: int, attributes: tuple[Any, ...]) -> None:
+        for name in _INDEXED:
+            key = (name, attributes[_FILTERS.index(name)])
+            index = self._indexes.get(key)
+            if index is not None:
+                index.discard_oldest(sequence)
+                if not len(index):
+                    del self._indexes[key]
+
+    def _expand(self, record: dict[str, Any] | None) -> Mapping[str, Any] | None:
+        # Decoding runs outside the lock so compact lookups never stall publishers.
+        if record is None or self._capture_store is None:
+            return None
+        return freeze(self._capture_store.expand(record))
+
+    def _receiver_unlocked(self) -> Mapping[str, Any]:
+        if self._receiver_view is None:
+            self._receiver_view = MappingProxyType(dict(self._receiver))
+        return self._receiver_view
+
+    def _counters_unlocked(self) -> Mapping[str, Mapping[str, int]]:
+        if self._counters_view is None:
+            self._counters_view = MappingProxyType({
+                "receiver_transitions": MappingProxyType(dict(self._receiver_transitions)),
+                "inspection_errors": MappingProxyType(dict(self._error_codes)),
+            })
+        return self._counters_view
+
+    def _journal(self, version: _Version) -> dict[str, Any]:
+        return {
+            "entries": version.journal,
+            "count": len(version.journal),
+            "capacity": self._entries.maxlen,
+            "retention": f"process-local, newest {self._entries.maxlen}",
+        }
+
+    def _record_change_unlocked(
+        self,
+        kind: str,
+        details: Mapping[str, Any] | None = None,
+        receiver_before: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Append a self-contained change so event streams never refetch the snapshot."""
         self._revision += 1
-        change = {"revision": self._revision, "kind": kind}
-        if identifier is not None:
-            change["observation_id"] = identifier
-        self._changes.append(change)
+        change: dict[str, Any] = {"revision": self._revision, "kind": kind, **(details or {})}
+        receiver = self._receiver_unlocked()
+        if receiver is not receiver_before:
+            change["receiver"] = receiver
+        frozen = MappingProxyType(change)
+        changes, end = self._change_log.append(frozen, _EncodedChange(frozen))
+        previous = self._version
+        # One reference assignment publishes the version; readers never see it half built.
+        self._version = _Version(
+            self._revision,
+            receiver,
+            self._counters_unlocked(),
+            self._observations,
+            self._observations_end,
+            len(self._entries),
+            changes,
+            end,
+            min(previous.replayable + 1, self._change_log.limit),
+        )
         self._condition.notify_all()
-        for subscriber in tuple(self._subscribers):
-            try:
-                subscriber(self._revision)
-            except Exception:
-                # A browser notification must never fail a model publisher.
-                continue
+        self._dispatcher.notify(self._revision)
 
-    def _changes_since_unlocked(self, revision: int) -> dict[str, Any]:
+    @staticmethod
+    def _changes_since(version: _Version, revision: int, encoded: bool = False) -> dict[str, Any]:
         if revision < 0:
             revision = 0
-        if revision > self._revision:
+        if revision > version.revision or revision < version.revision - version.replayable:
             return {
-                "revision": self._revision,
-                "resync": True,
-                "changes": [],
-            }
-        oldest_replayable = self._changes[0]["revision"] - 1 if self._changes else self._revision
-        if revision < oldest_replayable:
-            return {
-                "revision": self._revision,
+                "revision": version.revision,
                 "resync": True,
                 "changes": [],
             }
+        # Revisions are contiguous, so the missed changes are always the newest ones.
+        missed = version.changes[version.changes_end - (version.revision - revision):version.changes_end]
+        if encoded:
+            changes: list[Any] = [
+                (change["revision"], encoding.text()) for change, encoding in missed
+            ]
+        else:
+            changes = [change for change, _ in missed]
         return {
-            "revision": self._revision,
+            "revision": version.revision,
             "resync": False,
-            "changes": [
-                deepcopy(change) for change in self._changes if change["revision"] > revision
-            ],
+            "changes": changes,
         }
 
     @staticmethod
-    def _summary(item: dict[str, Any]) -> dict[str, Any]:
-        return {
+    def _attributes(item: Mapping[str, Any]) -> tuple[Any, ...]:
+        capture = item.get("capture") or {}
+        envelope = item.get("envelope") or {}
+        route = item.get("route") or {}
+        family = item.get("family") or {}
+        return (
+            family.get("key"),
+            envelope.get("message_type"),
+            route.get("source"),
+            route.get("destination"),
+            capture.get("direction"),
+            capture.get("transport"),
+            bool(item.get("inspection_error")),
+        )
+
+    @staticmethod
+    def _summary(item: Mapping[str, Any]) -> Mapping[str, Any]:
+        return MappingProxyType({
             "id": item["id"],
             "journal_sequence": item["journal_sequence"],
             "observed_at": item["observed_at"],
@@ -174,7 +684,7 @@ class WorkbenchModel:
             "title": item["title"],
             "summary": item["summary"],
             "received_frame_hex": item["received_frame_hex"],
-            "family": deepcopy(item["family"]),
-            "capture": deepcopy(item.get("capture")),
-            "inspection_error": deepcopy(item.get("inspection_error")),
-        }
+            "family": item["family"],
+            "capture": item.get("capture"),
+            "inspection_error": item.get("inspection_error"),
+        })
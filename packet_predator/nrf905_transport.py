@@ -23,7 +23,7 @@ class Nrf905Transport(ReceiveTransport):
         self.profile = profile
         self.device = device
         self._monotonic = monotonic
-        self._started_at = monotonic()
+        self._started_ns = round(monotonic() * 1_000_000_000)
         self._sequence = 0
         self._closed = False
         self._operation_lock = threading.RLock()
@@ -49,6 +49,7 @@ class Nrf905Transport(ReceiveTransport):
                 "connected": not self._closed,
                 "can_receive": not self._closed,
                 "can_transmit": not self._closed and self.profile.radio.transmit_enabled,
+                "armed": not self._closed and self.device.armed_frame is not None,
                 "description": "A configured nRF905 is listening for complete 32-byte frames; it never responds automatically.",
                 "profile": self.profile.public_summary(),
                 "configuration_hex": self._probe["configuration_hex"],
@@ -60,13 +61,14 @@ class Nrf905Transport(ReceiveTransport):
         with self._operation_lock:
             if self._closed:
                 return []
-            frame = self.device.receive()
-            if frame is None:
+            received = self.device.receive_stamped()
+            if received is None:
                 return []
             item = self._carrier_frame(
-                frame,
+                received[0],
                 "received",
                 "Valid address and hardware CRC received by nRF905.",
+                received[1],
             )
             return [item]
 
@@ -78,12 +80,13 @@ class Nrf905Transport(ReceiveTransport):
             with self._operation_lock:
                 if self._closed or stop.is_set():
                     return None
-                frame = self.device.receive()
-                if frame is not None:
+                received = self.device.receive_stamped()
+                if received is not None:
                     return self._carrier_frame(
-                        frame,
+                        received[0],
                         "received",
                         "Valid address and hardware CRC received by nRF905.",
+                        received[1],
                     )
                 # A transmit-complete edge can wake this waiter. Recheck only
                 # after the adapter has restored receive mode.
@@ -91,12 +94,34 @@ class Nrf905Transport(ReceiveTransport):
 
     def send(self, frame: bytes) -> CarrierFrame:
         with self._operation_lock:
-            result = self.device.transmit(frame)
-            return self._carrier_frame(
-                frame,
-                "sent",
-                f"nRF905 reported transmit completion after {result['elapsed_ms']} ms.",
-            )
+            return self._sent_frame(frame, self.device.transmit(frame))
+
+    def arm(self, frame: bytes) -> dict[str, object]:
+        """Preload ``frame`` for ``fire``; the radio keeps receiving meanwhile."""
+        with self._operation_lock:
+            return self.device.arm(frame)
+
+    def fire(self) -> tuple[CarrierFrame, dict[str, object]]:
+        """Send the armed frame and return it with the adapter's timing."""
+        with self._operation_lock:
+            armed = self.device.armed_frame
+            result = self.device.fire()
+            return self._sent_frame(armed, result), result
+
+    def disarm(self) -> None:
+        with self._operation_lock:
+            self.device.disarm()
+
+    def _sent_frame(self, frame: bytes, result: dict[str, object]) -> CarrierFrame:
+        edge_timed = result["completion_source"] == "data_ready_edge"
+        return self._carrier_frame(
+            frame,
+            "sent",
+            f"nRF905 reported transmit completion after {result['elapsed_ms']} ms "
+            f"({result['completion_us']} µs from CE pulse to "
+            f"{'the data_ready edge' if edge_timed else 'polled data_ready'}).",
+            result["completed_ns"] if edge_timed else None,
+        )
 
     def close(self) -> None:
         with self._operation_lock:
@@ -105,16 +130,26 @@ class Nrf905Transport(ReceiveTransport):
             self.device.close()
             self._closed = True
 
-    def _carrier_frame(self, frame: bytes, direction: str, note: str) -> CarrierFrame:
+    def _carrier_frame(
+        self,
+        frame: bytes,
+        direction: str,
+        note: str,
+        edge_ns: int | None = None,
+    ) -> CarrierFrame:
+        # gpiod edge timestamps use CLOCK_MONOTONIC, the same clock as time.monotonic.
+        captured_ns = edge_ns if edge_ns is not None else round(self._monotonic() * 1_000_000_000)
         item = CarrierFrame(
             sequence=self._sequence,
-            at_ms=round((self._monotonic() - self._started_at) * 1000),
+            at_ms=round((captured_ns - self._started_ns) / 1_000_000),
             direction=direction,
             frame=frame,
             frame_mode="fixed",
             recording_id="",
             fixture_id="",
             note=note,
+            captured_ns=captured_ns,
+            capture_clock="data_ready_edge" if edge_ns is not None else "monotonic",
         )
         self._sequence += 1
         return item
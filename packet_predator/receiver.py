@@ -3,28 +3,108 @@
 from __future__ import annotations
 
 import threading
+import time
 from typing import Any, Callable
 
 from .adapters.nrf905 import Nrf905Error
+from .latency import ReceiveLatency
 from .nrf905_transport import Nrf905Transport
 from .transport import CarrierFrame
 
 
+class FrameRing:
+    """Preallocated single-producer, single-consumer queue of received frames.
+
+    Each slot holds a frame and the ``monotonic_ns`` time it was read.
+    ``push`` never blocks: when every slot is taken the frame is counted as
+    an overflow and dropped, so the radio side keeps servicing the FIFO.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("A receive ring needs at least one slot.")
+        self.capacity = capacity
+        self._slots: list[tuple[CarrierFrame, int] | None] = [None] * capacity
+        self._ready = threading.Condition(threading.Lock())
+        self._written = 0
+        self._read = 0
+        self._overflows = 0
+        self._high_water = 0
+        self._closed = False
+
+    def open(self) -> None:
+        with self._ready:
+            self._closed = False
+
+    def close(self) -> None:
+        """Wake the consumer; it takes what is left and then sees an empty ring."""
+        with self._ready:
+            self._closed = True
+            self._ready.notify()
+
+    def push(self, item: tuple[CarrierFrame, int]) -> bool:
+        with self._ready:
+            depth = self._written - self._read
+            if depth == self.capacity:
+                self._overflows += 1
+                return False
+            self._slots[self._written % self.capacity] = item
+            self._written += 1
+            self._high_water = max(self._high_water, depth + 1)
+            self._ready.notify()
+            return True
+
+    def take(self) -> list[tuple[CarrierFrame, int]]:
+        """Wait for frames and return every queued one; empty only once closed."""
+        with self._ready:
+            self._ready.wait_for(lambda: self._written > self._read or self._closed)
+            taken = []
+            while self._read < self._written:
+                slot = self._read % self.capacity
+                taken.append(self._slots[slot])
+                self._slots[slot] = None
+                self._read += 1
+            return taken
+
+    def stats(self) -> dict[str, int]:
+        with self._ready:
+            return {
+                "capacity": self.capacity,
+                "depth": self._written - self._read,
+                "high_water": self._high_water,
+                "queued": self._written,
+                "overflows": self._overflows,
+            }
+
+
 class PhysicalReceiver:
-    """Continuously move physical frames into the workbench service."""
+    """Continuously move physical frames into the workbench service.
+
+    A radio thread only waits for frames, reads them, and pushes them onto a
+    ``FrameRing``. A separate decode thread inspects and publishes them, so a
+    slow decode or publish never delays the next FIFO read.
+    """
 
     def __init__(
         self,
         transport: Nrf905Transport,
         consume: Callable[[CarrierFrame], dict[str, Any]],
         set_state: Callable[[str, dict[str, Any] | None], dict[str, Any]],
+        ring_capacity: int = 1024,
+        latency: ReceiveLatency | None = None,
     ) -> None:
         self._transport = transport
         self._consume = consume
         self._set_state = set_state
+        self._ring = FrameRing(ring_capacity)
+        self._latency = latency
         self._stop = threading.Event()
         self._lock = threading.RLock()
         self._thread: threading.Thread | None = None
+        self._decoder: threading.Thread | None = None
+        self._fault: dict[str, Any] | None = None
+        self._drained = 0
+        self._decoded = 0
 
     @property
     def running(self) -> bool:
@@ -36,51 +116,89 @@ class PhysicalReceiver:
             if self._thread is not None and self._thread.is_alive():
                 return
             self._stop.clear()
+            self._fault = None
+            self._ring.open()
             self._set_state("starting", None)
             self._thread = threading.Thread(
                 target=self._run,
                 name="PacketPredatorPhysicalReceiver",
                 daemon=False,
             )
+            self._decoder = threading.Thread(
+                target=self._decode,
+                args=(self._thread,),
+                name="PacketPredatorReceiveDecoder",
+                daemon=False,
+            )
             self._thread.start()
+            self._decoder.start()
 
     def stop(self, timeout_s: float = 2.0) -> None:
         with self._lock:
             thread = self._thread
+            decoder = self._decoder
             if thread is None:
                 self._set_state("stopped", None)
                 return
             self._stop.set()
         thread.join(timeout_s)
-        if thread.is_alive():
+        if decoder is not None:
+            decoder.join(timeout_s)
+        if thread.is_alive() or (decoder is not None and decoder.is_alive()):
             raise RuntimeError("The physical receiver did not stop within the shutdown deadline.")
         with self._lock:
             self._thread = None
+            self._decoder = None
+
+    def stats(self) -> dict[str, Any]:
+        """Report both stages; ``ring.depth`` is frames read but not yet published."""
+        return {
+            "radio": {"frames": self._drained, "overflows": self._ring.stats()["overflows"]},
+            "decode": {"frames": self._decoded},
+            "ring": self._ring.stats(),
+        }
 
     def _run(self) -> None:
-        faulted = False
         self._set_state("listening", None)
         try:
             while not self._stop.is_set():
                 item = self._transport.wait_for_frame(self._stop)
-                if item is not None:
-                    batch = [item]
-                    while not self._stop.is_set():
-                        available = self._transport.poll()
-                        if not available:
-                            break
-                        batch.extend(available)
+                batch = [item] if item is not None else []
+                while batch:
+                    read_ns = time.monotonic_ns()
                     for captured in batch:
-                        self._consume(captured)
+                        self._drained += 1
+                        if self._latency is not None and captured.capture_clock == "data_ready_edge":
+                            self._latency.record("spi_read", read_ns - captured.captured_ns)
+                        self._ring.push((captured, read_ns))
+                    if self._stop.is_set():
+                        break
+                    batch = self._transport.poll()
         except Nrf905Error as exc:
-            faulted = True
-            self._set_state("faulted", exc.as_dict())
+            self._fault = exc.as_dict()
         except Exception as exc:
-            faulted = True
-            self._set_state(
-                "faulted",
-                {"code": "PHYSICAL_RECEIVER_FAILED", "message": str(exc)},
-            )
+            self._fault = {"code": "PHYSICAL_RECEIVER_FAILED", "message": str(exc)}
+        finally:
+            self._ring.close()
+
+    def _decode(self, radio: threading.Thread) -> None:
+        try:
+            while True:
+                batch = self._ring.take()
+                if not batch:
+                    break
+                for captured, read_ns in batch:
+                    if self._latency is not None:
+                        self._latency.record("queue", time.monotonic_ns() - read_ns)
+                    self._consume(captured)
+                    self._decoded += 1
+        except Exception as exc:
+            self._fault = {"code": "PHYSICAL_RECEIVER_FAILED", "message": str(exc)}
+            self._stop.set()
         finally:
-            if not faulted:
+            # Publish the final state only after the radio thread has exited.
+            radio.join()
+            if self._fault is not None:
+                self._set_state("faulted", self._fault)
+            else:
                 self._set_state("stopped", None)
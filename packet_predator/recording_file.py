@@ -0,0 +1,323 @@
+"""Chunked binary recordings that stream from a memory map instead of loading whole."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import json
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Iterable, overload
+
+from .transport import CarrierFrame
+
+
+SUFFIX = ".pprec"
+FRAME_SLOT = 32
+DEFAULT_CHUNK_FRAMES = 4096
+
+# Layout, all little-endian:
+#   preamble  magic, format version, metadata length; then the metadata JSON,
+#             zero-padded to an 8-byte boundary
+#   chunks    contiguous fixed-size frame records, ``chunk_frames`` per chunk
+#   index     one entry per chunk: byte offset, first at_ms, frame count, CRC-32
+#   trailer   index offset, frame count, chunk count, end magic
+_MAGIC = b"PPRC"
+_END_MAGIC = b"PPRX"
+_VERSION = 1
+_PREAMBLE = struct.Struct("<4sHI")
+_RECORD = struct.Struct(f"<QBB6x{FRAME_SLOT}s")
+_AT_MS = struct.Struct("<Q")
+_INDEX_ENTRY = struct.Struct("<QQII")
+_TRAILER = struct.Struct("<QQI4s")
+_DIRECTIONS = ("received", "sent")
+_METADATA_FIELDS = {
+    "schema_version",
+    "id",
+    "title",
+    "description",
+    "authority_version",
+    "frame_mode",
+    "duration_ms",
+    "chunk_frames",
+}
+
+
+class RecordingError(RuntimeError):
+    """A recording file is malformed or cannot be resolved."""
+
+    def __init__(self, code: str, detail: str) -> None:
+        super().__init__(detail)
+        self.code = code
+        self.detail = detail
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"code": self.code, "message": self.detail}
+
+
+def write_recording(
+    path: Path,
+    metadata: dict[str, Any],
+    frames: Iterable[tuple[int, str, bytes]],
+    chunk_frames: int = DEFAULT_CHUNK_FRAMES,
+) -> int:
+    """Stream ``(at_ms, direction, frame)`` tuples into a binary recording.
+
+    Frames are written one chunk at a time, so a long capture never has to be
+    held in memory. The file appears under ``path`` only once it is complete.
+    Returns the number of frames written.
+    """
+    if not 1 <= chunk_frames <= 1 << 20:
+        raise RecordingError("RECORDING_CHUNK", "chunk_frames must be from 1 to 1048576.")
+    duration_ms = metadata["duration_ms"]
+    encoded = json.dumps({**metadata, "schema_version": 1, "chunk_frames": chunk_frames}).encode("utf-8")
+    padded = encoded + bytes(-(_PREAMBLE.size + len(encoded)) % 8)
+    partial = path.with_name(path.name + ".partial")
+    try:
+        count = _write_chunks(partial, padded, duration_ms, frames, chunk_frames)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    os.replace(partial, path)
+    return count
+
+
+def _write_chunks(
+    partial: Path,
+    padded: bytes,
+    duration_ms: int,
+    frames: Iterable[tuple[int, str, bytes]],
+    chunk_frames: int,
+) -> int:
+    index: list[tuple[int, int, int, int]] = []
+    count = 0
+    previous_at = 0
+    with partial.open("wb") as handle:
+        handle.write(_PREAMBLE.pack(_MAGIC, _VERSION, len(padded)))
+        handle.write(padded)
+        chunk = bytearray()
+        first_at = 0
+        for at_ms, direction, frame in frames:
+            if not isinstance(at_ms, int) or at_ms < previous_at or at_ms > duration_ms:
+                raise RecordingError(
+                    "RECORDING_ORDER",
+                    f"Frame {count} at_ms must be nondecreasing and within duration_ms.",
+                )
+            if direction not in _DIRECTIONS:
+                raise RecordingError("RECORDING_DIRECTION", f"Frame {count} direction is invalid.")
+            if not 1 <= len(frame) <= FRAME_SLOT:
+                raise RecordingError("RECORDING_FRAME", f"Frame {count} must be 1 to {FRAME_SLOT} bytes.")
+            if not chunk:
+                first_at = at_ms
+            chunk += _RECORD.pack(at_ms, _DIRECTIONS.index(direction), len(frame), bytes(frame))
+            previous_at = at_ms
+            count += 1
+            if len(chunk) == chunk_frames * _RECORD.size:
+                index.append((handle.tell(), first_at, chunk_frames, zlib.crc32(chunk)))
+                handle.write(chunk)
+                chunk.clear()
+        if chunk:
+            index.append((handle.tell(), first_at, len(chunk) // _RECORD.size, zlib.crc32(chunk)))
+            handle.write(chunk)
+        index_offset = handle.tell()
+        for entry in index:
+            handle.write(_INDEX_ENTRY.pack(*entry))
+        if not count:
+            raise RecordingError("RECORDING_ENTRIES", "A recording needs at least one frame.")
+        handle.write(_TRAILER.pack(index_offset, count, len(index), _END_MAGIC))
+    return count
+
+
+class MappedOffsets(Sequence[int]):
+    """Scheduled offsets of a ``MappedFrames``, read from the map once their chunk is verified."""
+
+    def __init__(self, frames: MappedFrames) -> None:
+        self._frames = frames
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @overload
+    def __getitem__(self, position: int) -> int: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[int]: ...
+
+    def __getitem__(self, position: int | slice) -> int | list[int]:
+        if isinstance(position, slice):
+            return [self[item] for item in range(*position.indices(len(self)))]
+        return self._frames.at_ms(position)
+
+    def bisect_left(self, at_ms: float) -> int:
+        """Return the first position scheduled at or after ``at_ms``.
+
+        The checked chunk index narrows the search to one chunk, and only that
+        chunk is verified and searched, so damaged data elsewhere cannot steer
+        a seek.
+        """
+        frames = self._frames
+        chunk = bisect_left(frames.chunk_starts, at_ms) - 1
+        if chunk < 0:
+            return 0
+        first = chunk * frames.chunk_frames
+        return bisect_left(self, at_ms, first, min(first + frames.chunk_frames, len(frames)))
+
+
+class MappedFrames(Sequence[CarrierFrame]):
+    """Frames of one binary recording, built from the memory map only when read.
+
+    Each chunk's checksum and ordering are verified the first time one of its
+    frames is read, so opening a recording costs only its index.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        view: mmap.mmap,
+        metadata: dict[str, Any],
+        data_offset: int,
+        count: int,
+        index: tuple[tuple[int, int, int, int], ...],
+    ) -> None:
+        self.path = path
+        self.view = view
+        self.identifier: str = metadata["id"]
+        self.frame_mode: str = metadata["frame_mode"]
+        self.duration_ms: int = metadata["duration_ms"]
+        self.chunk_frames: int = metadata["chunk_frames"]
+        self.offsets = MappedOffsets(self)
+        self._data_offset = data_offset
+        self._count = count
+        self._index = index
+        self.chunk_starts = [entry[1] for entry in index]
+        self._verified: set[int] = set()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, position: int) -> CarrierFrame: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[CarrierFrame]: ...
+
+    def __getitem__(self, position: int | slice) -> CarrierFrame | list[CarrierFrame]:
+        if isinstance(position, slice):
+            return [self[item] for item in range(*position.indices(self._count))]
+        offset = self._checked_offset(position)
+        sequence = (offset - self._data_offset) // _RECORD.size
+        at_ms, direction, length, frame = _RECORD.unpack_from(self.view, offset)
+        return CarrierFrame(
+            sequence=sequence,
+            at_ms=at_ms,
+            direction=_DIRECTIONS[direction],
+            frame=frame[:length],
+            frame_mode=self.frame_mode,
+            recording_id=self.identifier,
+            fixture_id="",
+            note="",
+        )
+
+    def at_ms(self, position: int) -> int:
+        """Return one frame's scheduled offset after verifying its chunk."""
+        return _AT_MS.unpack_from(self.view, self._checked_offset(position))[0]
+
+    def close(self) -> None:
+        """Release the memory map; the frames cannot be read afterwards."""
+        self.view.close()
+
+    def _checked_offset(self, position: int) -> int:
+        offset = self.record_offset(position)
+        chunk = (offset - self._data_offset) // _RECORD.size // self.chunk_frames
+        if chunk not in self._verified:
+            self._verify(chunk)
+        return offset
+
+    def record_offset(self, position: int) -> int:
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("recording frame index out of range")
+        return self._data_offset + position * _RECORD.size
+
+    def _verify(self, chunk: int) -> None:
+        offset, first_at, count, checksum = self._index[chunk]
+        data = self.view[offset : offset + count * _RECORD.size]
+        if zlib.crc32(data) != checksum:
+            raise RecordingError("RECORDING_CHUNK", f"{self.path}: chunk {chunk} fails its checksum.")
+        following = self._index[chunk + 1][1] if chunk + 1 < len(self._index) else self.duration_ms
+        previous_at = first_at
+        for at_ms, direction, length, _ in _RECORD.iter_unpack(data):
+            if not previous_at <= at_ms <= following:
+                raise RecordingError("RECORDING_ORDER", f"{self.path}: chunk {chunk} is out of time order.")
+            if direction >= len(_DIRECTIONS) or not 1 <= length <= FRAME_SLOT:
+                raise RecordingError("RECORDING_FRAME", f"{self.path}: chunk {chunk} holds a malformed frame.")
+            previous_at = at_ms
+        self._verified.add(chunk)
+
+
+def open_recording(path: Path) -> tuple[dict[str, Any], MappedFrames]:
+    """Map a binary recording and check its framing; frame chunks are checked when read.
+
+    Returns the metadata JSON, with ``frame_count`` added from the trailer,
+    and the lazily decoded frames.
+    """
+    try:
+        with path.open("rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size < _PREAMBLE.size + _TRAILER.size:
+                raise RecordingError("RECORDING_BINARY", f"{path}: file is too short.")
+            view = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except OSError as exc:
+        raise RecordingError("RECORDING_BINARY", f"Cannot read {path}: {exc}") from exc
+    try:
+        return _check_framing(path, view, size)
+    except BaseException:
+        view.close()
+        raise
+
+
+def _check_framing(path: Path, view: mmap.mmap, size: int) -> tuple[dict[str, Any], MappedFrames]:
+    magic, version, metadata_size = _PREAMBLE.unpack_from(view, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise RecordingError("RECORDING_BINARY", f"{path}: not a version {_VERSION} binary recording.")
+    data_offset = _PREAMBLE.size + metadata_size
+    index_offset, count, chunks, end_magic = _TRAILER.unpack_from(view, size - _TRAILER.size)
+    if end_magic != _END_MAGIC or index_offset + chunks * _INDEX_ENTRY.size + _TRAILER.size != size:
+        raise RecordingError("RECORDING_BINARY", f"{path}: index trailer is damaged or truncated.")
+    if data_offset > index_offset:
+        raise RecordingError("RECORDING_BINARY", f"{path}: metadata overruns the frame data.")
+    try:
+        metadata = json.loads(bytes(view[_PREAMBLE.size : data_offset]).rstrip(b"\0"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise RecordingError("RECORDING_JSON", f"{path}: metadata is not JSON: {exc}") from exc
+    if not isinstance(metadata, dict) or set(metadata) != _METADATA_FIELDS:
+        raise RecordingError(
+            "RECORDING_FIELDS",
+            f"{path}: expected metadata fields {sorted(_METADATA_FIELDS)}.",
+        )
+    chunk_frames = metadata["chunk_frames"]
+    duration_ms = metadata["duration_ms"]
+    if not isinstance(chunk_frames, int) or isinstance(chunk_frames, bool) or chunk_frames < 1:
+        raise RecordingError("RECORDING_CHUNK", f"{path}: chunk_frames must be a positive integer.")
+    if not isinstance(duration_ms, int) or isinstance(duration_ms, bool) or duration_ms < 0:
+        raise RecordingError("RECORDING_DURATION", f"{path}: duration_ms must be a nonnegative integer.")
+    if not count or chunks != -(-count // chunk_frames):
+        raise RecordingError("RECORDING_ENTRIES", f"{path}: a recording needs frames in full chunks.")
+    if data_offset + count * _RECORD.size != index_offset:
+        raise RecordingError("RECORDING_BINARY", f"{path}: frame data does not match the index.")
+
+    index = tuple(_INDEX_ENTRY.iter_unpack(view[index_offset : size - _TRAILER.size]))
+    previous_at = 0
+    for chunk, (offset, first_at, chunk_count, _) in enumerate(index):
+        expected = min(chunk_frames, count - chunk * chunk_frames)
+        if offset != data_offset + chunk * chunk_frames * _RECORD.size or chunk_count != expected:
+            raise RecordingError("RECORDING_BINARY", f"{path}: index entry {chunk} does not match its chunk.")
+        if first_at < previous_at or first_at > duration_ms:
+            raise RecordingError("RECORDING_ORDER", f"{path}: index entry {chunk} is out of time order.")
+        previous_at = first_at
+    metadata["frame_count"] = count
+    return metadata, MappedFrames(path, view, metadata, data_offset, count, index)
@@ -2,36 +2,50 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Sequence
 
+from .recording_file import SUFFIX, MappedFrames, RecordingError, open_recording
 from .transport import CarrierFrame
 
 
-class RecordingError(RuntimeError):
-    """A recording file is malformed or cannot be resolved."""
-
-    def __init__(self, code: str, detail: str) -> None:
-        super().__init__(detail)
-        self.code = code
-        self.detail = detail
-
-    def as_dict(self) -> dict[str, Any]:
-        return {"code": self.code, "message": self.detail}
+_CACHE_VERSION = 1
 
 
 @dataclass(frozen=True)
 class Recording:
+    """A validated recording; binary recordings keep ``frames`` in a memory map.
+
+    Binary recordings have no per-entry ``schedule``: their frames are raw
+    captures rather than example references, and listing them must not read
+    every frame.
+    """
+
     identifier: str
     title: str
     description: str
     duration_ms: int
-    frames: tuple[CarrierFrame, ...]
+    frames: Sequence[CarrierFrame]
     schedule: tuple[dict[str, Any], ...]
 
+    def close(self) -> None:
+        """Release a binary recording's memory map; JSON frames need no closing."""
+        if isinstance(self.frames, MappedFrames):
+            self.frames.close()
+
+    @property
+    def offsets(self) -> Sequence[int]:
+        """Scheduled offsets in frame order, for the replay transport's seek."""
+        if isinstance(self.frames, MappedFrames):
+            return self.frames.offsets
+        return tuple(item.at_ms for item in self.frames)
+
     def summary(self) -> dict[str, Any]:
         return {
             "id": self.identifier,
@@ -44,62 +58,216 @@ class Recording:
 
 
 class RecordingCatalog:
-    """Load static recording JSON and resolve its released example references."""
+    """Load static recording JSON and resolve its released example references.
+
+    Construction parses each JSON file, which is bounded to five minutes of
+    entries, but checks only its metadata; a binary file is read only up to
+    its index. A JSON recording's entries are validated and resolved on its
+    first ``get``, outside the catalogue lock, so listing never waits on it. With ``cache_root``, the
+    resolved frames are also written to disk under the file's SHA-256 and the
+    authority version, so an unchanged recording is not resolved again after
+    a restart. Binary ``.pprec`` recordings are opened by their metadata and
+    index only and closed again; ``get`` maps one for replay, and ``release``
+    closes that map once replay moves to another recording.
+    """
 
     def __init__(
         self,
         root: Path,
         authority_version: str,
         resolver: Callable[..., dict[str, Any]],
+        cache_root: Path | None = None,
     ) -> None:
         self.root = root.resolve()
         self.authority_version = authority_version
         self.resolver = resolver
-        self._recordings = self._load_all()
+        self.cache_root = cache_root.resolve() if cache_root is not None else None
+        self._lock = threading.Lock()
+        self._paths: dict[str, Path] = {}
+        self._summaries: dict[str, dict[str, Any]] = {}
+        self._recordings: dict[str, Recording] = {}
+        # One lock per identifier being resolved, so concurrent first gets resolve once.
+        self._resolving: dict[str, threading.Lock] = {}
+        self._scan_all()
 
     def list(self) -> list[dict[str, Any]]:
-        return [item.summary() for item in self._recordings.values()]
+        """Summarize every recording from its metadata; entry schedules come from ``get``."""
+        with self._lock:
+            return [dict(item) for item in self._summaries.values()]
 
     def get(self, identifier: str) -> Recording:
-        item = self._recordings.get(identifier)
-        if item is None:
-            raise RecordingError("RECORDING_NOT_FOUND", f"No recording is named {identifier!r}.")
-        return item
+        with self._lock:
+            item = self._recordings.get(identifier)
+            if item is not None:
+                return item
+            path = self._paths.get(identifier)
+            if path is None:
+                raise RecordingError("RECORDING_NOT_FOUND", f"No recording is named {identifier!r}.")
+            once = self._resolving.setdefault(identifier, threading.Lock())
+        with once:
+            with self._lock:
+                item = self._recordings.get(identifier)
+            if item is not None:
+                return item
+            item = self._resolve(path)
+            with self._lock:
+                self._recordings[identifier] = item
+                self._summaries[identifier] = self._summary(item)
+                self._resolving.pop(identifier, None)
+            return item
+
+    def release(self, identifier: str) -> None:
+        """Close a binary recording's memory map; the next ``get`` maps it again."""
+        with self._lock:
+            item = self._recordings.get(identifier)
+            if item is None or not isinstance(item.frames, MappedFrames):
+                return
+            del self._recordings[identifier]
+        item.close()
 
-    def _load_all(self) -> dict[str, Recording]:
-        paths = sorted(self.root.glob("*.json")) if self.root.is_dir() else []
+    def close(self) -> None:
+        """Close every memory map the catalog holds."""
+        with self._lock:
+            mapped = [item for item in self._recordings.values() if isinstance(item.frames, MappedFrames)]
+            for item in mapped:
+                del self._recordings[item.identifier]
+        for item in mapped:
+            item.close()
+
+    def _scan_all(self) -> None:
+        paths = sorted([*self.root.glob("*.json"), *self.root.glob(f"*{SUFFIX}")]) if self.root.is_dir() else []
         if not paths:
-            raise RecordingError("RECORDING_CATALOG_EMPTY", f"No recording JSON files exist in {self.root}.")
-        result = {}
+            raise RecordingError("RECORDING_CATALOG_EMPTY", f"No recording files exist in {self.root}.")
         for path in paths:
-            item = self._load(path)
-            if item.identifier in result:
-                raise RecordingError("RECORDING_ID_DUPLICATE", f"Duplicate recording id {item.identifier!r}.")
-            result[item.identifier] = item
-        return result
+            if path.suffix == SUFFIX:
+                item = self._load_binary(path)
+                summary = self._summary(item)
+                item.close()
+            else:
+                data = self._parse(path, self._read(path))
+                summary = {
+                    "id": data["id"],
+                    "title": data["title"].strip(),
+                    "description": data["description"].strip(),
+                    "duration_ms": data["duration_ms"],
+                    "frame_count": len(data["entries"]),
+                }
+            if summary["id"] in self._paths:
+                raise RecordingError("RECORDING_ID_DUPLICATE", f"Duplicate recording id {summary['id']!r}.")
+            self._paths[summary["id"]] = path
+            self._summaries[summary["id"]] = summary
+
+    @staticmethod
+    def _summary(item: Recording) -> dict[str, Any]:
+        summary = item.summary()
+        del summary["schedule"]
+        return summary
 
-    def _load(self, path: Path) -> Recording:
+    @staticmethod
+    def _read(path: Path) -> bytes:
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError) as exc:
+            return path.read_bytes()
+        except OSError as exc:
             raise RecordingError("RECORDING_JSON", f"Cannot read {path}: {exc}") from exc
-        if not isinstance(data, dict):
-            raise RecordingError("RECORDING_SHAPE", f"{path}: root must be an object.")
-        required = {
-            "schema_version",
-            "id",
-            "title",
-            "description",
-            "authority_version",
-            "frame_mode",
-            "duration_ms",
-            "entries",
-        }
-        if set(data) != required:
-            raise RecordingError(
-                "RECORDING_FIELDS",
-                f"{path}: expected fields {sorted(required)}, found {sorted(data)}.",
+
+    def _resolve(self, path: Path) -> Recording:
+        if path.suffix == SUFFIX:
+            return self._load_binary(path)
+        raw = self._read(path)
+        data = self._parse(path, raw)
+        digest = hashlib.sha256(raw).hexdigest()
+        item = self._read_cache(data, digest)
+        if item is None:
+            item = self._load(path, data)
+            self._write_cache(item, digest)
+        return item
+
+    def _cache_path(self, identifier: str) -> Path | None:
+        return self.cache_root / f"{identifier}.json" if self.cache_root is not None else None
+
+    def _read_cache(self, data: dict[str, Any], digest: str) -> Recording | None:
+        path = self._cache_path(data["id"])
+        if path is None:
+            return None
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+            if (
+                cached["cache_version"] != _CACHE_VERSION
+                or cached["content_sha256"] != digest
+                or cached["authority_version"] != self.authority_version
+            ):
+                return None
+            frames = tuple(
+                CarrierFrame(
+                    sequence=sequence,
+                    at_ms=at_ms,
+                    direction=direction,
+                    frame=bytes.fromhex(frame_hex),
+                    frame_mode=frame_mode,
+                    recording_id=data["id"],
+                    fixture_id=fixture_id,
+                    note=note,
+                )
+                for sequence, (at_ms, direction, frame_hex, frame_mode, fixture_id, note) in enumerate(
+                    cached["frames"]
+                )
             )
+            schedule = tuple(cached["schedule"])
+        except (OSError, ValueError, KeyError, TypeError):
+            # A missing, stale, or damaged entry only means resolving again.
+            return None
+        return Recording(
+            identifier=data["id"],
+            title=data["title"].strip(),
+            description=data["description"].strip(),
+            duration_ms=data["duration_ms"],
+            frames=frames,
+            schedule=schedule,
+        )
+
+    def _write_cache(self, item: Recording, digest: str) -> None:
+        path = self._cache_path(item.identifier)
+        if path is None:
+            return
+        cached = {
+            "cache_version": _CACHE_VERSION,
+            "content_sha256": digest,
+            "authority_version": self.authority_version,
+            "frames": [
+                [frame.at_ms, frame.direction, frame.frame.hex(), frame.frame_mode, frame.fixture_id, frame.note]
+                for frame in item.frames
+            ],
+            "schedule": list(item.schedule),
+        }
+        partial = path.with_name(path.name + ".partial")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            partial.write_text(json.dumps(cached), encoding="utf-8")
+            os.replace(partial, path)
+        except OSError:
+            # The cache is an optimization; an unwritable one costs a resolve next start.
+            partial.unlink(missing_ok=True)
+
+    def _load_binary(self, path: Path) -> Recording:
+        data, frames = open_recording(path)
+        try:
+            self._check_metadata(path, data)
+        except BaseException:
+            frames.close()
+            raise
+        # The index bounds each chunk's first frame by duration_ms, and a chunk's
+        # own check bounds the rest when it is read, so no frame is read here.
+        return Recording(
+            identifier=data["id"],
+            title=data["title"].strip(),
+            description=data["description"].strip(),
+            duration_ms=data["duration_ms"],
+            frames=frames,
+            schedule=(),
+        )
+
+    def _check_metadata(self, path: Path, data: dict[str, Any]) -> None:
+        """Check the fields JSON and binary recordings share."""
         if data["schema_version"] != 1:
             raise RecordingError("RECORDING_SCHEMA", f"{path}: schema_version must be 1.")
         identifier = data["id"]
@@ -117,12 +285,43 @@ class RecordingCatalog:
             )
         if data["frame_mode"] not in {"logical", "fixed"}:
             raise RecordingError("RECORDING_MODE", f"{path}: frame_mode must be logical or fixed.")
+
+    def _parse(self, path: Path, raw: bytes) -> dict[str, Any]:
+        """Check a JSON recording's metadata and entry list, leaving entries unresolved."""
+        try:
+            data = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise RecordingError("RECORDING_JSON", f"Cannot read {path}: {exc}") from exc
+        if not isinstance(data, dict):
+            raise RecordingError("RECORDING_SHAPE", f"{path}: root must be an object.")
+        required = {
+            "schema_version",
+            "id",
+            "title",
+            "description",
+            "authority_version",
+            "frame_mode",
+            "duration_ms",
+            "entries",
+        }
+        if set(data) != required:
+            raise RecordingError(
+                "RECORDING_FIELDS",
+                f"{path}: expected fields {sorted(required)}, found {sorted(data)}.",
+            )
+        self._check_metadata(path, data)
         duration_ms = data["duration_ms"]
         if not isinstance(duration_ms, int) or isinstance(duration_ms, bool) or not 0 <= duration_ms <= 300_000:
             raise RecordingError("RECORDING_DURATION", f"{path}: duration_ms must be an integer from 0 to 300000.")
         entries = data["entries"]
         if not isinstance(entries, list) or not entries:
             raise RecordingError("RECORDING_ENTRIES", f"{path}: entries must be a non-empty array.")
+        return data
+
+    def _load(self, path: Path, data: dict[str, Any]) -> Recording:
+        identifier = data["id"]
+        duration_ms = data["duration_ms"]
+        entries = data["entries"]
 
         frames = []
         schedule = []
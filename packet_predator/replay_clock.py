@@ -0,0 +1,90 @@
+"""Server-side clock that releases a playing recording's frames when they are due."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable
+
+from .transport import DeterministicReplayTransport
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayClock:
+    """Wake at the next frame's scheduled time while, and only while, replay plays.
+
+    The thread starts on an explicit play and exits as soon as the recording
+    is paused, reset, reselected, or complete. It decides nothing: it asks the
+    transport when the next frame is due and then calls ``release``, which
+    polls the transport and publishes through the model. Controls call
+    ``kick`` so the wait is recomputed after any change to position or speed.
+
+    If ``release`` raises, the clock logs the exception, halts the transport
+    so its status reports ``last_error``, and passes the error to ``fault``.
+    """
+
+    def __init__(
+        self,
+        transport: DeterministicReplayTransport,
+        release: Callable[[], object],
+        fault: Callable[[dict[str, Any]], object] | None = None,
+    ) -> None:
+        self._transport = transport
+        self._release = release
+        self._fault = fault
+        self._condition = threading.Condition(threading.Lock())
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def running(self) -> bool:
+        with self._condition:
+            return self._thread is not None and self._thread.is_alive()
+
+    def kick(self) -> None:
+        """Recompute the next wakeup; start the thread if a recording is playing."""
+        with self._condition:
+            if self._closed:
+                return
+            self._condition.notify()
+            if self._thread is not None or self._transport.next_due_s() is None:
+                return
+            # Replay holds no hardware, so an unclosed test service cannot block exit.
+            self._thread = threading.Thread(target=self._run, name="PacketPredatorReplayClock", daemon=True)
+            self._thread.start()
+
+    def close(self, timeout_s: float = 2.0) -> None:
+        with self._condition:
+            self._closed = True
+            thread = self._thread
+            self._condition.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout_s)
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._condition:
+                    delay = None if self._closed else self._transport.next_due_s()
+                    if delay is None:
+                        # Cleared under the same lock kick checks, so a new play never finds a dying thread.
+                        self._thread = None
+                        return
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+                try:
+                    self._release()
+                except Exception as exc:
+                    # Paused, not retried: a release that keeps failing would otherwise spin.
+                    logger.exception("Replay release failed; pausing playback.")
+                    error = {"code": "REPLAY_RELEASE_FAILED", "message": str(exc) or type(exc).__name__}
+                    self._transport.halt(error)
+                    if self._fault is not None:
+                        self._fault(error)
+        finally:
+            with self._condition:
+                if self._thread is threading.current_thread():
+                    self._thread = None
@@ -8,16 +8,21 @@ from collections import OrderedDict
 import json
 import os
 from pathlib import Path
-from typing import Any, Callable
+import time
+from typing import Any, Callable, Mapping
 from uuid import uuid4
 
 from . import WORKBENCH_INTERFACE_VERSION, __version__
-from .model import WorkbenchModel
-from .replay import Recording, RecordingCatalog
+from .adapters.nrf905 import Nrf905Error
+from .capture_store import CaptureStore
+from .latency import LatencyHistogram, ReceiveLatency
+from .model import INDEX_BYTES_PER_RECORD, WorkbenchModel
+from .replay import Recording, RecordingCatalog, RecordingError
+from .replay_clock import ReplayClock
 from .nrf905_transport import Nrf905Transport
 from .receiver import PhysicalReceiver
 from .transport import CarrierFrame, DeterministicReplayTransport, InspectOnlyTransport, ReceiveTransport, TransportError
-from .wire_adapter import WireAdapter
+from .wire_adapter import InspectionError, WireAdapter
 
 
 class WorkbenchService:
@@ -30,15 +35,27 @@ class WorkbenchService:
         replay_carrier: DeterministicReplayTransport | None = None,
         recording_root: Path | None = None,
         model: WorkbenchModel | None = None,
+        capture_budget_bytes: int = 0,
+        recording_cache: Path | None = None,
     ) -> None:
         self.wire = wire or WireAdapter()
         self.carrier = carrier or InspectOnlyTransport()
         self.replay_carrier = replay_carrier or DeterministicReplayTransport()
-        self.model = model or WorkbenchModel()
+        self.model = model or WorkbenchModel(
+            capture_store=(
+                CaptureStore(capture_budget_bytes, self.wire.inspect_bytes, INDEX_BYTES_PER_RECORD)
+                if capture_budget_bytes
+                else None
+            )
+        )
         root = recording_root or Path(__file__).resolve().parents[1] / "recordings"
-        self.recordings = RecordingCatalog(root, self.wire.version, self.wire.resolve_example)
+        self.recordings = RecordingCatalog(root, self.wire.version, self.wire.resolve_example, recording_cache)
         self._active_recording: Recording | None = None
         self._lock = threading.RLock()
+        # Held from each replay release until its frames are published, so the
+        # journal keeps recording order whichever thread released them.
+        self._replay_lock = threading.Lock()
+        self._replay_clock = ReplayClock(self.replay_carrier, self._release_replay, self._report_replay_fault)
         self._closed = False
         self.process_instance_id = f"pp-{uuid4()}"
         self.build_id = os.environ.get("PACKET_PREDATOR_BUILD_ID", "unknown")
@@ -47,8 +64,21 @@ class WorkbenchService:
         ] = OrderedDict()
         self._transmit_in_progress: dict[str, tuple[str, str, str]] = {}
         self._transmit_result_capacity = 256
+        self._transmit_outcomes: dict[str, int] = {}
+        self._armed: dict[str, Any] | None = None
+        # Serializes arm, fire, and disarm; always taken before self._lock.
+        self._arm_lock = threading.Lock()
+        self.fire_to_pulse = LatencyHistogram()
+        self.latency = ReceiveLatency()
+        # Written under self._replay_lock, or by a benchmark's single thread.
+        self.replay_latency = {"inspect": LatencyHistogram(), "publish": LatencyHistogram()}
         self._receiver = (
-            PhysicalReceiver(self.carrier, self.consume_physical, self.model.set_receiver_state)
+            PhysicalReceiver(
+                self.carrier,
+                self.consume_physical,
+                self.model.set_receiver_state,
+                latency=self.latency,
+            )
             if isinstance(self.carrier, Nrf905Transport)
             else None
         )
@@ -66,9 +96,11 @@ class WorkbenchService:
             if self._closed:
                 return
             receiver = self._receiver
+        self._replay_clock.close()
         if receiver is not None:
             receiver.stop()
             self.carrier.close()
+        self.recordings.close()
         with self._lock:
             self._closed = True
 
@@ -86,10 +118,33 @@ class WorkbenchService:
             "carrier": self.replay_carrier.status() if active else self.carrier.status(),
             "authority": self.wire.status(),
             "journal_entries": snapshot["journal"]["count"],
+            "capture_store": self.model.capture_status(),
             "replay_available": True,
             "recording_count": len(self.recordings.list()),
             "physical_adapter": self.carrier.status() if isinstance(self.carrier, Nrf905Transport) else None,
             "receiver": snapshot["receiver"],
+            "receive_pipeline": self._receiver.stats() if self._receiver is not None else None,
+            "receive_latency": self.latency.summary() if self._receiver is not None else None,
+        }
+
+    def metrics(self) -> dict[str, Any]:
+        """Collect the counters behind ``/metrics`` without touching the radio."""
+        with self._lock:
+            transmit_outcomes = dict(self._transmit_outcomes)
+        device = self.carrier.device if isinstance(self.carrier, Nrf905Transport) else None
+        return {
+            "receiver": self.model.snapshot()["receiver"],
+            **self.model.counters(),
+            "decode_cache": self.wire.status()["decode_cache"],
+            "replay": self.replay_carrier.status(),
+            "replay_release_lag": self.replay_carrier.release_lag,
+            "replay_stages": self.replay_latency,
+            "transmit_outcomes": transmit_outcomes,
+            "transmit_elapsed": device.transmit_elapsed if device is not None else None,
+            "fire_to_pulse": self.fire_to_pulse if device is not None else None,
+            "spi_exchanges": device.spi_exchanges if device is not None else None,
+            "receive_pipeline": self._receiver.stats() if self._receiver is not None else None,
+            "receive_latency": self.latency.stages if self._receiver is not None else None,
         }
 
     def catalog(self) -> dict[str, Any]:
@@ -124,15 +179,46 @@ class WorkbenchService:
         result = self.wire.inspect(frame_text, mode)
         return self._store(result, origin.strip()[:120] or "pasted frame", None)
 
+    def inspect_many(
+        self,
+        frames: list[str],
+        mode: str,
+        origin: str = "pasted batch",
+    ) -> dict[str, Any]:
+        """Decode a list of frame texts and journal every valid one under one revision."""
+
+        label = origin.strip()[:120] or "pasted batch"
+        results: list[dict[str, Any]] = []
+        accepted: list[tuple[int, dict[str, Any]]] = []
+        for index, frame_text in enumerate(frames):
+            try:
+                result = self.wire.inspect(frame_text, mode)
+            except InspectionError as exc:
+                results.append({"index": index, "accepted": False, "error": exc.as_dict()})
+            except self.wire.codec_error as exc:
+                results.append({"index": index, "accepted": False, "error": exc.as_dict()})
+            else:
+                accepted.append((index, self._entry(result, label, None)))
+                results.append({"index": index, "accepted": True, "inspection": None})
+        stored = self.model.publish_many([entry for _, entry in accepted])
+        for (index, _), entry in zip(accepted, stored):
+            results[index]["inspection"] = entry
+        return {
+            "count": len(frames),
+            "accepted_count": len(accepted),
+            "rejected_count": len(frames) - len(accepted),
+            "results": results,
+        }
+
     def inspect_draft(self, frame_text: str, mode: str) -> dict[str, Any]:
         """Decode draft bytes without adding them to the observation journal."""
 
         result = self.wire.inspect(frame_text, mode)
-        result["editor_values"] = self.wire.editor_values(
-            result["meaning"]["name"],
-            result["body"],
-        )
-        return result
+        # A shallow copy; the cached inspection underneath stays shared and read-only.
+        return {
+            **result,
+            "editor_values": self.wire.editor_values(result["meaning"]["name"], result["body"]),
+        }
 
     def replay_catalog(self) -> dict[str, Any]:
         return {
@@ -143,14 +229,56 @@ class WorkbenchService:
         }
 
     def select_replay(self, identifier: str) -> dict[str, Any]:
-        item = self.recordings.get(identifier)
-        self.replay_carrier.load(item.identifier, item.title, item.duration_ms, item.frames)
-        with self._lock:
-            self._active_recording = item
-        return self._replay_response([])
-
-    def control_replay(self, action: str, speed: float | None = None) -> dict[str, Any]:
+        self.recordings.get(identifier)
+        with self._replay_lock:
+            # Resolved above, outside the lock; fetched again here because a
+            # concurrent selection may have released the map in between.
+            item = self.recordings.get(identifier)
+            self.replay_carrier.load(item.identifier, item.title, item.duration_ms, item.frames, item.offsets)
+            with self._lock:
+                previous, self._active_recording = self._active_recording, item
+            if previous is not None and previous.identifier != item.identifier:
+                self.recordings.release(previous.identifier)
+            response = self._replay_response([])
+        self._replay_clock.kick()
+        return response
+
+    def control_replay(
+        self,
+        action: str,
+        speed: float | None = None,
+        position_ms: float | None = None,
+        skipped: str = "skip",
+    ) -> dict[str, Any]:
+        """Apply one playback control; while playing, the replay clock releases later frames.
+
+        ``seek`` either drops the frames it jumps over (``skipped="skip"``) or
+        publishes them together under one model revision (``"batch"``).
+        """
+        if action == "seek":
+            if position_ms is None:
+                raise TransportError("REPLAY_POSITION", "Choose a position before seeking.")
+            if skipped not in {"skip", "batch"}:
+                raise TransportError("REPLAY_SKIPPED", "Skipped frames must be 'skip' or 'batch'.")
+        with self._replay_lock:
+            try:
+                response = self._control_replay_locked(action, speed, position_ms, skipped)
+            except RecordingError as exc:
+                self._fail_replay(exc)
+                raise
+        self._replay_clock.kick()
+        return response
+
+    def _control_replay_locked(
+        self,
+        action: str,
+        speed: float | None,
+        position_ms: float | None,
+        skipped: str,
+    ) -> dict[str, Any]:
         delivered = []
+        jumped = []
+        skipped_count = 0
         if speed is not None:
             delivered.extend(self.replay_carrier.set_speed(speed))
         if action == "play":
@@ -161,15 +289,54 @@ class WorkbenchService:
             delivered.extend(self.replay_carrier.step())
         elif action == "reset":
             delivered.extend(self.replay_carrier.reset())
+        elif action == "seek":
+            before = self.replay_carrier.status()["cursor"]
+            # Publish only what the journal would keep anyway; a long jump must not stall
+            # replay and every model reader behind one enormous batch.
+            jumped = self.replay_carrier.seek(
+                position_ms,
+                include_skipped=skipped == "batch",
+                skipped_limit=self.model.retention,
+            )
+            skipped_count = max(0, self.replay_carrier.status()["cursor"] - before)
         elif action == "speed":
             if speed is None:
                 raise TransportError("REPLAY_SPEED", "Choose a speed before applying it.")
         else:
             raise TransportError("REPLAY_ACTION", f"Unsupported replay action {action!r}.")
-        return self._replay_response(delivered)
+        response = self._replay_response(delivered)
+        if jumped:
+            response["delivered"].extend(self._consume_batch(jumped))
+        if action == "seek" and skipped == "batch":
+            response["skipped"] = {"count": skipped_count, "published": len(jumped)}
+        return response
 
     def replay_state(self) -> dict[str, Any]:
-        return self._replay_response(self.replay_carrier.poll())
+        with self._replay_lock:
+            try:
+                frames = self.replay_carrier.poll()
+            except RecordingError as exc:
+                self._fail_replay(exc)
+                raise
+            return self._replay_response(frames)
+
+    def _release_replay(self) -> None:
+        with self._replay_lock:
+            try:
+                frames = self.replay_carrier.poll()
+            except RecordingError as exc:
+                # Pausing lets the replay clock exit; Play retries the same frame.
+                self._fail_replay(exc)
+                return
+            for item in frames:
+                self._consume(item)
+
+    def _fail_replay(self, exc: RecordingError) -> None:
+        self.replay_carrier.halt(exc.as_dict())
+        self._report_replay_fault(exc.as_dict())
+
+    def _report_replay_fault(self, error: dict[str, Any]) -> None:
+        self.model.report_replay_fault(error, self.replay_carrier.status())
 
     def transmit(
         self,
@@ -203,6 +370,7 @@ class WorkbenchService:
                     )
                 replay = dict(previous_result)
                 replay["replayed_result"] = True
+                self._transmit_outcomes["replayed"] = self._transmit_outcomes.get("replayed", 0) + 1
                 return replay
             in_progress = self._transmit_in_progress.get(identifier)
             if in_progress is not None:
@@ -258,11 +426,114 @@ class WorkbenchService:
             self._remember_transmit_result(identifier, signature, result)
             return result
         finally:
-            with self._lock:
-                self._transmit_in_progress.pop(identifier, None)
+            # Held across the publish, as in disarm, so an arm cannot slip its
+            # frame in between clearing the state and publishing the clear.
+            with self._arm_lock:
+                with self._lock:
+                    self._transmit_in_progress.pop(identifier, None)
+                    # transmit rewrites the TX payload, so any armed frame is gone.
+                    self._armed = None
+                self.model.set_armed(None)
             if receiver_running:
                 self.model.set_receiver_state("listening")
 
+    def arm(
+        self,
+        frame_text: str,
+        mode: str,
+        confirmed: bool,
+        provenance: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Validate and preload one frame so ``fire`` only has to pulse TRX_CE.
+
+        Confirmation is given here; ``fire`` sends exactly this frame once.
+        """
+        if not confirmed:
+            raise TransportError(
+                "TRANSMIT_CONFIRMATION_REQUIRED",
+                "Confirm this deliberate RF transmission in the workbench before arming it.",
+            )
+        frame = self.wire.fixed_frame(frame_text, mode)
+        carrier = self._physical_carrier()
+        with self._arm_lock:
+            with self._lock:
+                if self._transmit_in_progress:
+                    raise TransportError(
+                        "TRANSMIT_IN_PROGRESS",
+                        "Wait for the transmit in progress before arming another frame.",
+                    )
+                carrier.arm(frame)
+                self._armed = armed = {
+                    "arm_id": f"pp-arm-{uuid4()}",
+                    "frame_hex": frame.hex(),
+                    "provenance": None if provenance is None else dict(provenance),
+                }
+            visible = self.model.set_armed({"arm_id": armed["arm_id"], "frame_hex": armed["frame_hex"]})
+        return {"armed": visible["armed"], "carrier": carrier.status()}
+
+    def fire(self) -> dict[str, Any]:
+        """Send the armed frame and report the time from this call to the CE pulse.
+
+        The receiver state is not switched to ``transmitting`` first, so no
+        model publish sits between the request and the pulse.
+        """
+        fired_ns = time.monotonic_ns()
+        carrier = self._physical_carrier()
+        with self._arm_lock:
+            with self._lock:
+                armed = self._armed
+                self._armed = None
+            if armed is None:
+                raise TransportError("TRANSMIT_NOT_ARMED", "Arm a confirmed frame before firing it.")
+            try:
+                sent, timing = carrier.fire()
+            except Nrf905Error as exc:
+                if exc.code == "NRF905_NOT_ARMED":
+                    raise TransportError(
+                        "TRANSMIT_NOT_ARMED", "Arm a confirmed frame before firing it."
+                    ) from exc
+                error = exc.as_dict()
+            except Exception as exc:
+                error = {"code": "TRANSMISSION_OUTCOME_UNKNOWN", "message": str(exc)}
+            else:
+                error = None
+            finally:
+                self.model.set_armed(None)
+        result = {
+            "arm_id": armed["arm_id"],
+            "process_instance_id": self.process_instance_id,
+            "outcome": "unknown" if error else "sent",
+            "error": error,
+            "provenance": armed["provenance"],
+            "timing": None,
+            "delivered": [],
+        }
+        if error:
+            with self._lock:
+                self._transmit_outcomes["unknown"] = self._transmit_outcomes.get("unknown", 0) + 1
+            return result
+        fire_to_pulse_ns = timing["pulsed_ns"] - fired_ns
+        with self._lock:
+            self.fire_to_pulse.record(fire_to_pulse_ns)
+            self._transmit_outcomes["sent"] = self._transmit_outcomes.get("sent", 0) + 1
+        result["timing"] = {
+            "fire_to_pulse_us": round(fire_to_pulse_ns / 1000, 1),
+            "completion_us": timing["completion_us"],
+            "completion_source": timing["completion_source"],
+        }
+        result["carrier"] = carrier.status()
+        result["delivered"] = [self.consume_physical(sent)]
+        return result
+
+    def disarm(self) -> dict[str, Any]:
+        carrier = self._physical_carrier()
+        with self._arm_lock:
+            with self._lock:
+                self._armed = None
+            carrier.disarm()
+            visible = self.model.set_armed(None)
+        return {"armed": visible["armed"], "carrier": carrier.status()}
+
     def _remember_transmit_result(
         self,
         identifier: str,
@@ -270,6 +541,8 @@ class WorkbenchService:
         result: dict[str, Any],
     ) -> None:
         with self._lock:
+            outcome = result["outcome"]
+            self._transmit_outcomes[outcome] = self._transmit_outcomes.get(outcome, 0) + 1
             self._transmit_results[identifier] = (signature, dict(result))
             self._transmit_results.move_to_end(identifier)
             while len(self._transmit_results) > self._transmit_result_capacity:
@@ -278,6 +551,15 @@ class WorkbenchService:
     def journal(self) -> dict[str, Any]:
         return self.model.journal()
 
+    def journal_page(
+        self,
+        after: int | None,
+        before: int | None,
+        limit: int,
+        filters: dict[str, Any],
+    ) -> dict[str, Any]:
+        return self.model.journal_page(after, before, limit, filters)
+
     def inspection(self, identifier: str) -> dict[str, Any] | None:
         return self.model.inspection(identifier)
 
@@ -298,6 +580,12 @@ class WorkbenchService:
     def model_changes(self, revision: int) -> dict[str, Any]:
         return self.model.changes_since(revision)
 
+    def model_revision(self) -> int:
+        return self.model.revision
+
+    def model_events(self, revision: int) -> dict[str, Any]:
+        return self.model.encoded_changes_since(revision)
+
     def subscribe_to_model(self, callback: Callable[[int], None]) -> Callable[[], None]:
         return self.model.subscribe(callback)
 
@@ -312,17 +600,39 @@ class WorkbenchService:
         }
 
     def _consume(self, item: CarrierFrame) -> dict[str, Any]:
-        result = self.wire.inspect(item.frame.hex(), item.frame_mode)
-        capture = {
+        started_ns = time.monotonic_ns()
+        # Binary recordings hold raw captures, which are not validated until released.
+        result = self._inspect_captured(item.frame, item.frame_mode, "Invalid replay frame")
+        inspected_ns = time.monotonic_ns()
+        stored = self._store(result, f"recording: {item.recording_id}", self._replay_capture(item))
+        self.replay_latency["inspect"].record(inspected_ns - started_ns)
+        self.replay_latency["publish"].record(time.monotonic_ns() - inspected_ns)
+        return stored
+
+    def _consume_batch(self, items: list[CarrierFrame]) -> list[dict[str, Any]]:
+        """Publish replay frames as one ``observations`` change; seek uses this for skipped frames."""
+        entries = [
+            self._entry(
+                self._inspect_captured(item.frame, item.frame_mode, "Invalid replay frame"),
+                f"recording: {item.recording_id}",
+                self._replay_capture(item),
+            )
+            for item in items
+        ]
+        return self.model.publish_many(entries)
+
+    @staticmethod
+    def _replay_capture(item: CarrierFrame) -> dict[str, Any]:
+        return {
             "transport": "deterministic-replay",
             "recording_id": item.recording_id,
             "sequence": item.sequence,
             "scheduled_at_ms": item.at_ms,
+            "release_lag_ms": item.release_lag_ms,
             "direction": item.direction,
             "fixture_id": item.fixture_id,
             "note": item.note,
         }
-        return self._store(result, f"recording: {item.recording_id}", capture)
 
     def consume_physical(self, item: CarrierFrame) -> dict[str, Any]:
         carrier = self._physical_carrier()
@@ -331,21 +641,37 @@ class WorkbenchService:
             "profile_id": carrier.profile.identifier,
             "sequence": item.sequence,
             "observed_at_ms": item.at_ms,
+            "captured_ns": item.captured_ns,
+            "capture_clock": item.capture_clock,
             "direction": item.direction,
             "note": item.note,
         }
+        started_ns = time.monotonic_ns()
+        result = self._inspect_captured(item.frame, "fixed", "Invalid physical frame")
+        if item.direction != "received":
+            return self._store(result, f"nrf905: {carrier.profile.identifier}", capture)
+        inspected_ns = time.monotonic_ns()
+        stored = self._store(result, f"nrf905: {carrier.profile.identifier}", capture)
+        published_ns = time.monotonic_ns()
+        self.latency.record("inspect", inspected_ns - started_ns)
+        self.latency.record("publish", published_ns - inspected_ns)
+        # Read straight after publish; a browser inspection in between mislabels one sample at most.
+        self.latency.published(self.model.revision, published_ns)
+        return stored
+
+    def _inspect_captured(self, frame: bytes, mode: str, invalid_title: str) -> Mapping[str, Any]:
+        """Decode captured bytes, journaling a frame that fails inspection instead of raising."""
         try:
-            result = self.wire.inspect(item.frame.hex(), "fixed")
+            return self.wire.inspect_bytes(frame, mode)
         except self.wire.codec_error as exc:
-            result = {
-                "title": "Invalid physical frame",
+            return {
+                "title": invalid_title,
                 "summary": exc.message,
-                "received_frame_hex": item.frame.hex(),
-                "received_bytes": len(item.frame),
-                "family": {"id": "invalid", "label": "Invalid frame"},
+                "received_frame_hex": frame.hex(),
+                "received_bytes": len(frame),
+                "family": {"key": "invalid", "label": "Invalid frame"},
                 "inspection_error": exc.as_dict(),
             }
-        return self._store(result, f"nrf905: {carrier.profile.identifier}", capture)
 
     def _physical_carrier(self) -> Nrf905Transport:
         if not isinstance(self.carrier, Nrf905Transport):
@@ -357,15 +683,22 @@ class WorkbenchService:
 
     def _store(
         self,
-        result: dict[str, Any],
+        result: Mapping[str, Any],
         origin: str,
         capture: dict[str, Any] | None,
     ) -> dict[str, Any]:
-        entry = {
+        return self.model.publish(self._entry(result, origin, capture))
+
+    @staticmethod
+    def _entry(
+        result: Mapping[str, Any],
+        origin: str,
+        capture: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        return {
             "id": uuid4().hex[:12],
             "observed_at": datetime.now(timezone.utc).isoformat(),
             "origin": origin,
             "capture": capture,
             **result,
         }
-        return self.model.publish(entry)
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Callable
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Sequence
+
+from .latency import LatencyHistogram
 
 
 class TransportError(RuntimeError):
@@ -23,7 +26,13 @@ class TransportError(RuntimeError):
 
 @dataclass(frozen=True)
 class CarrierFrame:
-    """One complete opaque frame plus capture provenance."""
+    """One complete opaque frame plus capture provenance.
+
+    Physical frames carry ``captured_ns`` on the ``time.monotonic_ns`` clock;
+    ``capture_clock`` says whether it came from the data_ready edge. Frames
+    released by a playing replay carry ``release_lag_ms``, how much later
+    than scheduled the release happened in wall-clock time.
+    """
 
     sequence: int
     at_ms: int
@@ -33,6 +42,9 @@ class CarrierFrame:
     recording_id: str
     fixture_id: str
     note: str
+    captured_ns: int | None = None
+    capture_clock: str | None = None
+    release_lag_ms: float | None = None
 
 
 class ReceiveTransport(ABC):
@@ -72,7 +84,8 @@ class DeterministicReplayTransport(ReceiveTransport):
         self._lock = threading.RLock()
         self._identifier: str | None = None
         self._title: str | None = None
-        self._frames: tuple[CarrierFrame, ...] = ()
+        self._frames: Sequence[CarrierFrame] = ()
+        self._offsets: Sequence[int] = ()
         self._duration_ms = 0
         self._cursor = 0
         self._position_ms = 0.0
@@ -80,14 +93,21 @@ class DeterministicReplayTransport(ReceiveTransport):
         self._state = "idle"
         self._anchor_clock = 0.0
         self._anchor_position_ms = 0.0
+        self._lag_ms = 0.0
+        self._max_lag_ms = 0.0
+        self._error: dict[str, Any] | None = None
+        # Written under self._lock; read without it by metrics scrapes.
+        self.release_lag = LatencyHistogram()
 
     def load(
         self,
         identifier: str,
         title: str,
         duration_ms: int,
-        frames: tuple[CarrierFrame, ...],
+        frames: Sequence[CarrierFrame],
+        offsets: Sequence[int] | None = None,
     ) -> None:
+        """Load a timetable; ``offsets`` lets a memory-mapped recording skip building one."""
         if not frames:
             raise TransportError("REPLAY_EMPTY", "A recording needs at least one frame.")
         if frames[-1].at_ms > duration_ms:
@@ -96,6 +116,7 @@ class DeterministicReplayTransport(ReceiveTransport):
             self._identifier = identifier
             self._title = title
             self._frames = frames
+            self._offsets = offsets if offsets is not None else tuple(item.at_ms for item in frames)
             self._duration_ms = duration_ms
             self._cursor = 0
             self._position_ms = 0.0
@@ -103,6 +124,9 @@ class DeterministicReplayTransport(ReceiveTransport):
             self._state = "ready"
             self._anchor_clock = 0.0
             self._anchor_position_ms = 0.0
+            self._lag_ms = 0.0
+            self._max_lag_ms = 0.0
+            self._error = None
 
     def status(self) -> dict[str, Any]:
         with self._lock:
@@ -121,6 +145,9 @@ class DeterministicReplayTransport(ReceiveTransport):
                 "position_ms": round(self._position_ms),
                 "duration_ms": self._duration_ms,
                 "speed": self._speed,
+                "lag_ms": round(self._lag_ms, 3),
+                "max_lag_ms": round(self._max_lag_ms, 3),
+                "last_error": self._error,
             }
 
     def play(self) -> list[CarrierFrame]:
@@ -130,6 +157,7 @@ class DeterministicReplayTransport(ReceiveTransport):
                 raise TransportError("REPLAY_COMPLETE", "Reset the recording before playing it again.")
             if self._state == "playing":
                 return self._advance_unlocked()
+            self._error = None
             self._state = "playing"
             self._anchor_clock = self._clock()
             self._anchor_position_ms = self._position_ms
@@ -151,6 +179,9 @@ class DeterministicReplayTransport(ReceiveTransport):
             self._state = "ready"
             self._anchor_clock = 0.0
             self._anchor_position_ms = 0.0
+            self._lag_ms = 0.0
+            self._max_lag_ms = 0.0
+            self._error = None
             return []
 
     def step(self) -> list[CarrierFrame]:
@@ -166,6 +197,52 @@ class DeterministicReplayTransport(ReceiveTransport):
             self._state = "complete" if self._cursor == len(self._frames) else "paused"
             return [item]
 
+    def seek(
+        self,
+        position_ms: float,
+        include_skipped: bool = False,
+        skipped_limit: int | None = None,
+    ) -> list[CarrierFrame]:
+        """Move to ``position_ms`` by binary search over the frame offsets.
+
+        Frames scheduled before the new position count as delivered; a frame
+        exactly at it is released next. Playback keeps its state, and a
+        finished recording becomes paused. Only with ``include_skipped`` are
+        the frames jumped over going forward returned, for the caller to
+        publish, and then only the newest ``skipped_limit`` of them.
+        """
+        with self._lock:
+            self._require_loaded()
+            if not 0 <= position_ms <= self._duration_ms:
+                raise TransportError(
+                    "REPLAY_POSITION", f"Seek position must be between 0 and {self._duration_ms} ms."
+                )
+            search = getattr(self._offsets, "bisect_left", None)
+            # Mapped offsets search their chunk index first and check only the chunk they land in.
+            cursor = search(position_ms) if search is not None else bisect_left(self._offsets, position_ms)
+            first = self._cursor
+            if skipped_limit is not None:
+                first = max(first, cursor - skipped_limit)
+            skipped = list(self._frames[first:cursor]) if include_skipped else []
+            self._cursor = cursor
+            self._position_ms = float(position_ms)
+            if cursor == len(self._frames):
+                self._position_ms = float(self._duration_ms)
+                self._state = "complete"
+            elif self._state == "playing":
+                self._anchor_clock = self._clock()
+                self._anchor_position_ms = self._position_ms
+            else:
+                self._state = "paused"
+            return skipped
+
+    def halt(self, error: dict[str, Any]) -> None:
+        """Pause after a frame could not be read; the cursor stays on that frame."""
+        with self._lock:
+            if self._state == "playing":
+                self._state = "paused"
+            self._error = error
+
     def set_speed(self, speed: float) -> list[CarrierFrame]:
         if speed not in {0.25, 0.5, 1.0, 2.0, 4.0}:
             raise TransportError("REPLAY_SPEED", "Replay speed must be 0.25, 0.5, 1, 2, or 4.")
@@ -182,6 +259,28 @@ class DeterministicReplayTransport(ReceiveTransport):
         with self._lock:
             return self._advance_unlocked()
 
+    def release_all(self) -> list[CarrierFrame]:
+        """Release every remaining frame at once, ignoring the schedule; for load generation."""
+        with self._lock:
+            self._require_loaded()
+            delivered = list(self._frames[self._cursor:])
+            self._cursor = len(self._frames)
+            self._position_ms = float(self._duration_ms)
+            self._state = "complete"
+            return delivered
+
+    def next_due_s(self) -> float | None:
+        """Clock seconds until the next frame is due, or ``None`` unless playing."""
+        with self._lock:
+            if self._state != "playing" or self._cursor >= len(self._frames):
+                return None
+            try:
+                due_ms = self._offsets[self._cursor] - self._anchor_position_ms
+            except Exception:
+                # An unreadable chunk is due now, so the next poll raises and playback pauses.
+                return 0.0
+            return max(0.0, self._anchor_clock + due_ms / 1000.0 / self._speed - self._clock())
+
     def _require_loaded(self) -> None:
         if self._identifier is None:
             raise TransportError("REPLAY_NOT_SELECTED", "Choose a recording before using playback controls.")
@@ -193,9 +292,25 @@ class DeterministicReplayTransport(ReceiveTransport):
         target = min(float(self._duration_ms), self._anchor_position_ms + elapsed_ms)
         self._position_ms = target
         delivered = []
-        while self._cursor < len(self._frames) and self._frames[self._cursor].at_ms <= target + 1e-6:
-            delivered.append(self._frames[self._cursor])
+        while self._cursor < len(self._frames):
+            try:
+                if self._offsets[self._cursor] > target + 1e-6:
+                    break
+                item = self._frames[self._cursor]
+            except Exception:
+                # A memory-mapped frame can fail its chunk check. Hand back what was
+                # already released; the next poll stops on the bad frame and raises.
+                if delivered:
+                    break
+                raise
+            lag_ms = max(0.0, target - item.at_ms) / self._speed
+            self.release_lag.record(round(lag_ms * 1_000_000))
+            delivered.append(replace(item, release_lag_ms=round(lag_ms, 3)))
             self._cursor += 1
+        if delivered:
+            # Wall-clock lateness of the newest frame released by this poll.
+            self._lag_ms = delivered[-1].release_lag_ms
+            self._max_lag_ms = max(self._max_lag_ms, self._lag_ms)
         if self._cursor == len(self._frames):
             self._position_ms = float(self._duration_ms)
             self._state = "complete"
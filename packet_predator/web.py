@@ -3,19 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from functools import lru_cache
-import json
+from dataclasses import dataclass
+from functools import lru_cache, partial
 import os
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import Annotated, Any, Callable, Literal
+from weakref import WeakKeyDictionary
 
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, StrictInt
 
 from . import __version__
+from .broadcast import ModelBroadcaster, coalesce
+from .metrics import CONTENT_TYPE, exposition
 from .service import WorkbenchService
 from .adapters.nrf905 import Nrf905Error
 from .nrf905_profile import Nrf905ProfileError, load_nrf905_profile
@@ -26,6 +30,7 @@ from .wire_adapter import AuthorityError, InspectionError
 
 
 _CONFIGURATION_ERRORS = (AuthorityError, RecordingError, Nrf905Error, Nrf905ProfileError, OSError)
+_broadcasters: WeakKeyDictionary[asyncio.AbstractEventLoop, ModelBroadcaster] = WeakKeyDictionary()
 
 
 class DecodeRequest(BaseModel):
@@ -34,13 +39,21 @@ class DecodeRequest(BaseModel):
     origin: str = Field(default="pasted frame", max_length=120)
 
 
+class BatchDecodeRequest(BaseModel):
+    frames: list[Annotated[str, Field(max_length=512)]] = Field(min_length=1, max_length=1024)
+    mode: Literal["auto", "logical", "fixed"] = "auto"
+    origin: str = Field(default="pasted batch", max_length=120)
+
+
 class ReplaySelectRequest(BaseModel):
     recording_id: str = Field(min_length=1, max_length=80, pattern=r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 
 
 class ReplayControlRequest(BaseModel):
-    action: Literal["play", "pause", "step", "reset", "speed"]
+    action: Literal["play", "pause", "step", "reset", "speed", "seek"]
     speed: Literal[0.25, 0.5, 1.0, 2.0, 4.0] | None = None
+    position_ms: StrictInt | None = Field(default=None, ge=0)
+    skipped: Literal["skip", "batch"] = "skip"
 
 
 DraftFieldName = Annotated[
@@ -80,6 +93,13 @@ class TransmitRequest(BaseModel):
     provenance: TransmitProvenance | None = None
 
 
+class ArmRequest(BaseModel):
+    frame_hex: str = Field(min_length=1, max_length=512)
+    mode: Literal["auto", "logical", "fixed"] = "auto"
+    confirmed: bool = False
+    provenance: TransmitProvenance | None = None
+
+
 class ComposeRequest(BaseModel):
     definition: str = Field(
         min_length=1,
@@ -92,13 +112,60 @@ class ComposeRequest(BaseModel):
     representation: Literal["logical", "fixed"] = "fixed"
 
 
+@dataclass(frozen=True)
+class _Executors:
+    """Bounded worker pools that keep synchronous service calls off the event loop.
+
+    Radio access is already serialized by the device lock, so one hardware
+    worker is enough and a slow SPI exchange can occupy at most that worker.
+    Codec work and cheap reads use separate pools so neither waits behind RF;
+    status and model state are reads, since adapter pin status takes the
+    transport's own lock rather than the hardware worker.
+    """
+
+    hardware: ThreadPoolExecutor
+    codec: ThreadPoolExecutor
+    reads: ThreadPoolExecutor
+
+    def shutdown(self) -> None:
+        for pool in (self.hardware, self.codec, self.reads):
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+@lru_cache(maxsize=1)
+def _executors() -> _Executors:
+    return _Executors(
+        hardware=ThreadPoolExecutor(max_workers=1, thread_name_prefix="PacketPredatorHardware"),
+        codec=ThreadPoolExecutor(max_workers=2, thread_name_prefix="PacketPredatorCodec"),
+        reads=ThreadPoolExecutor(max_workers=4, thread_name_prefix="PacketPredatorReads"),
+    )
+
+
+async def _offload(pool: str, function: Callable[..., Any], *args: Any) -> Any:
+    executor = getattr(_executors(), pool)
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(function, *args))
+
+
+def _broadcaster(service: WorkbenchService) -> ModelBroadcaster:
+    loop = asyncio.get_running_loop()
+    hub = _broadcasters.get(loop)
+    if hub is None or hub.service is not service:
+        if hub is not None:
+            hub.close()
+        hub = _broadcasters[loop] = ModelBroadcaster(service)
+    return hub
+
+
 @lru_cache(maxsize=1)
 def _service() -> WorkbenchService:
     configured = os.environ.get("PACKET_PREDATOR_ADAPTER_PROFILE")
+    budget = int(os.environ.get("PACKET_PREDATOR_CAPTURE_BUDGET_MB", "0")) * 1024 * 1024
+    cache = os.environ.get("PACKET_PREDATOR_RECORDING_CACHE")
+    options = {"capture_budget_bytes": budget, "recording_cache": Path(cache) if cache else None}
     if not configured:
-        return WorkbenchService()
+        return WorkbenchService(**options)
     profile = load_nrf905_profile(Path(configured))
-    return WorkbenchService(carrier=open_nrf905_transport(profile))
+    return WorkbenchService(carrier=open_nrf905_transport(profile), **options)
 
 
 def _unavailable(exc: Exception) -> JSONResponse:
@@ -126,6 +193,13 @@ async def _lifespan(application: FastAPI):
     try:
         yield
     finally:
+        hub = _broadcasters.pop(asyncio.get_running_loop(), None)
+        if hub is not None:
+            hub.close()
+        # Let queued hardware work finish before the radio is released.
+        if _executors.cache_info().currsize:
+            _executors().shutdown()
+        _executors.cache_clear()
         if service is not None:
             service.close()
         _service.cache_clear()
@@ -142,15 +216,31 @@ app = FastAPI(
 @app.get("/api/status")
 async def status():
     try:
-        return _service().status()
+        result = await _offload("reads", _service().status)
+    except _CONFIGURATION_ERRORS as exc:
+        return _unavailable(exc)
+    hub = _broadcasters.get(asyncio.get_running_loop())
+    result["event_streams"] = hub.stats() if hub is not None else None
+    return result
+
+
+@app.get("/metrics")
+async def metrics():
+    try:
+        collected = await _offload("reads", _service().metrics)
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
+    hub = _broadcasters.get(asyncio.get_running_loop())
+    return Response(
+        exposition(collected, hub.stats() if hub is not None else None),
+        media_type=CONTENT_TYPE,
+    )
 
 
 @app.get("/api/v1/catalog")
 async def catalog():
     try:
-        return _service().catalog()
+        return await _offload("reads", _service().catalog)
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
 
@@ -158,7 +248,7 @@ async def catalog():
 @app.get("/api/v1/examples")
 async def examples():
     try:
-        return _service().examples()
+        return await _offload("reads", _service().examples)
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
 
@@ -166,7 +256,7 @@ async def examples():
 @app.get("/api/v1/editor/messages")
 async def editor_messages():
     try:
-        return _service().editor_messages()
+        return await _offload("reads", _service().editor_messages)
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
 
@@ -174,7 +264,7 @@ async def editor_messages():
 @app.get("/api/v1/editor/messages/{message_name}")
 async def editor_message(message_name: str):
     try:
-        return _service().editor_message(message_name)
+        return await _offload("reads", _service().editor_message, message_name)
     except InspectionError as exc:
         return JSONResponse(status_code=404, content={"error": exc.as_dict()})
     except _CONFIGURATION_ERRORS as exc:
@@ -188,7 +278,9 @@ async def compose(request: ComposeRequest):
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
     try:
-        return service.compose(
+        return await _offload(
+            "codec",
+            service.compose,
             request.definition,
             request.source,
             request.destination,
@@ -208,7 +300,7 @@ async def inspect_editor_draft(request: DecodeRequest):
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
     try:
-        return service.inspect_draft(request.frame_hex, request.mode)
+        return await _offload("codec", service.inspect_draft, request.frame_hex, request.mode)
     except InspectionError as exc:
         return JSONResponse(status_code=422, content={"error": exc.as_dict()})
     except service.wire.codec_error as exc:
@@ -222,17 +314,57 @@ async def inspect(request: DecodeRequest):
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
     try:
-        return service.inspect(request.frame_hex, request.mode, request.origin)
+        return await _offload(
+            "codec", service.inspect, request.frame_hex, request.mode, request.origin
+        )
     except InspectionError as exc:
         return JSONResponse(status_code=422, content={"error": exc.as_dict()})
     except service.wire.codec_error as exc:
         return JSONResponse(status_code=422, content={"error": exc.as_dict()})
 
 
+@app.post("/api/v1/inspect/batch")
+async def inspect_batch(request: BatchDecodeRequest):
+    try:
+        return await _offload(
+            "codec", _service().inspect_many, request.frames, request.mode, request.origin
+        )
+    except _CONFIGURATION_ERRORS as exc:
+        return _unavailable(exc)
+
+
 @app.get("/api/inspections")
 async def journal():
     try:
-        return _service().journal()
+        return await _offload("reads", _service().journal)
+    except _CONFIGURATION_ERRORS as exc:
+        return _unavailable(exc)
+
+
+@app.get("/api/v1/journal")
+async def journal_page(
+    after: Annotated[int | None, Query(ge=0)] = None,
+    before: Annotated[int | None, Query(ge=0)] = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    family: Annotated[str | None, Query(max_length=64)] = None,
+    message_type: Annotated[int | None, Query(ge=0, le=255)] = None,
+    source: Annotated[int | None, Query(ge=0, le=255)] = None,
+    destination: Annotated[int | None, Query(ge=0, le=255)] = None,
+    direction: Literal["received", "sent"] | None = None,
+    transport: Annotated[str | None, Query(max_length=64)] = None,
+    invalid_only: bool = False,
+):
+    filters = {
+        "family": family,
+        "message_type": message_type,
+        "source": source,
+        "destination": destination,
+        "direction": direction,
+        "transport": transport,
+        "invalid": invalid_only,
+    }
+    try:
+        return await _offload("reads", _service().journal_page, after, before, limit, filters)
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
 
@@ -240,7 +372,7 @@ async def journal():
 @app.get("/api/inspections/{identifier}")
 async def inspection(identifier: str):
     try:
-        item = _service().inspection(identifier)
+        item = await _offload("reads", _service().inspection, identifier)
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
     if item is None:
@@ -254,13 +386,17 @@ async def inspection(identifier: str):
 @app.get("/api/workbench/state")
 async def workbench_state():
     try:
-        return _service().model_state()
+        return await _offload("reads", _service().model_state)
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
 
 
 @app.get("/api/workbench/events")
-async def workbench_events(request: Request, after: int = 0):
+async def workbench_events(
+    request: Request,
+    after: int = 0,
+    coalesce_ms: Annotated[int, Query(ge=0, le=1000)] = 0,
+):
     try:
         service = _service()
     except _CONFIGURATION_ERRORS as exc:
@@ -272,36 +408,36 @@ async def workbench_events(request: Request, after: int = 0):
     after = max(0, after)
 
     async def stream():
-        revision = after
         loop = asyncio.get_running_loop()
-        changed = asyncio.Event()
-        unsubscribe = service.subscribe_to_model(
-            lambda _: loop.call_soon_threadsafe(changed.set)
-        )
+        hub = _broadcaster(service)
+        client = hub.attach(after)
+        window = coalesce_ms / 1000
+        sent_at = float("-inf")
         try:
             yield "retry: 1000\n\n"
             while True:
                 if await request.is_disconnected():
                     return
-                changed.clear()
-                result = service.model_changes(revision)
-                if result["resync"]:
-                    revision = result["revision"]
-                    payload = json.dumps({"revision": revision}, separators=(",", ":"))
-                    yield f"id: {revision}\nevent: resync\ndata: {payload}\n\n"
-                    continue
-                if result["changes"]:
-                    for change in result["changes"]:
-                        revision = change["revision"]
-                        payload = json.dumps(change, separators=(",", ":"))
-                        yield f"id: {revision}\nevent: model\ndata: {payload}\n\n"
-                    continue
                 try:
-                    await asyncio.wait_for(changed.wait(), timeout=15.0)
+                    event = await asyncio.wait_for(client.queue.get(), timeout=15.0)
                 except TimeoutError:
                     yield ": keep-alive\n\n"
+                    continue
+                # The first event after a quiet window goes out at once; later ones wait and merge.
+                remaining = sent_at + window - loop.time()
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+                    batch = [event, *client.drain()]
+                    for item in batch:
+                        service.latency.delivered(item.revision)
+                    for data in coalesce(batch):
+                        yield data
+                else:
+                    service.latency.delivered(event.revision)
+                    yield event.data
+                sent_at = loop.time()
         finally:
-            unsubscribe()
+            hub.detach(client)
 
     return StreamingResponse(
         stream(),
@@ -316,7 +452,7 @@ async def workbench_events(request: Request, after: int = 0):
 @app.get("/api/replays")
 async def replays():
     try:
-        return _service().replay_catalog()
+        return await _offload("reads", _service().replay_catalog)
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
 
@@ -324,7 +460,7 @@ async def replays():
 @app.post("/api/replays/select")
 async def select_replay(request: ReplaySelectRequest):
     try:
-        return _service().select_replay(request.recording_id)
+        return await _offload("codec", _service().select_replay, request.recording_id)
     except (RecordingError, TransportError) as exc:
         return JSONResponse(status_code=422, content={"error": exc.as_dict()})
     except _CONFIGURATION_ERRORS as exc:
@@ -334,7 +470,14 @@ async def select_replay(request: ReplaySelectRequest):
 @app.post("/api/replays/control")
 async def control_replay(request: ReplayControlRequest):
     try:
-        return _service().control_replay(request.action, request.speed)
+        return await _offload(
+            "codec",
+            _service().control_replay,
+            request.action,
+            request.speed,
+            request.position_ms,
+            request.skipped,
+        )
     except (RecordingError, TransportError) as exc:
         return JSONResponse(status_code=422, content={"error": exc.as_dict()})
     except _CONFIGURATION_ERRORS as exc:
@@ -344,7 +487,7 @@ async def control_replay(request: ReplayControlRequest):
 @app.get("/api/replays/state")
 async def replay_state():
     try:
-        return _service().replay_state()
+        return await _offload("codec", _service().replay_state)
     except (RecordingError, TransportError) as exc:
         return JSONResponse(status_code=422, content={"error": exc.as_dict()})
     except _CONFIGURATION_ERRORS as exc:
@@ -358,7 +501,9 @@ async def transmit(request: TransmitRequest):
     except _CONFIGURATION_ERRORS as exc:
         return _unavailable(exc)
     try:
-        return service.transmit(
+        return await _offload(
+            "hardware",
+            service.transmit,
             request.frame_hex,
             request.mode,
             request.confirmed,
@@ -371,6 +516,51 @@ async def transmit(request: TransmitRequest):
         return JSONResponse(status_code=422, content={"error": exc.as_dict()})
 
 
+@app.post("/api/carrier/arm")
+async def arm(request: ArmRequest):
+    try:
+        service = _service()
+    except _CONFIGURATION_ERRORS as exc:
+        return _unavailable(exc)
+    try:
+        return await _offload(
+            "hardware",
+            service.arm,
+            request.frame_hex,
+            request.mode,
+            request.confirmed,
+            None if request.provenance is None else request.provenance.model_dump(),
+        )
+    except (InspectionError, TransportError, Nrf905Error) as exc:
+        return JSONResponse(status_code=422, content={"error": exc.as_dict()})
+    except service.wire.codec_error as exc:
+        return JSONResponse(status_code=422, content={"error": exc.as_dict()})
+
+
+@app.post("/api/carrier/fire")
+async def fire():
+    try:
+        service = _service()
+    except _CONFIGURATION_ERRORS as exc:
+        return _unavailable(exc)
+    try:
+        return await _offload("hardware", service.fire)
+    except (TransportError, Nrf905Error) as exc:
+        return JSONResponse(status_code=422, content={"error": exc.as_dict()})
+
+
+@app.post("/api/carrier/disarm")
+async def disarm():
+    try:
+        service = _service()
+    except _CONFIGURATION_ERRORS as exc:
+        return _unavailable(exc)
+    try:
+        return await _offload("hardware", service.disarm)
+    except (TransportError, Nrf905Error) as exc:
+        return JSONResponse(status_code=422, content={"error": exc.as_dict()})
+
+
 static_root = Path(__file__).resolve().parents[1] / "workbench_web"
 app.mount("/assets", StaticFiles(directory=static_root), name="assets")
 
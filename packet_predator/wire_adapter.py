@@ -7,8 +7,13 @@ import json
 import os
 import re
 import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Hashable, Mapping
+
+from .immutable import freeze
 
 
 class AuthorityError(RuntimeError):
@@ -59,10 +64,83 @@ def _normalise_hex(value: str) -> tuple[str, bytes]:
     return compact.lower(), bytes.fromhex(compact)
 
 
+class _DecodeCache:
+    """Bounded least-recently-used store of read-only decoded inspections."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(0, capacity)
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+            self._items.move_to_end(key)
+            self._hits += 1
+            return item
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if not self.capacity:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.capacity:
+                self._items.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "entries": len(self._items),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+@dataclass(frozen=True)
+class _FieldLayout:
+    """Precomputed placement of one body field; None marks a value-dependent size or offset."""
+
+    name: str
+    label: str
+    type: str
+    offset: int | None
+    size: int | None
+
+
+@dataclass(frozen=True)
+class _LayoutPlan:
+    """Read-only presentation tables compiled once per released message type."""
+
+    value: int
+    name: str
+    display_name: str
+    family: Mapping[str, str]
+    producers: tuple[str, ...]
+    consumers: tuple[str, ...]
+    delivery_label: str
+    revision_label: str
+    fields: tuple[_FieldLayout, ...]
+    editor: Mapping[str, Any]
+
+
 class WireAdapter:
     """Presentation-safe access to the released registry, fixtures, and decoder."""
 
-    def __init__(self, authority_root: Path | None = None) -> None:
+    def __init__(
+        self,
+        authority_root: Path | None = None,
+        decode_cache_size: int = 256,
+    ) -> None:
         self.authority_root = (authority_root or default_authority_root()).resolve()
         registry_path = self.authority_root / "registry/v1.json"
         examples_path = self.authority_root / "fixtures/v1/all-message-types.json"
@@ -108,6 +186,19 @@ class WireAdapter:
         self.examples_by_id = {item["id"]: item for item in self.examples}
         if len(self.examples_by_id) != len(self.examples):
             raise AuthorityError("Conformance example identifiers must be unique.")
+        self._body_offset = int(self.registry_data["envelope"]["header_size"])
+        self._source_labels = tuple(self._address_label(value, False) for value in range(256))
+        self._destination_labels = tuple(self._address_label(value, True) for value in range(256))
+        self._layouts = {
+            definition["value"]: self._compile_layout(definition)
+            for definition in self.registry_data.get("messages", [])
+        }
+        self._layouts_by_name = {plan.name: plan for plan in self._layouts.values()}
+        self._editor_definitions = tuple(
+            self._layouts[definition["value"]].editor
+            for definition in self.registry_data.get("messages", [])
+        )
+        self._decode_cache = _DecodeCache(decode_cache_size)
 
     @property
     def version(self) -> str:
@@ -121,19 +212,20 @@ class WireAdapter:
             "authority_path": str(self.authority_root),
             "wire_generation": self.registry_data["wire_generation"]["value"],
             "example_count": len(self.examples),
+            "decode_cache": self._decode_cache.stats(),
         }
 
     def catalog(self) -> dict[str, Any]:
         groups: dict[str, list[dict[str, Any]]] = {}
         for definition in self.registry_data["messages"]:
-            family = self._family(definition["value"])
-            groups.setdefault(family["key"], []).append(
+            plan = self._layouts[definition["value"]]
+            groups.setdefault(plan.family["key"], []).append(
                 {
                     "value": definition["value"],
                     "hex_value": f"0x{definition['value']:02X}",
                     "name": definition["name"],
-                    "display_name": self._display_name(definition["name"]),
-                    "family": family,
+                    "display_name": plan.display_name,
+                    "family": dict(plan.family),
                     "producers": definition["producers"],
                     "consumers": definition["consumers"],
                     "delivery": definition["delivery"],
@@ -189,15 +281,12 @@ class WireAdapter:
         return {
             "editor_interface_version": 1,
             "authority_version": self.version,
-            "messages": [
-                self._editor_definition(definition)
-                for definition in self.registry_data["messages"]
-            ],
+            "messages": self._editor_definitions,
         }
 
     def editor_message(self, name: str) -> dict[str, Any]:
-        definition = self.definitions_by_name.get(name)
-        if definition is None:
+        plan = self._layouts_by_name.get(name)
+        if plan is None:
             raise InspectionError(
                 "EDITOR_MESSAGE_UNKNOWN",
                 f"No released message is named {name!r}.",
@@ -205,7 +294,7 @@ class WireAdapter:
         return {
             "editor_interface_version": 1,
             "authority_version": self.version,
-            "message": self._editor_definition(definition),
+            "message": plan.editor,
         }
 
     def compose(
@@ -284,7 +373,7 @@ class WireAdapter:
             "logical_frame_hex": logical.hex(),
             "fixed_frame_hex": fixed.hex(),
             "editor_values": self.editor_values(message_name, codec_payload),
-            "inspection": self.inspect(selected.hex(), representation),
+            "inspection": self.inspect_bytes(selected, representation),
         }
 
     def editor_values(
@@ -315,34 +404,53 @@ class WireAdapter:
                 values[field["name"]] = str(value)
         return values
 
-    def inspect(self, frame_text: str, mode: str = "auto") -> dict[str, Any]:
-        compact, raw = _normalise_hex(frame_text)
+    def inspect(self, frame_text: str, mode: str = "auto") -> Mapping[str, Any]:
+        """Decode user-supplied frame text at the HTTP boundary."""
+
+        _, raw = _normalise_hex(frame_text)
+        return self.inspect_bytes(raw, mode)
+
+    def inspect_bytes(
+        self, frame: bytes | bytearray | memoryview, mode: str = "auto"
+    ) -> Mapping[str, Any]:
+        """Decode captured bytes, sharing one read-only result for exact repeated frames."""
+
+        if not isinstance(frame, (bytes, bytearray, memoryview)):
+            raise InspectionError("FRAME_TYPE", "Captured frames must be bytes.")
+        raw = bytes(frame)
+        key = (raw, mode, self.version)
+        cached = self._decode_cache.get(key)
+        if cached is None:
+            cached = freeze(self._inspect_raw(raw, mode))
+            self._decode_cache.put(key, cached)
+        return cached
+
+    def _inspect_raw(self, raw: bytes, mode: str) -> dict[str, Any]:
         decoded = self.codec.decode_frame(raw, mode=mode).as_dict()
         meta = decoded["header"]
         kind = decoded["message"]
-        definition = self.definitions[meta["message_type"]]
-        family = self._family(meta["message_type"])
-        source_label = self._address_label(meta["source"], False)
-        destination_label = self._address_label(meta["destination"], True)
+        plan = self._layouts[meta["message_type"]]
+        source_label = self._source_labels[meta["source"]]
+        destination_label = self._destination_labels[meta["destination"]]
         logical_size = len(decoded["logical_frame_hex"]) // 2
 
         return {
             "authority_version": self.version,
-            "received_frame_hex": compact,
+            "received_frame_hex": raw.hex(),
             "received_bytes": len(raw),
             "logical_bytes": logical_size,
             "padding_bytes": decoded["padding_length"],
             "representation": "fixed 32-byte adapter frame" if decoded["padding_length"] else "logical frame",
-            "family": family,
-            "title": self._display_name(kind["name"]),
-            "summary": f"{source_label} sent {self._display_name(kind['name']).lower()} to {destination_label}.",
+            "family": dict(plan.family),
+            "title": plan.display_name,
+            "summary": f"{source_label} sent {plan.display_name.lower()} to {destination_label}.",
             "route": {
                 "source": meta["source"],
                 "source_label": source_label,
                 "destination": meta["destination"],
                 "destination_label": destination_label,
-                "producers": definition["producers"],
-                "consumers": definition["consumers"],
+                "producers": list(plan.producers),
+                "consumers": list(plan.consumers),
             },
             "envelope": {
                 **meta,
@@ -350,12 +458,12 @@ class WireAdapter:
             },
             "meaning": {
                 **kind,
-                "delivery_label": self._display_name(kind["delivery"]),
-                "revision_label": self._display_name(kind["revision_scope"]),
+                "delivery_label": plan.delivery_label,
+                "revision_label": plan.revision_label,
             },
             "body": decoded["payload"],
             "annotations": decoded["annotations"],
-            "field_rows": self._field_rows(definition, decoded),
+            "field_rows": self._field_rows(plan, decoded),
             "byte_rows": self._byte_rows(raw, logical_size),
         }
 
@@ -408,6 +516,35 @@ class WireAdapter:
             )
         return logical + bytes([padding]) * (size - len(logical))
 
+    def _compile_layout(self, definition: dict[str, Any]) -> _LayoutPlan:
+        fields = []
+        offset: int | None = self._body_offset
+        for field in definition["payload"]["fields"]:
+            size = self.registry_data["primitive_types"][field["type"]].get("size")
+            size = None if size is None else int(size)
+            fields.append(
+                _FieldLayout(
+                    name=field["name"],
+                    label=self._display_name(field["name"]),
+                    type=field["type"],
+                    offset=offset,
+                    size=size,
+                )
+            )
+            offset = None if offset is None or size is None else offset + size
+        return _LayoutPlan(
+            value=definition["value"],
+            name=definition["name"],
+            display_name=self._display_name(definition["name"]),
+            family=freeze(self._family(definition["value"])),
+            producers=tuple(definition["producers"]),
+            consumers=tuple(definition["consumers"]),
+            delivery_label=self._display_name(definition["delivery"]),
+            revision_label=self._display_name(definition["revision_scope"]),
+            fields=tuple(fields),
+            editor=freeze(self._editor_definition(definition)),
+        )
+
     def _editor_definition(self, definition: dict[str, Any]) -> dict[str, Any]:
         fields = []
         for field in definition["payload"]["fields"]:
@@ -438,30 +575,27 @@ class WireAdapter:
             },
         }
 
-    def _field_rows(self, definition: dict[str, Any], decoded: dict[str, Any]) -> list[dict[str, Any]]:
+    def _field_rows(self, plan: _LayoutPlan, decoded: dict[str, Any]) -> list[dict[str, Any]]:
         rows = []
-        offset = int(self.registry_data["envelope"]["header_size"])
-        for field in definition["payload"]["fields"]:
-            name = field["name"]
-            value = decoded["payload"][name]
-            annotation = decoded["annotations"].get(name)
-            primitive = self.registry_data["primitive_types"][field["type"]]
-            size = primitive.get("size")
-            if size is None:
-                size = len(value) // 2
+        offset = self._body_offset
+        for field in plan.fields:
+            value = decoded["payload"][field.name]
+            size = field.size if field.size is not None else len(value) // 2
+            if field.offset is not None:
+                offset = field.offset
             rows.append(
                 {
-                    "name": name,
-                    "label": self._display_name(name),
+                    "name": field.name,
+                    "label": field.label,
                     "offset": offset,
                     "size": size,
-                    "type": field["type"],
+                    "type": field.type,
                     "value": value,
-                    "value_hex": self._value_hex(value, int(size)),
-                    "annotation": annotation,
+                    "value_hex": self._value_hex(value, size),
+                    "annotation": decoded["annotations"].get(field.name),
                 }
             )
-            offset += int(size)
+            offset += size
         return rows
 
     def _byte_rows(self, raw: bytes, logical_size: int) -> list[dict[str, Any]]:
@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+
+from packet_predator.broadcast import ModelBroadcaster, coalesce, model_event, resync_event
+from packet_predator.model import WorkbenchModel
+from tests.test_workbench_model import observation
+
+
+class ModelOnlyService:
+    def __init__(self, model):
+        self.model = model
+
+    def model_revision(self):
+        return self.model.revision
+
+    def model_events(self, revision):
+        return self.model.encoded_changes_since(revision)
+
+    def subscribe_to_model(self, callback):
+        return self.model.subscribe(callback)
+
+
+class ModelBroadcasterTests(unittest.TestCase):
+    def test_every_client_receives_the_same_encoded_bytes(self):
+        model = WorkbenchModel()
+        model.publish(observation("missed"))
+
+        async def exercise():
+            hub = ModelBroadcaster(ModelOnlyService(model))
+            first = hub.attach(0)
+            second = hub.attach(1)
+            self.assertEqual(len(model._subscribers), 1)
+            model.publish(observation("live"))
+            await asyncio.sleep(0.05)
+            caught_up = first.queue.get_nowait().data
+            shared = (first.queue.get_nowait().data, second.queue.get_nowait().data)
+            hub.detach(first)
+            hub.detach(second)
+            return caught_up, shared
+
+        caught_up, (first, second) = asyncio.run(exercise())
+        self.assertIn(b"id: 1\nevent: model\n", caught_up)
+        self.assertIs(first, second)
+        self.assertIn(b'"observation_id":"live"', first)
+        self.assertEqual(len(model._subscribers), 0)
+
+    def test_slow_client_is_resynchronized_without_holding_back_others(self):
+        model = WorkbenchModel()
+
+        async def exercise():
+            hub = ModelBroadcaster(ModelOnlyService(model), queue_size=2)
+            slow = hub.attach(0)
+            fast = hub.attach(0)
+            delivered = []
+            for index in range(4):
+                model.publish(observation(f"frame-{index}"))
+                await asyncio.sleep(0.01)
+                delivered.append(fast.queue.get_nowait())
+            queued = [event.data for event in slow.drain()]
+            stats = hub.stats()
+            hub.close()
+            return delivered, queued, stats
+
+        delivered, queued, stats = asyncio.run(exercise())
+        self.assertEqual(len(delivered), 4)
+        self.assertTrue(queued[0].startswith(b"id: 3\nevent: resync\n"))
+        self.assertIn(b"id: 4\nevent: model\n", queued[1])
+        self.assertEqual(stats["slow_client_resyncs"], 1)
+        self.assertEqual(stats["clients"], 2)
+
+    def test_future_revision_starts_with_resync(self):
+        model = WorkbenchModel()
+
+        async def exercise():
+            hub = ModelBroadcaster(ModelOnlyService(model))
+            client = hub.attach(99)
+            event = client.queue.get_nowait()
+            hub.detach(client)
+            return event.data
+
+        self.assertTrue(asyncio.run(exercise()).startswith(b"id: 0\nevent: resync\n"))
+
+    def test_coalesced_events_share_one_revision_range(self):
+        first = model_event(3, '{"revision":3}')
+        second = model_event(4, '{"revision":4}')
+        (batch,) = coalesce([first, second])
+
+        self.assertTrue(batch.startswith(b"id: 4\nevent: batch\n"))
+        self.assertIn(
+            b'data: {"first_revision":3,"revision":4,"changes":[{"revision":3},{"revision":4}]}',
+            batch,
+        )
+        self.assertEqual(coalesce([first]), [first.data])
+        self.assertEqual(
+            coalesce([first, resync_event(5), model_event(6, "{}")]),
+            [resync_event(5).data, model_event(6, "{}").data],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
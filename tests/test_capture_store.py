@@ -0,0 +1,152 @@
+import random
+import unittest
+
+from packet_predator.capture_store import CaptureStore
+from packet_predator.model import INDEX_BYTES_PER_RECORD, WorkbenchModel
+from tests.test_workbench_model import observation
+
+
+def decoded(identifier, invalid=False):
+    entry = observation(identifier, "received", invalid=invalid)
+    if not invalid:
+        entry.update({
+            "padding_bytes": 4,
+            "envelope": {"message_type": 2},
+            "route": {"source": 1, "destination": 255},
+        })
+    return entry
+
+
+class CaptureStoreTests(unittest.TestCase):
+    def test_budget_sets_capacity_for_large_captures(self):
+        record = CaptureStore.record_bytes()
+        self.assertLessEqual(record, 64)
+        store = CaptureStore(1_000_000 * record)
+        self.assertEqual(store.capacity, 1_000_000)
+        self.assertLess(store.budget_bytes, 64 * 1024 * 1024)
+        with self.assertRaises(ValueError):
+            CaptureStore(record - 1)
+
+    def test_companion_bytes_are_charged_to_the_budget(self):
+        charged = CaptureStore.record_bytes() + INDEX_BYTES_PER_RECORD
+        store = CaptureStore(1000 * charged, companion_bytes=INDEX_BYTES_PER_RECORD)
+        self.assertEqual(store.capacity, 1000)
+        self.assertEqual(store.stats()["companion_bytes"], INDEX_BYTES_PER_RECORD)
+        with self.assertRaisesRegex(ValueError, f"{charged}-byte"):
+            CaptureStore(charged - 1, companion_bytes=INDEX_BYTES_PER_RECORD)
+
+    def test_interned_values_are_reused_once_their_records_are_gone(self):
+        store = CaptureStore(3 * CaptureStore.record_bytes())
+        for sequence in range(5000):
+            entry = {**observation(f"{sequence:012x}"), "origin": f"paste {sequence}", "journal_sequence": sequence}
+            store.append(entry, sequence)
+        self.assertEqual(store.record(4999)["origin"], "paste 4999")
+        self.assertEqual(store.stats()["interned_values"]["origin"], 3)
+
+    def test_overflowing_family_table_leaves_no_index_entries_behind(self):
+        store = CaptureStore(300 * CaptureStore.record_bytes())
+        model = WorkbenchModel(retention=1, capture_store=store)
+        for index in range(900):
+            entry = observation(f"{index:012x}")
+            entry["family"] = {"key": f"family-{index}", "label": "Synthetic"}
+            model.publish(entry)
+
+        families = [index for (name, _), index in model._indexes.items() if name == "family"]
+        self.assertLessEqual(len(families), 254)
+        self.assertTrue(all(len(index) == 1 for index in families))
+        named = [sequence for sequence in range(600, 900) if store.attributes(sequence)[0] is not None]
+        self.assertEqual(len(named), 254)
+        page = model.journal_page(filters={"family": f"family-{named[-1]}"})
+        self.assertEqual([item["journal_sequence"] for item in page["entries"]], [named[-1]])
+
+    def test_model_decodes_compact_records_after_retention_moves_on(self):
+        calls = []
+
+        def decoder(frame, mode):
+            calls.append((frame, mode))
+            return {"title": "Decoded again", "received_frame_hex": frame.hex()}
+
+        store = CaptureStore(3 * CaptureStore.record_bytes(), decoder)
+        model = WorkbenchModel(retention=1, capture_store=store)
+        model.publish(decoded("a1a1a1a1a1a1"))
+        model.publish(decoded("b2b2b2b2b2b2", invalid=True))
+        model.publish(decoded("c3c3c3c3c3c3"))
+
+        first = model.inspection("a1a1a1a1a1a1")
+        self.assertEqual(first["title"], "Decoded again")
+        self.assertEqual(first["journal_sequence"], 0)
+        self.assertEqual(first["retained_as"], "compact")
+        self.assertEqual(first["capture"]["direction"], "received")
+        self.assertEqual(calls, [(bytes(32), "fixed")])
+        with self.assertRaises(TypeError):
+            first["title"] = "mutated"
+
+        invalid = model.inspection_at(1)
+        self.assertEqual(invalid["id"], "b2b2b2b2b2b2")
+        self.assertEqual(invalid["family"], {"key": "invalid", "label": "Invalid frame"})
+        self.assertEqual(invalid["inspection_error"]["code"], "TEST_INVALID")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(store.record(0)["message_type"], 2)
+        self.assertIsNone(store.record(1)["source"])
+
+        model.publish(decoded("d4d4d4d4d4d4"))
+        self.assertIsNone(model.inspection("a1a1a1a1a1a1"))
+        self.assertIsNone(model.inspection_at(0))
+        self.assertEqual(model.capture_status()["first_sequence"], 1)
+
+    def test_journal_pages_reach_compact_records_through_indexes(self):
+        store = CaptureStore(3 * CaptureStore.record_bytes(), lambda frame, mode: {
+            "title": "Decoded again",
+            "summary": "Rebuilt",
+            "received_frame_hex": frame.hex(),
+            "family": {"key": "player", "label": "Player activity"},
+        })
+        model = WorkbenchModel(retention=1, capture_store=store)
+        for index, invalid in enumerate((False, True, False, False)):
+            model.publish(decoded(f"{index:012x}", invalid=invalid))
+
+        page = model.journal_page(filters={"destination": 255})
+        self.assertEqual([item["journal_sequence"] for item in page["entries"]], [3, 2])
+        self.assertEqual(page["entries"][1]["title"], "Decoded again")
+        self.assertEqual(page["oldest_sequence"], 1)
+        invalid = model.journal_page(filters={"invalid": True, "direction": "received"})
+        self.assertEqual([item["id"] for item in invalid["entries"]], ["000000000001"])
+        self.assertEqual(len(model._indexes[("message_type", 2)]), 2)
+        self.assertNotIn(("direction", "received"), model._indexes)
+        # Six indexes; the four on valid frames still hold evicted sequence 0 until compaction.
+        self.assertEqual(model.capture_status()["index_count"], 6)
+        self.assertEqual(model.capture_status()["index_bytes"], (4 * 3 + 2) * 8)
+        player = model.journal_page(filters={"family": "player"})
+        self.assertEqual([item["journal_sequence"] for item in player["entries"]], [3, 2])
+
+    def test_id_lookup_follows_eviction_and_repeated_ids(self):
+        store = CaptureStore(64 * CaptureStore.record_bytes())
+        rng = random.Random(7)
+        pool = [f"{rng.getrandbits(48):012x}" for _ in range(96)]
+        expected = {}
+        for sequence in range(2000):
+            identifier = rng.choice(pool)
+            store.append({**observation(identifier), "journal_sequence": sequence}, sequence)
+            expected[identifier] = sequence
+            for known, newest in list(expected.items()):
+                if newest < store.first_sequence:
+                    del expected[known]
+            if sequence % 97 == 0:
+                for identifier in pool:
+                    self.assertEqual(store.sequence_of(identifier), expected.get(identifier))
+        self.assertLessEqual(sum(1 for held in store._id_table if held), store.capacity)
+
+    def test_identifiers_that_do_not_pack_are_still_found(self):
+        store = CaptureStore(2 * CaptureStore.record_bytes())
+        model = WorkbenchModel(retention=1, capture_store=store)
+        model.publish(observation("one"))
+        model.publish(observation("ABCDEF012345"))
+        model.publish(observation("two"))
+
+        self.assertIsNone(model.inspection("one"))
+        self.assertEqual(model.inspection("ABCDEF012345")["journal_sequence"], 1)
+        self.assertEqual(model.inspection("two")["journal_sequence"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from packet_predator.latency import LatencyHistogram, ReceiveLatency
+
+
+class LatencyHistogramTests(unittest.TestCase):
+    def test_percentiles_report_bucket_bounds_and_exact_maximum(self):
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(1_500)
+        for _ in range(9):
+            histogram.record(40_000)
+        histogram.record(3_000_000)
+
+        summary = histogram.summary()
+        self.assertEqual(summary["count"], 100)
+        self.assertEqual(summary["p50_us"], 2.0)
+        self.assertEqual(summary["p95_us"], 50.0)
+        self.assertEqual(summary["p99_us"], 50.0)
+        self.assertEqual(summary["max_us"], 3000.0)
+        self.assertEqual(len(histogram.counts()), len(LatencyHistogram.bounds_ns) + 1)
+        self.assertEqual(LatencyHistogram().summary()["p50_us"], None)
+
+    def test_durations_past_the_last_bound_land_in_the_overflow_bucket(self):
+        histogram = LatencyHistogram()
+        histogram.record(20_000_000_000)
+        histogram.record(-5)
+
+        self.assertEqual(histogram.counts()[-1], 1)
+        self.assertEqual(histogram.counts()[0], 1)
+        self.assertEqual(histogram.summary()["p99_us"], 20_000_000.0)
+
+    def test_sse_stage_only_counts_revisions_published_from_the_radio(self):
+        latency = ReceiveLatency(revision_slots=4)
+        latency.published(7, 0)
+        latency.delivered(7)
+        latency.delivered(3)
+        latency.delivered(11)
+
+        self.assertEqual(latency.summary()["sse"]["count"], 1)
+        self.assertEqual(set(latency.summary()), {"spi_read", "queue", "inspect", "publish", "sse"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+
+from packet_predator.latency import LatencyHistogram
+from packet_predator.metrics import exposition
+from packet_predator.model import WorkbenchModel
+from packet_predator.transport import DeterministicReplayTransport
+from tests.test_workbench_model import observation
+
+
+def collected(model, **overrides):
+    return {
+        "receiver": model.snapshot()["receiver"],
+        **model.counters(),
+        "decode_cache": {"capacity": 4, "entries": 1, "hits": 2, "misses": 3, "evictions": 0},
+        "replay": DeterministicReplayTransport().status(),
+        "replay_release_lag": LatencyHistogram(),
+        "replay_stages": {"inspect": LatencyHistogram(), "publish": LatencyHistogram()},
+        "transmit_outcomes": {},
+        "transmit_elapsed": None,
+        "fire_to_pulse": None,
+        "spi_exchanges": None,
+        "receive_pipeline": None,
+        "receive_latency": None,
+        **overrides,
+    }
+
+
+class ExpositionTests(unittest.TestCase):
+    def test_model_counters_render_as_labelled_samples(self):
+        model = WorkbenchModel()
+        model.set_receiver_state("listening")
+        model.publish(observation("bad", "received", invalid=True))
+        model.publish(observation("good", "received"))
+
+        lines = exposition(
+            collected(model, transmit_outcomes={"sent": 2, "unknown": 1}),
+            {"clients": 2, "queue_depths": [0, 5], "slow_client_resyncs": 1},
+        ).splitlines()
+
+        self.assertIn("# TYPE packet_predator_receiver_state gauge", lines)
+        self.assertIn('packet_predator_receiver_state{state="listening"} 1', lines)
+        self.assertIn('packet_predator_receiver_state{state="stopped"} 0', lines)
+        self.assertIn('packet_predator_receiver_transitions_total{state="listening"} 1', lines)
+        self.assertIn("packet_predator_frames_received_total 2", lines)
+        self.assertIn("packet_predator_frames_invalid_total 1", lines)
+        self.assertIn('packet_predator_inspection_errors_total{code="TEST_INVALID"} 1', lines)
+        self.assertIn("packet_predator_decode_cache_hits_total 2", lines)
+        self.assertIn('packet_predator_sse_queue_depth{client="1"} 5', lines)
+        self.assertIn("packet_predator_replay_lag_seconds 0.0", lines)
+        self.assertIn('packet_predator_transmit_outcomes_total{outcome="unknown"} 1', lines)
+        self.assertFalse(any(line.startswith("packet_predator_spi_exchange_seconds") for line in lines))
+
+    def test_histograms_are_cumulative_in_seconds(self):
+        histogram = LatencyHistogram()
+        histogram.record(1_500)
+        histogram.record(3_000_000)
+        text = exposition(collected(WorkbenchModel(), spi_exchanges=histogram), None)
+
+        self.assertIn('packet_predator_spi_exchange_seconds_bucket{le="1e-06"} 0\n', text)
+        self.assertIn('packet_predator_spi_exchange_seconds_bucket{le="2e-06"} 1\n', text)
+        self.assertIn('packet_predator_spi_exchange_seconds_bucket{le="0.005"} 2\n', text)
+        self.assertIn('packet_predator_spi_exchange_seconds_bucket{le="+Inf"} 2\n', text)
+        self.assertIn("packet_predator_spi_exchange_seconds_count 2\n", text)
+        self.assertIn("packet_predator_spi_exchange_seconds_sum 0.0030015\n", text)
+        self.assertIn("packet_predator_sse_clients 0\n", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
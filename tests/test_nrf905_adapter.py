@@ -8,7 +8,9 @@ from pathlib import Path
 
 from packet_predator.adapters.nrf905 import Nrf905Device, Nrf905Error, configuration_bytes
 from packet_predator.nrf905_profile import Nrf905ProfileError, load_nrf905_profile
+from packet_predator.latency import ReceiveLatency
 from packet_predator.nrf905_transport import Nrf905Transport
+from packet_predator.receiver import FrameRing, PhysicalReceiver
 from packet_predator.service import WorkbenchService
 from packet_predator.transport import TransportError
 from packet_predator.wire_adapter import WireAdapter
@@ -31,6 +33,8 @@ class ManualClock:
 
 
 class FakeLines:
+    edge_events = True
+
     def __init__(self):
         self.outputs = {"pwr_up": False, "trx_ce": False, "tx_en": False}
         self.inputs = {"carrier_detect": False, "address_match": False, "data_ready": False}
@@ -39,6 +43,7 @@ class FakeLines:
         self.close_count = 0
         self.wait_error = None
         self.condition = threading.Condition()
+        self.edge_ns = None
 
     def set(self, name, active):
         previous = self.outputs[name]
@@ -62,9 +67,15 @@ class FakeLines:
 
     def set_input(self, name, active):
         with self.condition:
+            if name == "data_ready" and active:
+                self.edge_ns = time.monotonic_ns()
             self.inputs[name] = active
             self.condition.notify_all()
 
+    def last_edge_ns(self, name):
+        with self.condition:
+            return self.edge_ns
+
     def close(self):
         self.closed = True
         self.close_count += 1
@@ -217,6 +228,14 @@ class DeviceTests(unittest.TestCase):
         self.assertTrue(self.lines.outputs["trx_ce"])
         self.assertFalse(self.lines.inputs["data_ready"])
 
+    def test_receive_without_edge_events_needs_no_edge_timestamps(self):
+        self.lines.edge_events = False
+        self.lines.last_edge_ns = None
+        self.device.start()
+        self.spi.rx_frame = bytes(range(32))
+        self.lines.inputs["data_ready"] = True
+        self.assertEqual(self.device.receive_stamped(), (bytes(range(32)), None))
+
     def test_transmit_writes_address_and_exact_frame(self):
         self.device.start()
         frame = bytes(reversed(range(32)))
@@ -225,6 +244,80 @@ class DeviceTests(unittest.TestCase):
         self.assertEqual(self.spi.tx_frame, frame)
         self.assertEqual(result["frame_hex"], frame.hex())
         self.assertEqual(self.lines.outputs, {"pwr_up": True, "trx_ce": True, "tx_en": False})
+        self.assertEqual(self.device.transmit_elapsed.summary()["count"], 1)
+        self.assertEqual(self.device.spi_exchanges.summary()["count"], 4)
+
+    def test_transmit_completion_waits_on_the_data_ready_edge(self):
+        lines = FakeLines()
+        lines.set = lambda name, active: lines.outputs.__setitem__(name, active)
+        device = Nrf905Device(self.profile, FakeSpi(), lines)
+        device.start()
+        waits = []
+        original_wait = lines.wait
+
+        def wait(name, timeout_s):
+            waits.append(timeout_s)
+            return original_wait(name, timeout_s)
+
+        lines.wait = wait
+        timer = threading.Timer(0.003, lines.set_input, ("data_ready", True))
+        timer.start()
+        result = device.transmit(bytes(32))
+        timer.join()
+
+        self.assertEqual(result["completion_source"], "data_ready_edge")
+        self.assertEqual(result["completed_ns"], lines.edge_ns)
+        self.assertGreaterEqual(result["completion_us"], 1000.0)
+        self.assertTrue(waits)
+        self.assertTrue(all(timeout <= 0.005 for timeout in waits))
+
+    def test_transmit_completion_polls_backends_without_edge_events(self):
+        lines = FakeLines()
+        lines.edge_events = False
+        lines.wait = None
+        lines.last_edge_ns = None
+        lines.set = lambda name, active: lines.outputs.__setitem__(name, active)
+        sleeps = []
+
+        def sleeper(seconds):
+            self.clock.sleep(seconds)
+            sleeps.append(seconds)
+            if len(sleeps) == 4:
+                lines.inputs["data_ready"] = True
+
+        device = Nrf905Device(self.profile, FakeSpi(), lines, sleeper=sleeper, monotonic=self.clock)
+        device.start()
+        result = device.transmit(bytes(32))
+
+        self.assertEqual(result["completion_source"], "polling")
+        self.assertEqual(result["elapsed_ms"], 0.21)
+        self.assertEqual(sleeps[-2:], [0.0001, 0.0001])
+        self.assertGreaterEqual(result["completion_us"], 0.0)
+
+    def test_armed_frame_is_preloaded_so_fire_only_pulses(self):
+        self.device.start()
+        frame = bytes(range(32))
+        self.device.arm(frame)
+        self.assertEqual(self.spi.tx_frame, frame)
+        self.assertEqual(self.lines.outputs, {"pwr_up": True, "trx_ce": True, "tx_en": False})
+        exchanges = self.device.spi_exchanges.summary()["count"]
+        self.lines.history.clear()
+
+        result = self.device.fire()
+        self.assertEqual(self.device.spi_exchanges.summary()["count"], exchanges)
+        self.assertIn(("trx_ce", True), self.lines.history)
+        self.assertEqual(result["frame_hex"], frame.hex())
+        self.assertLessEqual(result["pulsed_ns"], result["completed_ns"])
+        self.assertIsNone(self.device.armed_frame)
+        with self.assertRaises(Nrf905Error) as raised:
+            self.device.fire()
+        self.assertEqual(raised.exception.code, "NRF905_NOT_ARMED")
+
+    def test_transmit_replaces_an_armed_frame(self):
+        self.device.start()
+        self.device.arm(bytes(32))
+        self.device.transmit(bytes([1]) * 32)
+        self.assertIsNone(self.device.armed_frame)
 
     def test_invalid_transmit_length_fails_before_spi(self):
         self.device.start()
@@ -249,6 +342,25 @@ class DeviceTests(unittest.TestCase):
         self.assertEqual(captured.frame_mode, "fixed")
         self.assertEqual(transport.status()["mode"], "nrf905")
 
+    def test_received_frame_carries_the_data_ready_edge_time(self):
+        transport = Nrf905Transport(self.profile, self.device, self.clock)
+        self.lines.edge_ns = 5_000_123_456
+        self.lines.inputs["data_ready"] = True
+        first = transport.poll()[0]
+        self.assertEqual(first.captured_ns, 5_000_123_456)
+        self.assertEqual(first.capture_clock, "data_ready_edge")
+        self.assertEqual(first.at_ms, 5000)
+
+        self.lines.inputs["data_ready"] = True
+        self.clock.now = 6.5
+        repeated = transport.poll()[0]
+        self.assertEqual(repeated.capture_clock, "monotonic")
+        self.assertEqual(repeated.captured_ns, 6_500_000_000)
+
+        self.device.transmit(bytes(32))
+        self.lines.inputs["data_ready"] = True
+        self.assertEqual(transport.poll()[0].capture_clock, "monotonic")
+
     def test_transport_status_remains_available_when_pin_read_fails(self):
         transport = Nrf905Transport(self.profile, self.device, self.clock)
         original_get = self.lines.get
@@ -265,6 +377,72 @@ class DeviceTests(unittest.TestCase):
         self.assertEqual(status["status_error"]["code"], "NRF905_GPIO_READ")
 
 
+class ReceivePipelineTests(unittest.TestCase):
+    def setUp(self):
+        self.directory, self.profile = transmitting_profile()
+        self.spi = FakeSpi()
+        self.lines = FakeLines()
+        self.spi.lines = self.lines
+        self.transport = Nrf905Transport(
+            self.profile,
+            Nrf905Device(self.profile, self.spi, self.lines, sleeper=lambda seconds: None),
+        )
+        self.release = threading.Event()
+        self.consumed = []
+        self.states = []
+
+    def tearDown(self):
+        self.release.set()
+        self.directory.cleanup()
+
+    def consume(self, item):
+        self.release.wait(1.0)
+        self.consumed.append(item.frame)
+        return {}
+
+    def set_state(self, state, error):
+        self.states.append(state)
+        return {}
+
+    def test_radio_keeps_draining_while_decode_is_stalled(self):
+        latency = ReceiveLatency()
+        receiver = PhysicalReceiver(self.transport, self.consume, self.set_state, latency=latency)
+        frames = [bytes([index]) * 32 for index in range(4)]
+        receiver.start()
+        self.spi.queue_receive(*frames)
+
+        deadline = time.monotonic() + 1.0
+        while receiver.stats()["radio"]["frames"] < 4 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        stalled = receiver.stats()
+        self.assertEqual(stalled["radio"]["frames"], 4)
+        self.assertEqual(self.consumed, [])
+        self.assertGreaterEqual(stalled["ring"]["high_water"], 3)
+
+        self.release.set()
+        receiver.stop()
+        self.assertEqual(self.consumed, frames)
+        self.assertEqual(receiver.stats()["decode"]["frames"], 4)
+        self.assertEqual(receiver.stats()["ring"]["depth"], 0)
+        self.assertEqual(latency.stages["queue"].summary()["count"], 4)
+        self.assertGreaterEqual(latency.stages["queue"].summary()["max_us"], 1.0)
+        self.assertGreaterEqual(latency.stages["spi_read"].summary()["count"], 1)
+        self.assertEqual(self.states, ["starting", "listening", "stopped"])
+
+    def test_full_ring_counts_overflow_instead_of_blocking(self):
+        ring = FrameRing(2)
+        self.assertTrue(ring.push("first"))
+        self.assertTrue(ring.push("second"))
+        self.assertFalse(ring.push("third"))
+        self.assertEqual(ring.take(), ["first", "second"])
+        ring.close()
+        self.assertEqual(ring.take(), [])
+        self.assertEqual(
+            ring.stats(),
+            {"capacity": 2, "depth": 0, "high_water": 2, "queued": 2, "overflows": 1},
+        )
+
+
 @unittest.skipUnless(
     (AUTHORITY_ROOT / "registry/v1.json").is_file(),
     "sibling Protocol Contract checkout is required for physical service integration",
@@ -298,6 +476,27 @@ class PhysicalServiceTests(unittest.TestCase):
         self.assertEqual(result["delivered"][0]["capture"]["transport"], "nrf905")
         self.assertEqual(result["delivered"][0]["capture"]["direction"], "sent")
 
+    def test_arm_then_fire_reports_pulse_latency_and_clears_indicator(self):
+        example = self.wire.resolve_example("v1-controller-beacon", "logical")
+        with self.assertRaisesRegex(TransportError, "Confirm"):
+            self.service.arm(example["frame_hex"], "logical", False)
+
+        armed = self.service.arm(example["frame_hex"], "logical", True)
+        self.assertEqual(armed["armed"]["frame_hex"], self.spi.tx_frame.hex())
+        self.assertTrue(armed["carrier"]["armed"])
+        self.assertEqual(self.service.model_state()["receiver"]["armed"]["arm_id"], armed["armed"]["arm_id"])
+
+        result = self.service.fire()
+        self.assertEqual(result["outcome"], "sent")
+        self.assertEqual(result["arm_id"], armed["armed"]["arm_id"])
+        self.assertGreaterEqual(result["timing"]["fire_to_pulse_us"], 0.0)
+        self.assertEqual(result["delivered"][0]["meaning"]["name"], "CONTROLLER_BEACON")
+        self.assertIsNone(self.service.model_state()["receiver"]["armed"])
+        self.assertEqual(self.service.metrics()["fire_to_pulse"].summary()["count"], 1)
+        with self.assertRaises(TransportError) as raised:
+            self.service.fire()
+        self.assertEqual(raised.exception.code, "TRANSMIT_NOT_ARMED")
+
     def test_service_deduplicates_named_transmit_request(self):
         example = self.wire.resolve_example("v1-controller-beacon", "logical")
         provenance = {
@@ -1,9 +1,13 @@
 import json
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 
+from packet_predator.benchmarks import unthrottled_replay
+from packet_predator.recording_file import open_recording, write_recording
 from packet_predator.replay import RecordingCatalog, RecordingError
+from packet_predator.replay_clock import ReplayClock
 from packet_predator.service import WorkbenchService
 from packet_predator.transport import CarrierFrame, DeterministicReplayTransport, TransportError
 from packet_predator.wire_adapter import WireAdapter
@@ -68,6 +72,65 @@ class DeterministicTransportTests(unittest.TestCase):
         self.clock.advance(0.1)
         self.assertEqual([item.sequence for item in self.carrier.poll()], [1])
 
+    def test_late_poll_reports_replay_lag(self):
+        self.carrier.play()
+        self.clock.advance(0.45)
+        self.assertEqual([item.sequence for item in self.carrier.poll()], [1])
+        self.assertEqual(self.carrier.status()["lag_ms"], 50.0)
+        self.clock.advance(0.55)
+        self.carrier.poll()
+        self.assertEqual(self.carrier.status()["lag_ms"], 0.0)
+        self.assertEqual(self.carrier.status()["max_lag_ms"], 50.0)
+
+    def test_next_due_follows_position_and_speed(self):
+        self.assertIsNone(self.carrier.next_due_s())
+        released = self.carrier.play()
+        self.assertEqual(released[0].release_lag_ms, 0.0)
+        self.assertAlmostEqual(self.carrier.next_due_s(), 0.4)
+        self.carrier.set_speed(2.0)
+        self.clock.advance(0.1)
+        self.assertAlmostEqual(self.carrier.next_due_s(), 0.1)
+        self.clock.advance(0.15)
+        (item,) = self.carrier.poll()
+        self.assertEqual(item.release_lag_ms, 50.0)
+        self.carrier.pause()
+        self.assertIsNone(self.carrier.next_due_s())
+        self.assertEqual(self.carrier.release_lag.summary()["count"], 2)
+
+    def test_seek_moves_the_cursor_without_releasing(self):
+        self.assertEqual(self.carrier.seek(400), [])
+        status = self.carrier.status()
+        self.assertEqual((status["cursor"], status["position_ms"], status["state"]), (1, 400, "paused"))
+        self.assertEqual([item.sequence for item in self.carrier.step()], [1])
+        self.assertEqual([item.sequence for item in self.carrier.seek(0, include_skipped=True)], [])
+        self.assertEqual([item.sequence for item in self.carrier.seek(1000, include_skipped=True)], [0, 1])
+        self.carrier.seek(0)
+        self.assertEqual(
+            [item.sequence for item in self.carrier.seek(1000, include_skipped=True, skipped_limit=1)],
+            [1],
+        )
+        self.assertEqual(self.carrier.status()["cursor"], 2)
+        self.assertEqual(self.carrier.status()["state"], "paused")
+        with self.assertRaises(TransportError) as raised:
+            self.carrier.seek(1001)
+        self.assertEqual(raised.exception.code, "REPLAY_POSITION")
+
+    def test_seek_while_playing_reanchors_the_clock(self):
+        self.carrier.play()
+        self.clock.advance(0.1)
+        self.carrier.seek(900)
+        self.assertEqual(self.carrier.status()["state"], "playing")
+        self.clock.advance(0.099)
+        self.assertEqual(self.carrier.poll(), [])
+        self.clock.advance(0.001)
+        self.assertEqual([item.sequence for item in self.carrier.poll()], [2])
+
+    def test_release_all_ignores_the_schedule(self):
+        self.carrier.step()
+        self.assertEqual([item.sequence for item in self.carrier.release_all()], [1, 2])
+        self.assertEqual(self.carrier.status()["state"], "complete")
+        self.assertEqual(self.carrier.release_all(), [])
+
     def test_step_reset_and_completion_are_explicit(self):
         self.assertEqual([item.sequence for item in self.carrier.step()], [0])
         self.assertEqual([item.sequence for item in self.carrier.step()], [1])
@@ -85,6 +148,72 @@ class DeterministicTransportTests(unittest.TestCase):
         self.assertIn("no actors", status["description"])
 
 
+class ReplayClockTests(unittest.TestCase):
+    def setUp(self):
+        self.carrier = DeterministicReplayTransport()
+        self.frames = tuple(carrier_frame(index, at_ms) for index, at_ms in enumerate((0, 20, 40)))
+        self.carrier.load("clock-test", "Clock test", 40, self.frames)
+        self.released = []
+        self.finished = threading.Event()
+
+        def release():
+            self.released.extend(self.carrier.poll())
+            if self.carrier.status()["state"] == "complete":
+                self.finished.set()
+
+        self.clock = ReplayClock(self.carrier, release)
+        self.addCleanup(self.clock.close)
+
+    def test_clock_releases_each_frame_when_due_then_stops(self):
+        self.released.extend(self.carrier.play())
+        self.clock.kick()
+        self.assertTrue(self.finished.wait(2.0))
+        self.assertEqual([item.sequence for item in self.released], [0, 1, 2])
+        self.assertTrue(all(item.release_lag_ms is not None for item in self.released))
+        deadline = threading.Event()
+        while self.clock.running and not deadline.wait(0.005):
+            pass
+        self.assertFalse(self.clock.running)
+
+    def test_clock_does_not_run_unless_playing(self):
+        self.clock.kick()
+        self.assertFalse(self.clock.running)
+        self.carrier.play()
+        self.clock.kick()
+        self.assertTrue(self.clock.running)
+        self.carrier.pause()
+        self.clock.kick()
+        self.clock.close()
+        self.assertFalse(self.clock.running)
+        self.assertEqual(self.released, [])
+
+    def test_failing_release_pauses_and_reports_instead_of_spinning(self):
+        faults = []
+        reported = threading.Event()
+
+        def release():
+            raise ValueError("mmap closed or invalid")
+
+        def fault(error):
+            faults.append(error)
+            reported.set()
+
+        clock = ReplayClock(self.carrier, release, fault)
+        self.addCleanup(clock.close)
+        self.carrier.play()
+        with self.assertLogs("packet_predator.replay_clock", "ERROR"):
+            clock.kick()
+            self.assertTrue(reported.wait(2.0))
+        status = self.carrier.status()
+        self.assertEqual(status["state"], "paused")
+        self.assertEqual(status["last_error"], {"code": "REPLAY_RELEASE_FAILED", "message": "mmap closed or invalid"})
+        self.assertEqual(faults, [status["last_error"]])
+        deadline = threading.Event()
+        while clock.running and not deadline.wait(0.005):
+            pass
+        self.assertFalse(clock.running)
+
+
 class RecordingValidationTests(unittest.TestCase):
     def resolver(self, fixture_id, mode, source, destination):
         return {
@@ -137,8 +266,9 @@ class RecordingValidationTests(unittest.TestCase):
             data = self.valid_data()
             data["entries"][0]["condition"] = "invent a reply"
             self.write(root, data)
+            catalog = RecordingCatalog(root, "1.0.2", self.resolver)
             with self.assertRaisesRegex(RecordingError, "must contain exactly"):
-                RecordingCatalog(root, "1.0.2", self.resolver)
+                catalog.get("small-recording")
 
     def test_out_of_order_timing_is_rejected(self):
         with tempfile.TemporaryDirectory() as directory:
@@ -147,8 +277,9 @@ class RecordingValidationTests(unittest.TestCase):
             data["entries"].insert(0, {**data["entries"][0], "at_ms": 90})
             data["entries"][1]["at_ms"] = 80
             self.write(root, data)
+            catalog = RecordingCatalog(root, "1.0.2", self.resolver)
             with self.assertRaisesRegex(RecordingError, "nondecreasing order"):
-                RecordingCatalog(root, "1.0.2", self.resolver)
+                catalog.get("small-recording")
 
     def test_authority_version_mismatch_is_rejected(self):
         with tempfile.TemporaryDirectory() as directory:
@@ -165,6 +296,216 @@ class RecordingValidationTests(unittest.TestCase):
             {item["id"] for item in catalog.list()},
             {"node-onboarding", "retained-outcome-retry", "task-session-success"},
         )
+        for item in catalog.list():
+            self.assertEqual(len(catalog.get(item["id"]).frames), item["frame_count"])
+
+    def test_entries_resolve_on_first_get_only(self):
+        calls = []
+
+        def resolver(*args):
+            calls.append(args)
+            return self.resolver(*args)
+
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            self.write(root, self.valid_data())
+            catalog = RecordingCatalog(root, "1.0.2", resolver)
+            self.assertEqual(catalog.list()[0]["frame_count"], 1)
+            self.assertEqual(calls, [])
+            first = catalog.get("small-recording")
+            self.assertIs(catalog.get("small-recording"), first)
+            self.assertEqual(len(calls), 1)
+
+    def test_resolving_does_not_block_listing_and_runs_once(self):
+        calls = []
+        entered = threading.Event()
+        proceed = threading.Event()
+
+        def resolver(*args):
+            calls.append(args)
+            entered.set()
+            proceed.wait(2.0)
+            return self.resolver(*args)
+
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            self.write(root, self.valid_data())
+            catalog = RecordingCatalog(root, "1.0.2", resolver)
+            results = []
+            getters = [
+                threading.Thread(target=lambda: results.append(catalog.get("small-recording"))) for _ in range(2)
+            ]
+            for getter in getters:
+                getter.start()
+            self.assertTrue(entered.wait(2.0))
+            listed = []
+            lister = threading.Thread(target=lambda: listed.extend(catalog.list()))
+            lister.start()
+            lister.join(0.5)
+            self.assertEqual([item["id"] for item in listed], ["small-recording"])
+            proceed.set()
+            for getter in getters:
+                getter.join(2.0)
+            self.assertEqual(len(calls), 1)
+            self.assertIs(results[0], results[1])
+
+    def test_disk_cache_skips_resolving_unchanged_recordings(self):
+        calls = []
+
+        def resolver(*args):
+            calls.append(args)
+            return self.resolver(*args)
+
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory) / "recordings"
+            cache = Path(directory) / "cache"
+            root.mkdir()
+            path = self.write(root, self.valid_data())
+            resolved = RecordingCatalog(root, "1.0.2", resolver, cache).get("small-recording")
+            cached = RecordingCatalog(root, "1.0.2", resolver, cache).get("small-recording")
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(cached.frames, resolved.frames)
+            self.assertEqual(cached.schedule, resolved.schedule)
+
+            data = self.valid_data()
+            data["entries"][0]["note"] = "A changed note."
+            path.write_text(json.dumps(data), encoding="utf-8")
+            changed = RecordingCatalog(root, "1.0.2", resolver, cache).get("small-recording")
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(changed.frames[0].note, "A changed note.")
+
+            (cache / "small-recording.json").write_text("{damaged", encoding="utf-8")
+            RecordingCatalog(root, "1.0.2", resolver, cache).get("small-recording")
+            self.assertEqual(len(calls), 3)
+
+
+class BinaryRecordingTests(unittest.TestCase):
+    def metadata(self, identifier="long-capture"):
+        return {
+            "id": identifier,
+            "title": "Long capture",
+            "description": "A chunked binary capture.",
+            "authority_version": "1.0.2",
+            "frame_mode": "fixed",
+            "duration_ms": 100_000,
+        }
+
+    def write(self, root, count=10, chunk_frames=4):
+        path = root / "long-capture.pprec"
+        frames = (
+            (index * 10, "sent" if index % 3 == 0 else "received", bytes((index % 256,)) * 32)
+            for index in range(count)
+        )
+        write_recording(path, self.metadata(), frames, chunk_frames)
+        return path
+
+    def test_catalog_lists_binary_recordings_without_a_schedule(self):
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            self.write(root)
+            catalog = RecordingCatalog(root, "1.0.2", lambda *args: self.fail("binary frames need no resolving"))
+            self.assertEqual(catalog.list()[0]["frame_count"], 10)
+            item = catalog.get("long-capture")
+            self.assertEqual(item.summary()["schedule"], [])
+            self.assertEqual(item.frames[9].frame, bytes((9,)) * 32)
+            self.assertEqual(item.frames[-1].sequence, 9)
+            self.assertEqual(item.frames[3].direction, "sent")
+            self.assertEqual(list(item.offsets[2:5]), [20, 30, 40])
+
+    def test_mapped_frames_seek_through_the_transport(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write(Path(directory), count=1000, chunk_frames=64)
+            _, frames = open_recording(path)
+            carrier = DeterministicReplayTransport(ManualClock())
+            carrier.load("long-capture", "Long capture", 100_000, frames, frames.offsets)
+            carrier.seek(5005)
+            self.assertEqual([frame.sequence for frame in carrier.step()], [501])
+
+    def test_seek_reads_offsets_only_from_verified_chunks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write(Path(directory), count=16)
+            _, frames = open_recording(path)
+            data = bytearray(path.read_bytes())
+            data[frames.record_offset(9) : frames.record_offset(9) + 8] = bytes(8)  # at_ms 90 becomes 0
+            path.write_bytes(bytes(data))
+            _, frames = open_recording(path)
+            clock = ManualClock()
+            carrier = DeterministicReplayTransport(clock)
+            carrier.load("long-capture", "Long capture", 100_000, frames, frames.offsets)
+            carrier.seek(45)
+            self.assertEqual([frame.sequence for frame in carrier.step()], [5])
+            carrier.seek(75)
+            self.assertEqual(carrier.status()["cursor"], 8)
+            with self.assertRaisesRegex(RecordingError, "checksum"):
+                carrier.seek(85)
+            carrier.seek(65)
+            self.assertEqual(carrier.play(), [])
+            clock.advance(0.005)
+            self.assertEqual([frame.sequence for frame in carrier.poll()], [7])
+            self.assertEqual(carrier.next_due_s(), 0.0)
+            with self.assertRaisesRegex(RecordingError, "checksum"):
+                carrier.poll()
+
+    def test_catalog_closes_a_released_map_and_maps_it_again_on_get(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.write(Path(directory))
+            catalog = RecordingCatalog(Path(directory), "1.0.2", lambda *args: self.fail("nothing to resolve"))
+            item = catalog.get("long-capture")
+            self.assertIs(catalog.get("long-capture"), item)
+            catalog.release("long-capture")
+            with self.assertRaises(ValueError):
+                item.frames[0]
+            again = catalog.get("long-capture")
+            self.assertEqual(again.frames[0].sequence, 0)
+            catalog.close()
+            with self.assertRaises(ValueError):
+                again.frames[0]
+
+    def test_damaged_chunk_fails_when_read_not_when_listed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write(Path(directory))
+            data = bytearray(path.read_bytes())
+            data[-100] ^= 0xFF  # inside the final frame, ahead of three index entries and the trailer
+            path.write_bytes(bytes(data))
+            _, frames = open_recording(path)
+            self.assertEqual(frames[0].sequence, 0)
+            with self.assertRaisesRegex(RecordingError, "checksum"):
+                frames[9]
+
+    def test_playback_stops_on_a_damaged_chunk_after_releasing_earlier_frames(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write(Path(directory))
+            _, frames = open_recording(path)
+            data = bytearray(path.read_bytes())
+            data[frames.record_offset(5) + 20] ^= 0xFF
+            path.write_bytes(bytes(data))
+            _, frames = open_recording(path)
+            clock = ManualClock()
+            carrier = DeterministicReplayTransport(clock)
+            carrier.load("long-capture", "Long capture", 100_000, frames, frames.offsets)
+            carrier.play()
+            clock.advance(0.1)
+            self.assertEqual([frame.sequence for frame in carrier.poll()], [1, 2, 3])
+            with self.assertRaisesRegex(RecordingError, "checksum"):
+                carrier.poll()
+            self.assertEqual(carrier.status()["cursor"], 4)
+            carrier.halt({"code": "RECORDING_CHUNK", "message": "damaged"})
+            self.assertEqual(carrier.status()["state"], "paused")
+            self.assertIsNone(carrier.next_due_s())
+
+    def test_truncated_file_is_rejected(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write(Path(directory))
+            path.write_bytes(path.read_bytes()[:-8])
+            with self.assertRaisesRegex(RecordingError, "trailer"):
+                open_recording(path)
+
+    def test_writer_rejects_out_of_order_frames(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "long-capture.pprec"
+            with self.assertRaisesRegex(RecordingError, "nondecreasing"):
+                write_recording(path, self.metadata(), [(10, "received", b"\x01"), (5, "received", b"\x02")])
+            self.assertEqual(list(Path(directory).iterdir()), [])
 
 
 @unittest.skipUnless(
@@ -191,6 +532,109 @@ class ReleasedRecordingIntegrationTests(unittest.TestCase):
                 list(range(recording["frame_count"])),
             )
 
+    def test_playing_recording_is_published_without_polling(self):
+        service = WorkbenchService(WireAdapter(AUTHORITY_ROOT))
+        self.addCleanup(service.close)
+        service.select_replay("retained-outcome-retry")
+        service.control_replay("play", 4.0)
+        finished = threading.Event()
+        while service.journal()["count"] < 3 and not finished.wait(0.01):
+            pass
+        entries = list(reversed(service.journal()["entries"]))
+        self.assertEqual([entry["capture"]["sequence"] for entry in entries], [0, 1, 2])
+        self.assertTrue(all(entry["capture"]["release_lag_ms"] is not None for entry in entries))
+        self.assertEqual(service.replay_catalog()["carrier"]["state"], "complete")
+
+    def test_seek_can_publish_skipped_frames_as_one_revision(self):
+        service = WorkbenchService(WireAdapter(AUTHORITY_ROOT))
+        self.addCleanup(service.close)
+        service.select_replay("node-onboarding")
+        revision = service.model.revision
+        result = service.control_replay("seek", position_ms=1000, skipped="batch")
+        self.assertEqual([item["capture"]["sequence"] for item in result["delivered"]], [0, 1, 2])
+        self.assertEqual(service.model.revision, revision + 1)
+        self.assertEqual(result["carrier"]["cursor"], 3)
+        self.assertEqual(result["skipped"], {"count": 3, "published": 3})
+
+        result = service.control_replay("seek", position_ms=1500)
+        self.assertEqual(result["delivered"], [])
+        self.assertEqual(service.model.revision, revision + 1)
+        self.assertEqual([item["capture"]["sequence"] for item in service.control_replay("step")["delivered"]], [4])
+
+    def test_unthrottled_replay_counts_every_loop(self):
+        result = unthrottled_replay("retained-outcome-retry", 3, 1)
+        self.assertEqual(result["frames"], 9)
+        self.assertEqual(result["stages"]["inspect"]["count"], 9)
+        self.assertEqual(result["stages"]["publish"]["count"], 9)
+        self.assertGreater(result["frames_per_second"], 0)
+
+    def test_binary_recording_replays_and_journals_invalid_captures(self):
+        recording = WorkbenchService(WireAdapter(AUTHORITY_ROOT)).recordings.get("retained-outcome-retry")
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            frames = [(item.at_ms, item.direction, item.frame) for item in recording.frames]
+            frames.append((recording.duration_ms, "received", b"\xff"))
+            metadata = {
+                "id": "retry-capture",
+                "title": "Retry capture",
+                "description": "The retry recording plus one damaged frame.",
+                "authority_version": WireAdapter(AUTHORITY_ROOT).version,
+                "frame_mode": "fixed",
+                "duration_ms": recording.duration_ms,
+            }
+            write_recording(root / "retry-capture.pprec", metadata, frames)
+            service = WorkbenchService(WireAdapter(AUTHORITY_ROOT), recording_root=root)
+            self.addCleanup(service.close)
+            service.select_replay("retry-capture")
+            delivered = []
+            for _ in frames:
+                delivered.extend(service.control_replay("step")["delivered"])
+            self.assertEqual(len(delivered), len(frames))
+            self.assertEqual(delivered[0]["received_frame_hex"], frames[0][2].hex())
+            self.assertEqual(delivered[-1]["title"], "Invalid replay frame")
+
+    def test_replay_clock_pauses_and_publishes_a_damaged_chunk(self):
+        recording = WorkbenchService(WireAdapter(AUTHORITY_ROOT)).recordings.get("retained-outcome-retry")
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            path = root / "retry-capture.pprec"
+            metadata = {
+                "id": "retry-capture",
+                "title": "Retry capture",
+                "description": "The retry recording with its second chunk damaged.",
+                "authority_version": WireAdapter(AUTHORITY_ROOT).version,
+                "frame_mode": "fixed",
+                "duration_ms": recording.duration_ms,
+            }
+            write_recording(path, metadata, [(item.at_ms, item.direction, item.frame) for item in recording.frames], 1)
+            _, frames = open_recording(path)
+            data = bytearray(path.read_bytes())
+            data[frames.record_offset(1) + 20] ^= 0xFF
+            path.write_bytes(bytes(data))
+
+            service = WorkbenchService(WireAdapter(AUTHORITY_ROOT), recording_root=root)
+            self.addCleanup(service.close)
+            service.select_replay("retry-capture")
+            revision = service.model.revision
+            service.control_replay("play", 4.0)
+            finished = threading.Event()
+            while service.replay_catalog()["carrier"]["last_error"] is None and not finished.wait(0.01):
+                pass
+            carrier = service.replay_catalog()["carrier"]
+            self.assertEqual(carrier["state"], "paused")
+            self.assertEqual(carrier["cursor"], 1)
+            self.assertEqual(carrier["last_error"]["code"], "RECORDING_CHUNK")
+            self.assertEqual([entry["capture"]["sequence"] for entry in service.journal()["entries"]], [0])
+            fault = service.model.changes_since(revision)["changes"][-1]
+            self.assertEqual(fault["kind"], "replay")
+            self.assertEqual(fault["carrier"]["state"], "paused")
+            while service._replay_clock.running and not finished.wait(0.01):
+                pass
+
+            with self.assertRaisesRegex(RecordingError, "checksum"):
+                service.control_replay("step")
+            self.assertEqual(service.replay_catalog()["carrier"]["cursor"], 1)
+
     def test_retry_recording_repeats_identical_adapter_bytes(self):
         service = WorkbenchService(WireAdapter(AUTHORITY_ROOT))
         service.select_replay("retained-outcome-retry")
@@ -2,7 +2,7 @@ import unittest
 from pathlib import Path
 
 from packet_predator.service import WorkbenchService
-from packet_predator.wire_adapter import AuthorityError, InspectionError, WireAdapter
+from packet_predator.wire_adapter import AuthorityError, InspectionError, WireAdapter, _DecodeCache
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -133,6 +133,18 @@ class SupportedWorkbenchTests(unittest.TestCase):
         )
         self.assertEqual(result["fixed_frame_hex"], fixture["padded_frame_hex"])
 
+    def test_editor_metadata_is_compiled_once_and_read_only(self):
+        message = self.wire.editor_message("NODE_HELLO")["message"]
+        listed = next(
+            item
+            for item in self.wire.editor_messages()["messages"]
+            if item["name"] == "NODE_HELLO"
+        )
+
+        self.assertIs(message, listed)
+        with self.assertRaises(TypeError):
+            message["name"] = "CHANGED"
+
     def test_editor_rejects_missing_or_extra_payload_fields(self):
         with self.assertRaises(InspectionError) as raised:
             self.wire.compose(
@@ -179,11 +191,65 @@ class SupportedWorkbenchTests(unittest.TestCase):
         self.assertEqual(journal["count"], 1)
         self.assertEqual(journal["entries"][0]["origin"], "unit example")
 
+    def test_repeated_frames_share_one_read_only_cached_decode(self):
+        wire = WireAdapter(AUTHORITY_ROOT, decode_cache_size=1)
+        item = wire.list_examples()["examples"][0]
+        first = wire.inspect(item["padded_frame_hex"], "fixed")
+        with self.assertRaises(TypeError):
+            first["field_rows"][0]["value"] = "mutated"
+        second = wire.inspect(item["padded_frame_hex"].upper(), "fixed")
+
+        self.assertIs(second, first)
+        self.assertEqual(second["field_rows"][0]["value"], 0x01020304)
+        self.assertEqual(wire.status()["decode_cache"]["hits"], 1)
+        self.assertEqual(wire.status()["decode_cache"]["misses"], 1)
+
+        wire.inspect(item["frame_hex"], "logical")
+        self.assertEqual(wire.status()["decode_cache"]["evictions"], 1)
+        self.assertEqual(wire.status()["decode_cache"]["entries"], 1)
+
+    def test_captured_bytes_inspect_without_hex_text(self):
+        wire = WireAdapter(AUTHORITY_ROOT)
+        item = wire.list_examples()["examples"][0]
+        raw = bytes.fromhex(item["padded_frame_hex"])
+
+        from_bytes = wire.inspect_bytes(memoryview(raw), "fixed")
+        from_text = wire.inspect(item["padded_frame_hex"], "fixed")
+
+        self.assertEqual(from_bytes, from_text)
+        self.assertEqual(from_bytes["received_frame_hex"], item["padded_frame_hex"])
+        self.assertEqual(wire.status()["decode_cache"]["hits"], 1)
+        with self.assertRaises(InspectionError) as raised:
+            wire.inspect_bytes(item["padded_frame_hex"], "fixed")
+        self.assertEqual(raised.exception.code, "FRAME_TYPE")
+
     def test_missing_authority_fails_without_falling_back(self):
         with self.assertRaisesRegex(AuthorityError, "checkout is incomplete"):
             WireAdapter(REPO_ROOT / "does-not-exist")
 
 
+class DecodeCacheTests(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted_and_counted(self):
+        cache = _DecodeCache(2)
+        cache.put("one", 1)
+        cache.put("two", 2)
+        self.assertEqual(cache.get("one"), 1)
+        cache.put("three", 3)
+
+        self.assertIsNone(cache.get("two"))
+        self.assertEqual(cache.get("three"), 3)
+        self.assertEqual(
+            cache.stats(),
+            {"capacity": 2, "entries": 2, "hits": 2, "misses": 1, "evictions": 1},
+        )
+
+    def test_zero_capacity_disables_retention(self):
+        cache = _DecodeCache(0)
+        cache.put("one", 1)
+        self.assertIsNone(cache.get("one"))
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
 class BrowserAssetTests(unittest.TestCase):
     def test_browser_surface_contains_human_and_byte_views(self):
         html = (REPO_ROOT / "workbench_web/index.html").read_text(encoding="utf-8")
@@ -1,12 +1,19 @@
 import asyncio
 import json
+import threading
+import time
 import unittest
 from pathlib import Path
 
 from fastapi import Request
 
 from packet_predator import web
-from packet_predator.web import app
+from packet_predator.adapters.nrf905 import Nrf905Device
+from packet_predator.nrf905_transport import Nrf905Transport
+from packet_predator.service import WorkbenchService
+from packet_predator.web import TransmitRequest, app
+from packet_predator.wire_adapter import WireAdapter
+from tests.test_nrf905_adapter import FakeLines, FakeSpi, ManualClock, transmitting_profile
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -28,6 +35,7 @@ async def asgi_request(method: str, path: str, body: dict | None = None):
     async def send(event):
         events.append(event)
 
+    path, _, query = path.partition("?")
     headers = [(b"host", b"testserver")]
     if body is not None:
         headers.append((b"content-type", b"application/json"))
@@ -39,7 +47,7 @@ async def asgi_request(method: str, path: str, body: dict | None = None):
         "scheme": "http",
         "path": path,
         "raw_path": path.encode("ascii"),
-        "query_string": b"",
+        "query_string": query.encode("ascii"),
         "root_path": "",
         "headers": headers,
         "client": ("127.0.0.1", 12345),
@@ -68,8 +76,8 @@ class WebApiTests(unittest.TestCase):
         self.assertIn(b"Hardware-free inspection", body)
         self.assertIn(b'id="textSizePreference"', body)
         self.assertIn(b'id="fontPreference"', body)
-        self.assertIn(b"/assets/style.css?v=20260726-1", body)
-        self.assertIn(b"/assets/app.js?v=20260726-1", body)
+        self.assertIn(b"/assets/style.css?v=20261018-1", body)
+        self.assertIn(b"/assets/app.js?v=20261018-8", body)
         self.assertNotIn(b"localhost:8400", body)
         self.assertIn(b'id="resultSummary" hidden', body)
         self.assertLess(body.index(b'id="inputHeading"'), body.index(b'id="resultPanel"'))
@@ -81,8 +89,10 @@ class WebApiTests(unittest.TestCase):
         self.assertIn("elements.radioDevices.textContent", app_source)
         self.assertIn("escaped(row.name)", app_source)
         self.assertIn("new EventSource(", app_source)
+        self.assertIn('addEventListener("model", applyModelEvent)', app_source)
         self.assertNotIn("/api/carrier/poll", app_source)
         self.assertNotIn("setInterval(pollRadio, 50)", app_source)
+        self.assertNotIn("startReplayPolling", app_source)
 
     def test_status_is_explicitly_inspect_only(self):
         status, _, body = asyncio.run(asgi_request("GET", "/api/status"))
@@ -94,6 +104,17 @@ class WebApiTests(unittest.TestCase):
         self.assertEqual(result["workbench_interface_version"], 1)
         self.assertTrue(result["process_instance_id"].startswith("pp-"))
 
+    def test_metrics_are_exposed_as_prometheus_text(self):
+        status, headers, body = asyncio.run(asgi_request("GET", "/metrics"))
+        text = body.decode("utf-8")
+
+        self.assertEqual(status, 200)
+        self.assertTrue(headers[b"content-type"].startswith(b"text/plain; version=0.0.4"))
+        self.assertIn('packet_predator_receiver_state{state="stopped"} 1\n', text)
+        self.assertIn("# TYPE packet_predator_decode_cache_misses_total counter\n", text)
+        self.assertIn("packet_predator_replay_cursor 0\n", text)
+        self.assertNotIn("packet_predator_spi_exchange_seconds", text)
+
     def test_editor_metadata_and_compose_routes(self):
         status, _, body = asyncio.run(
             asgi_request("GET", "/api/v1/editor/messages/NODE_HELLO")
@@ -182,6 +203,61 @@ class WebApiTests(unittest.TestCase):
         self.assertEqual(result["meaning"]["name"], "NODE_HELLO")
         self.assertEqual(result["title"], "Node hello")
 
+    def test_batch_inspection_reports_each_frame_under_one_revision(self):
+        first, second = web._service().examples()["examples"][:2]
+        status, _, body = asyncio.run(
+            asgi_request(
+                "POST",
+                "/api/v1/inspect/batch",
+                {
+                    "frames": [first["frame_hex"], "400100", second["frame_hex"]],
+                    "mode": "auto",
+                    "origin": "batch API test",
+                },
+            )
+        )
+        result = json.loads(body)
+        self.assertEqual(status, 200)
+        self.assertEqual(result["accepted_count"], 2)
+        self.assertEqual(result["rejected_count"], 1)
+        self.assertEqual([item["index"] for item in result["results"]], [0, 1, 2])
+        self.assertEqual(result["results"][0]["inspection"]["meaning"]["name"], "NODE_HELLO")
+        self.assertEqual(result["results"][1]["error"]["code"], "FRAME_TOO_SHORT")
+
+        state = web._service().model_state()
+        self.assertEqual(state["revision"], 1)
+        self.assertEqual(state["journal"]["count"], 2)
+        self.assertEqual(state["latest"]["origin"], "batch API test")
+
+    def test_journal_pages_are_filtered_on_the_server(self):
+        first, second = web._service().examples()["examples"][:2]
+        web._service().inspect_many(
+            [first["frame_hex"], second["frame_hex"], first["frame_hex"]],
+            "auto",
+        )
+        message_type = web._service().model.inspection_at(0)["envelope"]["message_type"]
+
+        status, _, body = asyncio.run(
+            asgi_request("GET", f"/api/v1/journal?message_type={message_type}&limit=1")
+        )
+        page = json.loads(body)
+        self.assertEqual(status, 200)
+        self.assertEqual([item["journal_sequence"] for item in page["entries"]], [2])
+        self.assertTrue(page["has_more"])
+
+        status, _, body = asyncio.run(
+            asgi_request(
+                "GET",
+                f"/api/v1/journal?message_type={message_type}&before={page['next_before']}",
+            )
+        )
+        page = json.loads(body)
+        self.assertEqual([item["journal_sequence"] for item in page["entries"]], [0])
+        self.assertFalse(page["has_more"])
+
+        status, _, _ = asyncio.run(asgi_request("GET", "/api/v1/journal?limit=0"))
+        self.assertEqual(status, 422)
+
     def test_malformed_frame_is_a_visible_client_error(self):
         status, _, body = asyncio.run(
             asgi_request(
@@ -238,6 +314,24 @@ class WebApiTests(unittest.TestCase):
         self.assertFalse(result["carrier"]["can_transmit"])
         self.assertEqual([item["capture"]["sequence"] for item in result["delivered"]], [0])
 
+    def test_recording_seek_jumps_without_publishing_skipped_frames(self):
+        asyncio.run(
+            asgi_request("POST", "/api/replays/select", {"recording_id": "node-onboarding"})
+        )
+        status, _, body = asyncio.run(
+            asgi_request("POST", "/api/replays/control", {"action": "seek", "position_ms": 700})
+        )
+        result = json.loads(body)
+        self.assertEqual(status, 200)
+        self.assertEqual((result["carrier"]["cursor"], result["carrier"]["position_ms"]), (2, 700))
+        self.assertEqual(result["delivered"], [])
+
+        status, _, body = asyncio.run(
+            asgi_request("POST", "/api/replays/control", {"action": "seek", "position_ms": 99999})
+        )
+        self.assertEqual(status, 422)
+        self.assertEqual(json.loads(body)["error"]["code"], "REPLAY_POSITION")
+
     def test_physical_routes_fail_clearly_in_default_inspect_only_mode(self):
         status, _, body = asyncio.run(asgi_request("POST", "/api/carrier/poll"))
         self.assertEqual(status, 404)
@@ -252,6 +346,10 @@ class WebApiTests(unittest.TestCase):
         self.assertEqual(status, 422)
         self.assertEqual(json.loads(body)["error"]["code"], "TRANSMIT_CONFIRMATION_REQUIRED")
 
+        status, _, body = asyncio.run(asgi_request("POST", "/api/carrier/fire"))
+        self.assertEqual(status, 422)
+        self.assertEqual(json.loads(body)["error"]["code"], "PHYSICAL_ADAPTER_UNAVAILABLE")
+
     def test_workbench_model_snapshot_is_the_presentation_authority(self):
         example = web._service().examples()["examples"][0]
         asyncio.run(
@@ -302,7 +400,7 @@ class WebApiTests(unittest.TestCase):
             retry = await anext(iterator)
             event = await anext(iterator)
             await iterator.aclose()
-            return retry, event
+            return retry, event.decode("utf-8")
 
         retry, event = asyncio.run(exercise_stream())
         self.assertEqual(retry, "retry: 1000\n\n")
@@ -332,7 +430,7 @@ class WebApiTests(unittest.TestCase):
             await anext(iterator)
             event = await anext(iterator)
             await iterator.aclose()
-            return event
+            return event.decode("utf-8")
 
         event = asyncio.run(exercise_stream())
         self.assertIn("id: 0\nevent: resync\n", event)
@@ -365,13 +463,52 @@ class WebApiTests(unittest.TestCase):
             service.inspect(example["frame_hex"], "logical", "live stream wake test")
             event = await asyncio.wait_for(pending, 1.0)
             await iterator.aclose()
-            return event
+            return event.decode("utf-8")
 
         event = asyncio.run(exercise_stream())
         self.assertIn("event: model", event)
         self.assertIn('"kind":"observation"', event)
         self.assertEqual(len(service.model._subscribers), 0)
 
+    def test_model_event_stream_coalesces_a_burst_after_the_first_event(self):
+        service = web._service()
+        example = service.examples()["examples"][0]
+
+        async def exercise_stream():
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            request = Request(
+                {
+                    "type": "http",
+                    "method": "GET",
+                    "path": "/api/workbench/events",
+                    "headers": [],
+                    "query_string": b"after=0&coalesce_ms=100",
+                },
+                receive,
+            )
+            response = await web.workbench_events(request, after=0, coalesce_ms=100)
+            iterator = response.body_iterator
+            await anext(iterator)
+            pending = asyncio.create_task(anext(iterator))
+            await asyncio.sleep(0)
+            started = time.monotonic()
+            service.inspect(example["frame_hex"], "logical", "burst one")
+            first = await asyncio.wait_for(pending, 1.0)
+            leading = time.monotonic() - started
+            service.inspect(example["frame_hex"], "logical", "burst two")
+            service.inspect(example["frame_hex"], "logical", "burst three")
+            batch = await asyncio.wait_for(anext(iterator), 1.0)
+            await iterator.aclose()
+            return first.decode("utf-8"), leading, batch.decode("utf-8")
+
+        first, leading, batch = asyncio.run(exercise_stream())
+        self.assertIn("id: 1\nevent: model\n", first)
+        self.assertLess(leading, 0.05)
+        self.assertIn("id: 3\nevent: batch\n", batch)
+        self.assertIn('"first_revision":2,"revision":3', batch)
+
     def test_application_lifespan_owns_and_releases_the_service(self):
         original = web._service()
 
@@ -385,5 +522,96 @@ class WebApiTests(unittest.TestCase):
         self.assertIsNot(web._service(), original)
 
 
+@unittest.skipUnless(
+    (AUTHORITY_ROOT / "registry/v1.json").is_file(),
+    "sibling Protocol Contract checkout is required for API integration tests",
+)
+class WebExecutorLatencyTests(unittest.TestCase):
+    def setUp(self):
+        self.directory, profile = transmitting_profile()
+        clock = ManualClock()
+        spi = FakeSpi()
+        lines = FakeLines()
+        spi.lines = lines
+        device = Nrf905Device(profile, spi, lines, sleeper=clock.sleep, monotonic=clock)
+        self.wire = WireAdapter(AUTHORITY_ROOT)
+        self.service = WorkbenchService(
+            self.wire, carrier=Nrf905Transport(profile, device, clock)
+        )
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+        def slow_transmit(frame):
+            self.entered.set()
+            self.release.wait(2.0)
+            return {
+                "elapsed_ms": 50.0,
+                "completion_us": 50000.0,
+                "completion_source": "polling",
+                "completed_ns": time.monotonic_ns(),
+                "frame_hex": frame.hex(),
+            }
+
+        device.transmit = slow_transmit
+        self.original_service = web._service
+        web._service = lambda: self.service
+
+    def tearDown(self):
+        self.release.set()
+        web._service = self.original_service
+        self.service.close()
+        self.directory.cleanup()
+
+    def test_in_flight_transmit_does_not_delay_model_events(self):
+        outbound = self.wire.resolve_example("v1-controller-beacon", "logical")
+        observed = self.wire.resolve_example("v1-node-status", "logical")
+
+        async def exercise():
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            request = Request(
+                {
+                    "type": "http",
+                    "method": "GET",
+                    "path": "/api/workbench/events",
+                    "headers": [],
+                    "query_string": b"after=0",
+                },
+                receive,
+            )
+            response = await web.workbench_events(request, after=0)
+            iterator = response.body_iterator
+            await anext(iterator)
+
+            transmit = asyncio.create_task(
+                web.transmit(
+                    TransmitRequest(
+                        frame_hex=outbound["frame_hex"], mode="logical", confirmed=True
+                    )
+                )
+            )
+            self.assertTrue(await asyncio.to_thread(self.entered.wait, 1.0))
+            pending = asyncio.create_task(anext(iterator))
+            await asyncio.sleep(0)
+            started = time.monotonic()
+            await asyncio.to_thread(
+                self.service.inspect, observed["frame_hex"], "logical", "latency test"
+            )
+            event = await asyncio.wait_for(pending, 0.5)
+            latency = time.monotonic() - started
+            self.assertFalse(transmit.done())
+
+            self.release.set()
+            result = await asyncio.wait_for(transmit, 1.0)
+            await iterator.aclose()
+            return event.decode("utf-8"), latency, result
+
+        event, latency, result = asyncio.run(exercise())
+        self.assertIn('"kind":"observation"', event)
+        self.assertLess(latency, 0.5)
+        self.assertEqual(result["outcome"], "sent")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
+import json
 import threading
 import time
 import unittest
 
+from packet_predator.capture_store import CaptureStore
 from packet_predator.model import WorkbenchModel
 
 
@@ -19,7 +21,10 @@ def observation(identifier, direction=None, invalid=False):
         "title": f"Observation {identifier}",
         "summary": "Deterministic model test",
         "received_frame_hex": "00" * 32,
-        "family": {"id": "test", "label": "Test"},
+        # The families WireAdapter.inspect_bytes and WorkbenchService._inspect_captured return.
+        "family": (
+            {"key": "invalid", "label": "Invalid frame"} if invalid else {"key": "player", "label": "Player activity"}
+        ),
         "capture": capture,
         "inspection_error": (
             {"code": "TEST_INVALID", "message": "Invalid test frame"} if invalid else None
@@ -28,12 +33,18 @@ def observation(identifier, direction=None, invalid=False):
 
 
 class WorkbenchModelTests(unittest.TestCase):
-    def test_publish_orders_entries_and_returns_immutable_copies(self):
+    def test_publish_orders_entries_and_returns_read_only_observations(self):
         model = WorkbenchModel(retention=2)
         source = observation("one", "received")
         stored = model.publish(source)
         source["title"] = "mutated source"
-        stored["title"] = "mutated return"
+        source["family"]["label"] = "mutated nested source"
+        with self.assertRaises(TypeError):
+            stored["title"] = "mutated return"
+        with self.assertRaises(TypeError):
+            stored["family"]["label"] = "mutated nested return"
+        self.assertEqual(stored["title"], "Observation one")
+        self.assertEqual(stored["family"]["label"], "Player activity")
         model.publish(observation("two", "sent"))
         model.publish(observation("three", "received"))
 
@@ -75,6 +86,232 @@ class WorkbenchModelTests(unittest.TestCase):
         self.assertFalse(result["resync"])
         self.assertEqual(result["changes"][0]["observation_id"], "wake")
 
+    def test_batch_publish_retains_order_under_one_revision(self):
+        model = WorkbenchModel()
+        stored = model.publish_many([observation("one"), observation("two")])
+
+        self.assertEqual([item["journal_sequence"] for item in stored], [0, 1])
+        self.assertEqual([item["id"] for item in model.journal()["entries"]], ["two", "one"])
+        changes = model.changes_since(0)
+        self.assertEqual(changes["revision"], 1)
+        self.assertEqual(changes["changes"][0]["kind"], "observations")
+        self.assertEqual(changes["changes"][0]["observation_ids"], ("one", "two"))
+        self.assertEqual(model.publish_many([]), [])
+        self.assertEqual(model.snapshot()["revision"], 1)
+
+    def test_changes_carry_summaries_and_receiver_deltas_encoded_once(self):
+        model = WorkbenchModel()
+        model.publish(observation("pasted"))
+        model.publish(observation("heard", "received"))
+        model.set_receiver_state("listening")
+        model.publish_many([observation("a"), observation("b")])
+
+        changes = model.changes_since(0)["changes"]
+        self.assertEqual(changes[0]["summary"]["id"], "pasted")
+        self.assertIs(changes[0]["summary"], model.journal()["entries"][-1])
+        self.assertNotIn("latest", changes[0])
+        self.assertNotIn("receiver", changes[0])
+        self.assertEqual(changes[1]["receiver"]["received_count"], 1)
+        self.assertEqual(changes[2]["receiver"]["state"], "listening")
+        self.assertEqual([item["id"] for item in changes[3]["summaries"]], ["a", "b"])
+        self.assertNotIn("latest", changes[3])
+        self.assertIsNone(model._version.changes[-1][1]._text)
+
+        encoded = model.encoded_changes_since(2)
+        self.assertFalse(encoded["resync"])
+        self.assertEqual([revision for revision, _ in encoded["changes"]], [3, 4])
+        payload = json.loads(encoded["changes"][1][1])
+        self.assertEqual(payload["kind"], "observations")
+        self.assertEqual(payload["summaries"][1]["title"], "Observation b")
+        self.assertIs(model.encoded_changes_since(2)["changes"][0][1], encoded["changes"][0][1])
+
+    def test_readers_share_published_observations_without_copying(self):
+        model = WorkbenchModel()
+        stored = model.publish(observation("shared", "received"))
+
+        first = model.snapshot()
+        second = model.snapshot()
+        self.assertIs(first["latest"], stored)
+        self.assertIs(model.inspection("shared"), stored)
+        self.assertIs(first["journal"]["entries"], second["journal"]["entries"])
+        self.assertIs(first["receiver"], second["receiver"])
+
+        model.publish(observation("next", "received"))
+        third = model.snapshot()
+        self.assertIsNot(third["journal"]["entries"], first["journal"]["entries"])
+        self.assertIs(third["journal"]["entries"][1], first["journal"]["entries"][0])
+        self.assertEqual(third["receiver"]["received_count"], 2)
+        self.assertEqual(first["receiver"]["received_count"], 1)
+
+    def test_readers_use_the_published_version_while_a_writer_holds_the_lock(self):
+        model = WorkbenchModel(change_retention=3)
+        for index in range(8):
+            model.publish(observation(f"frame-{index}"))
+        result = {}
+
+        def read():
+            result["snapshot"] = model.snapshot()
+            result["changes"] = model.encoded_changes_since(6)
+
+        with model._condition:
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(1.0)
+            self.assertFalse(reader.is_alive())
+
+        self.assertEqual(result["snapshot"]["revision"], 8)
+        self.assertEqual(result["snapshot"]["latest"]["id"], "frame-7")
+        self.assertEqual([revision for revision, _ in result["changes"]["changes"]], [7, 8])
+        self.assertEqual([change["revision"] for change in model.changes_since(5)["changes"]], [6, 7, 8])
+        self.assertTrue(model.changes_since(4)["resync"])
+
+    def test_publishing_shares_the_retained_journal_with_the_previous_version(self):
+        model = WorkbenchModel(retention=3)
+        model.publish(observation("first", "received", invalid=True))
+        previous = model._version
+        model.publish(observation("second", "sent"))
+        current = model._version
+
+        self.assertIs(current.observations, previous.observations)
+        self.assertEqual(current.observations_end, previous.observations_end + 1)
+        self.assertEqual([item["id"] for item in previous.journal], ["first"])
+        self.assertEqual([item["id"] for item in current.journal], ["second", "first"])
+        self.assertIs(current.counters, previous.counters)
+        for index in range(10):
+            model.publish(observation(f"later-{index}"))
+        self.assertEqual([item["id"] for item in previous.journal], ["first"])
+        self.assertEqual(len(model._version.observations), model._version.observations_end)
+        self.assertLessEqual(model._version.observations_end, 6)
+        self.assertEqual(
+            [item["id"] for item in model.journal()["entries"]],
+            ["later-9", "later-8", "later-7"],
+        )
+
+    def test_paging_inspection_and_counters_do_not_wait_for_the_lock(self):
+        model = WorkbenchModel(retention=2, capture_store=CaptureStore(8 * CaptureStore.record_bytes()))
+        for index in range(5):
+            model.publish(observation(f"{index:012x}", "received", invalid=index == 1))
+        model.set_receiver_state("running")
+        result = {}
+
+        def read():
+            result["page"] = model.journal_page(filters={"direction": "received"})
+            result["recent"] = model.inspection("000000000004")
+            result["compact"] = model.inspection("000000000001")
+            result["at"] = model.inspection_at(0)
+            result["counters"] = model.counters()
+
+        with model._condition:
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(1.0)
+            self.assertFalse(reader.is_alive())
+
+        self.assertEqual([item["journal_sequence"] for item in result["page"]["entries"]], [4, 3, 2, 1, 0])
+        self.assertEqual(result["recent"]["journal_sequence"], 4)
+        self.assertEqual(result["compact"]["inspection_error"]["code"], "TEST_INVALID")
+        self.assertEqual(result["at"]["id"], "000000000000")
+        self.assertEqual(
+            result["counters"],
+            {"receiver_transitions": {"running": 1}, "inspection_errors": {"TEST_INVALID": 1}},
+        )
+
+    def test_lock_free_readers_stay_consistent_during_publishing(self):
+        model = WorkbenchModel(retention=4, capture_store=CaptureStore(16 * CaptureStore.record_bytes()))
+        done = threading.Event()
+
+        def write():
+            for index in range(3000):
+                model.publish(observation(f"{index:012x}", "received"))
+            done.set()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        checked = 0
+        while not done.is_set() or not checked:
+            for item in model.journal_page(limit=20)["entries"]:
+                self.assertEqual(item["id"], f"{item['journal_sequence']:012x}")
+                found = model.inspection(item["id"])
+                if found is not None:
+                    self.assertEqual(found["journal_sequence"], item["journal_sequence"])
+                checked += 1
+        writer.join()
+        self.assertGreater(checked, 0)
+
+    def test_lookup_index_follows_retention_eviction(self):
+        model = WorkbenchModel(retention=3)
+        for index in range(5):
+            model.publish(observation(f"item-{index}"))
+
+        self.assertIsNone(model.inspection("item-1"))
+        self.assertIsNone(model.inspection_at(1))
+        self.assertEqual(model.inspection("item-2")["journal_sequence"], 2)
+        self.assertEqual(model.inspection_at(4)["id"], "item-4")
+        self.assertEqual(len(model._by_id), 3)
+        self.assertEqual(model._version.retained, 3)
+
+    def test_journal_pages_follow_cursors_and_filters(self):
+        model = WorkbenchModel(retention=4)
+        model.publish(observation("drop", "received"))
+        for index in range(5):
+            model.publish(observation(f"rx-{index}", "received", invalid=index == 3))
+            model.publish(observation(f"tx-{index}", "sent"))
+
+        newest = model.journal_page(limit=2, filters={"direction": "received"})
+        self.assertEqual([item["id"] for item in newest["entries"]], ["rx-4", "rx-3"])
+        self.assertFalse(newest["has_more"])
+        self.assertEqual(newest["oldest_sequence"], 7)
+
+        older = model.journal_page(before=10, limit=2)
+        self.assertEqual([item["journal_sequence"] for item in older["entries"]], [9, 8])
+        self.assertTrue(older["has_more"])
+        self.assertEqual(older["next_before"], 8)
+
+        forward = model.journal_page(after=7, limit=1)
+        self.assertEqual([item["journal_sequence"] for item in forward["entries"]], [8])
+        self.assertTrue(forward["has_more"])
+
+        invalid = model.journal_page(filters={"invalid": True, "transport": "nrf905"})
+        self.assertEqual([item["id"] for item in invalid["entries"]], ["rx-3"])
+        self.assertEqual(model.journal_page(filters={"family": "missing"})["count"], 0)
+        self.assertEqual(
+            [item["id"] for item in model.journal_page(filters={"family": "player"})["entries"]],
+            ["tx-4", "rx-4", "tx-3"],
+        )
+        self.assertEqual(model.journal_page(filters={"family": "invalid"})["entries"][0]["id"], "rx-3")
+        self.assertEqual(
+            set(model._indexes),
+            {
+                ("family", "player"),
+                ("family", "invalid"),
+                ("invalid", True),
+            },
+        )
+        with self.assertRaises(ValueError):
+            model.journal_page(filters={"colour": "red"})
+
+    def test_slow_subscriber_never_blocks_the_publisher(self):
+        model = WorkbenchModel()
+        release = threading.Event()
+        seen = []
+
+        def slow(revision):
+            seen.append(revision)
+            release.wait(1.0)
+
+        unsubscribe = model.subscribe(slow)
+        started = time.monotonic()
+        for index in range(3):
+            model.publish(observation(f"burst-{index}"))
+        self.assertLess(time.monotonic() - started, 0.5)
+        release.set()
+        deadline = time.monotonic() + 1.0
+        while (not seen or seen[-1] != 3) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        unsubscribe()
+        self.assertEqual(seen[-1], 3)
+        self.assertEqual(len(model._subscribers), 0)
+
     def test_old_revision_requires_resynchronization(self):
         model = WorkbenchModel(change_retention=2)
         model.publish(observation("one"))
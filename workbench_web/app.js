@@ -3,13 +3,17 @@ const state = {
   recordings: [],
   selectedId: null,
   current: null,
-  replayTimer: null,
+  replay: null,
   replayBusy: false,
   physical: null,
   modelRevision: 0,
+  model: null,
+  modelRenderPending: false,
   modelStream: null,
   modelRefreshBusy: false,
   modelRefreshPending: false,
+  latestId: null,
+  latestBusy: false,
   viewConnected: false,
   editorDefinitions: new Map(),
   draft: null,
@@ -27,7 +31,7 @@ const elements = Object.fromEntries([
   "wireGeneration", "bodyLength", "headerMessageType", "headerRoute", "journalCard", "journalList",
   "recordingSelect", "recordingDescription", "replayBody", "replayStateLabel", "replayPosition",
   "replayReset", "replayStep", "replayPlay", "replayPause", "replaySpeed", "replayProgress",
-  "replayFrameCount", "replaySchedule",
+  "replayScrub", "replayFrameCount", "replaySchedule",
   "captureContext", "captureDirection", "captureIdentity", "captureNote",
   "modeEyebrow", "modeHeading", "modeDescription", "truthCard", "truthTitle", "truthDetail",
   "radioCard", "radioProfile", "radioDevices", "radioFrequency", "radioChannel", "radioAddress",
@@ -695,7 +699,6 @@ async function inspectFrame() {
       }),
     });
     renderResult(item);
-    scheduleModelRefresh();
   } catch (detail) {
     showError(detail);
   } finally {
@@ -787,9 +790,11 @@ function renderReplayState(result) {
   elements.replayStep.disabled = carrier.state === "playing" || carrier.state === "complete";
   elements.replayReset.disabled = carrier.state === "ready" && carrier.cursor === 0;
   elements.replaySpeed.disabled = carrier.state === "complete";
+  elements.replayScrub.max = String(carrier.duration_ms);
+  if (document.activeElement !== elements.replayScrub) elements.replayScrub.value = String(carrier.position_ms);
   elements.carrierStatus.innerHTML = `<i></i> ${escaped(carrier.label)} · ${escaped(carrier.state)} · ${state.physical ? "RF bench also listening" : "no radio"}`;
 
-  elements.replaySchedule.innerHTML = recording.schedule.map((item) => {
+  elements.replaySchedule.innerHTML = (recording.schedule || []).map((item) => {
     const statusClass = item.sequence < carrier.cursor ? "delivered" : item.sequence === carrier.cursor ? "next" : "pending";
     const arrow = item.direction === "received" ? "↓" : "↑";
     const directionLabel = item.direction === "received" ? "Into workbench" : "Recorded outbound";
@@ -804,19 +809,34 @@ function renderReplayState(result) {
 
   if (result.delivered && result.delivered.length) {
     renderResult(result.delivered[result.delivered.length - 1], false);
-    scheduleModelRefresh();
     const current = elements.replaySchedule.querySelector(`[data-sequence="${result.delivered[result.delivered.length - 1].capture.sequence}"]`);
     if (current) current.scrollIntoView({ behavior: "smooth", block: "nearest" });
   }
-  if (carrier.state === "playing") startReplayPolling();
-  else stopReplayPolling();
+  state.replay = { recording, carrier };
+}
+
+function followReplay(capture) {
+  // The server's replay clock publishes frames; advance the panel from their model events.
+  const shown = state.replay;
+  if (!shown || shown.carrier.recording_id !== capture.recording_id || capture.sequence < shown.carrier.cursor) return;
+  const cursor = capture.sequence + 1;
+  const complete = cursor >= shown.carrier.frame_count;
+  renderReplayState({
+    recording: shown.recording,
+    carrier: {
+      ...shown.carrier,
+      cursor,
+      position_ms: complete ? shown.carrier.duration_ms : capture.scheduled_at_ms,
+      state: complete ? "complete" : shown.carrier.state,
+    },
+    delivered: [],
+  });
 }
 
 async function selectRecording() {
   const identifier = elements.recordingSelect.value;
   if (!identifier) return;
   clearError();
-  stopReplayPolling();
   try {
     const result = await api("/api/replays/select", {
       method: "POST",
@@ -829,12 +849,12 @@ async function selectRecording() {
   }
 }
 
-async function replayAction(action, includeSpeed = false) {
+async function replayAction(action, includeSpeed = false, fields = {}) {
   if (state.replayBusy) return;
   state.replayBusy = true;
   clearError();
   try {
-    const body = { action };
+    const body = { action, ...fields };
     if (includeSpeed) body.speed = Number(elements.replaySpeed.value);
     const result = await api("/api/replays/control", {
       method: "POST",
@@ -849,28 +869,6 @@ async function replayAction(action, includeSpeed = false) {
   }
 }
 
-async function pollReplay() {
-  if (state.replayBusy) return;
-  state.replayBusy = true;
-  try {
-    renderReplayState(await api("/api/replays/state"));
-  } catch (detail) {
-    stopReplayPolling();
-    showError(detail);
-  } finally {
-    state.replayBusy = false;
-  }
-}
-
-function startReplayPolling() {
-  if (!state.replayTimer) state.replayTimer = window.setInterval(pollReplay, 100);
-}
-
-function stopReplayPolling() {
-  if (state.replayTimer) window.clearInterval(state.replayTimer);
-  state.replayTimer = null;
-}
-
 function renderPhysicalStatus(carrier) {
   state.physical = carrier;
   const profile = carrier.profile;
@@ -898,13 +896,23 @@ function updateTransmitAvailability() {
 }
 
 function renderModelSnapshot(snapshot) {
+  if (state.model && snapshot.revision < state.modelRevision) return;
+  state.model = snapshot;
   state.modelRevision = snapshot.revision;
+  state.latestId = snapshot.latest ? snapshot.latest.id : null;
+  renderModelView();
+}
+
+function renderModelView() {
+  const snapshot = state.model;
+  if (!snapshot) return;
   renderJournal(snapshot.journal);
   if (snapshot.physical_adapter) {
     renderPhysicalStatus(snapshot.physical_adapter);
     const receiver = snapshot.receiver;
     const stateLabel = prettyRole(receiver.state);
-    elements.carrierStatus.innerHTML = `<i></i> ${escaped(snapshot.physical_adapter.label)} · ${escaped(stateLabel)}`;
+    const armedLabel = receiver.armed ? " · frame armed" : "";
+    elements.carrierStatus.innerHTML = `<i></i> ${escaped(snapshot.physical_adapter.label)} · ${escaped(stateLabel)}${armedLabel}`;
     if (receiver.last_error) {
       elements.radioActivity.textContent = `Receiver fault · ${receiver.last_error.code}`;
       showError(receiver.last_error);
@@ -917,9 +925,30 @@ function renderModelSnapshot(snapshot) {
       elements.radioActivity.textContent = `View reconnecting · radio ${receiver.state}`;
     }
   }
-  if (!state.draft && snapshot.latest && snapshot.latest.id !== (state.current && state.current.id)) {
+  if (!state.draft && snapshot.latest && snapshot.latest.id === state.latestId
+      && snapshot.latest.id !== (state.current && state.current.id)) {
     renderResult(snapshot.latest, false);
   }
+  if (!state.draft) showLatest();
+}
+
+async function showLatest() {
+  // Model events carry journal summaries only; fetch the newest full observation once it is shown.
+  const id = state.latestId;
+  if (state.latestBusy || !id || (state.model?.latest && state.model.latest.id === id)) return;
+  state.latestBusy = true;
+  try {
+    const item = await api(`/api/inspections/${encodeURIComponent(id)}`);
+    if (state.model && !state.draft) {
+      state.model.latest = item;
+      if (state.latestId === id) renderResult(item, false);
+    }
+  } catch (detail) {
+    // A frame that already left retention is skipped; a newer change names its successor.
+  } finally {
+    state.latestBusy = false;
+    if (state.latestId !== id) showLatest();
+  }
 }
 
 async function refreshModel() {
@@ -950,6 +979,54 @@ function scheduleModelRefresh() {
   });
 }
 
+function applyModelEvent(event) {
+  applyModelChange(JSON.parse(event.data));
+}
+
+function applyModelBatch(event) {
+  JSON.parse(event.data).changes.forEach(applyModelChange);
+}
+
+function applyModelChange(change) {
+  if (!state.model || change.revision <= state.modelRevision) return;
+  if (change.revision !== state.modelRevision + 1) {
+    scheduleModelRefresh();
+    return;
+  }
+  const summaries = change.summaries || (change.summary ? [change.summary] : []);
+  if (summaries.length) {
+    const journal = state.model.journal;
+    const entries = [...summaries].reverse().concat(journal.entries).slice(0, journal.capacity);
+    state.model.journal = { ...journal, entries, count: entries.length };
+  }
+  const newest = summaries[summaries.length - 1];
+  if (newest) state.latestId = newest.id;
+  if (newest?.capture?.transport === "deterministic-replay") followReplay(newest.capture);
+  if (change.receiver) state.model.receiver = change.receiver;
+  if (change.kind === "replay" && change.error) {
+    // The replay clock stopped on a frame it could not read; show why and the paused position.
+    showError(change.error);
+    if (state.replay) renderReplayState({ recording: state.replay.recording, carrier: change.carrier, delivered: [] });
+  }
+  state.model.revision = change.revision;
+  state.modelRevision = change.revision;
+  scheduleModelRender();
+}
+
+function resyncModel() {
+  state.model = null;
+  scheduleModelRefresh();
+}
+
+function scheduleModelRender() {
+  if (state.modelRenderPending) return;
+  state.modelRenderPending = true;
+  window.requestAnimationFrame(() => {
+    state.modelRenderPending = false;
+    renderModelView();
+  });
+}
+
 function connectModelStream() {
   if (!("EventSource" in window)) {
     showError({
@@ -959,13 +1036,14 @@ function connectModelStream() {
     return;
   }
   if (state.modelStream) state.modelStream.close();
-  state.modelStream = new EventSource(`/api/workbench/events?after=${state.modelRevision}`);
+  state.modelStream = new EventSource(`/api/workbench/events?after=${state.modelRevision}&coalesce_ms=50`);
   state.modelStream.onopen = () => {
     state.viewConnected = true;
-    scheduleModelRefresh();
+    scheduleModelRender();
   };
-  state.modelStream.addEventListener("model", scheduleModelRefresh);
-  state.modelStream.addEventListener("resync", scheduleModelRefresh);
+  state.modelStream.addEventListener("model", applyModelEvent);
+  state.modelStream.addEventListener("batch", applyModelBatch);
+  state.modelStream.addEventListener("resync", resyncModel);
   state.modelStream.onerror = () => {
     state.viewConnected = false;
     if (state.physical) {
@@ -1019,7 +1097,6 @@ async function transmitFrame() {
       : "Frame transmitted";
     if (result.delivered.length) renderResult(result.delivered[0], false, true);
     if (state.draft) state.draft.transmitRequestId = null;
-    scheduleModelRefresh();
   } catch (detail) {
     showError(detail);
   } finally {
@@ -1127,6 +1204,9 @@ elements.replayPause.addEventListener("click", () => replayAction("pause"));
 elements.replayStep.addEventListener("click", () => replayAction("step"));
 elements.replayReset.addEventListener("click", () => replayAction("reset"));
 elements.replaySpeed.addEventListener("change", () => replayAction("speed", true));
+elements.replayScrub.addEventListener("change", () => {
+  replayAction("seek", false, { position_ms: Number(elements.replayScrub.value) });
+});
 elements.frameInput.addEventListener("keydown", (event) => {
   if ((event.ctrlKey || event.metaKey) && event.key === "Enter") inspectFrame();
 });